@@ -3,15 +3,17 @@
 """
 Utilities for area
 """
+from functools import cached_property, lru_cache
 from numpy import ndarray
-import scipy.constants
 import numpy as np
 
 from UliEngineering.EngineerIO.Types import NormalizeResult
 from . import EngineerIO
+from .Conversion import ConversionTable
 from .Decorators import returns_unit
 from .UnitInfo import EngineerIOConfiguration, UnitAlias, UnitInfo
-from .Defaults import default_si_prefix_map
+from .Defaults import (default_si_prefix_map, INCH, FOOT, YARD, ASTRONOMICAL_UNIT,
+                       LIGHT_YEAR, PARSEC, BOHR_RADIUS, PLANCK_LENGTH)
 
 __all__ = ["normalize_area", "convert_area_to_square_meters", "EngineerAreaIO"]
 
@@ -29,9 +31,9 @@ def area_unit_infos():
         UnitAlias('nm²', aliases=['nm^2', 'square nanometer', 'square nanometers', 'square nm', 'sq nm', 'nm sq', 'nm squared', 'nanometer squared', 'nanometers squared']),
         
         # Imperial area units
-        UnitInfo('in²', scipy.constants.inch**2, ['in^2', 'square inch', 'square inches', 'sq in']),
-        UnitInfo('ft²', scipy.constants.foot**2, ['ft^2', 'square foot', 'square feet', 'sq ft']),
-        UnitInfo('yd²', scipy.constants.yard**2, ['yd^2', 'square yard', 'square yards', 'sq yd']),
+        UnitInfo('in²', INCH**2, ['in^2', 'square inch', 'square inches', 'sq in']),
+        UnitInfo('ft²', FOOT**2, ['ft^2', 'square foot', 'square feet', 'sq ft']),
+        UnitInfo('yd²', YARD**2, ['yd^2', 'square yard', 'square yards', 'sq yd']),
         
         # Agricultural units
         UnitInfo('acre', 4046.8564224, ['acres']),
@@ -43,13 +45,13 @@ def area_unit_infos():
         
         # Atomic and molecular cross-section units
         UnitInfo('Å²', 1e-20, ['angstrom squared', 'angstrom^2', 'A^2', 'A²']),
-        UnitInfo('bohr²', (scipy.constants.physical_constants['Bohr radius'][0])**2, 
+        UnitInfo('bohr²', BOHR_RADIUS**2, 
                 ['bohr squared', 'bohr^2', 'a0²', 'a0^2', 'atomic unit of area']),
         
         # Astronomical units
-        UnitInfo('AU²', (scipy.constants.au)**2, ['AU^2', 'astronomical unit squared']),
-        UnitInfo('pc²', (scipy.constants.parsec)**2, ['parsec squared', 'parsec^2']),
-        UnitInfo('ly²', (scipy.constants.c * scipy.constants.Julian_year)**2, 
+        UnitInfo('AU²', ASTRONOMICAL_UNIT**2, ['AU^2', 'astronomical unit squared']),
+        UnitInfo('pc²', PARSEC**2, ['parsec squared', 'parsec^2']),
+        UnitInfo('ly²', LIGHT_YEAR**2, 
                 ['light year squared', 'light-year squared', 'ly^2', 'lightyear²']),
         
         # Additional metric units
@@ -57,10 +59,11 @@ def area_unit_infos():
         UnitInfo('decare', 1000.0, ['decares']),  # 10 ares
         
         # Planck area
-        UnitInfo('lP²', (scipy.constants.physical_constants['Planck length'][0])**2, 
+        UnitInfo('lP²', PLANCK_LENGTH**2, 
                 ['Planck area', 'planck area', 'lp^2', 'lp²']),
     ]
 
+@lru_cache(maxsize=None)
 def _create_area_config():
     """
     Create a custom EngineerIOConfiguration for area units with extended SI prefixes
@@ -70,27 +73,18 @@ def _create_area_config():
         units=area_unit_infos(),
         unit_prefixes=config.unit_prefixes,
         si_prefix_map=default_si_prefix_map(include_length_unit_prefixes=True)
-    )
+    ).freeze()
 
 class EngineerAreaIO(EngineerIO):
     """
     EngineerIO subclass specialized for area unit parsing and conversion.
     """
+    _unit_normalizer = "normalize_area"
     
-    _instance = None
     
-    def __init__(self):
-        # Use area-specific configuration
-        super().__init__(config=_create_area_config())
-    
-    @classmethod
-    def instance(cls):
-        """
-        Get the singleton instance of EngineerAreaIO
-        """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+    def __init__(self, config=None, **kwargs):
+        # Use area-specific configuration by default
+        super().__init__(config=_create_area_config() if config is None else config, **kwargs)
     
     @returns_unit("m²")
     def normalize_area(self, s):
@@ -113,7 +107,6 @@ class EngineerAreaIO(EngineerIO):
             return [self.normalize_area(v) for v in s]
         if isinstance(s, ndarray):
             return np.asarray([self.normalize_area(v) for v in s])
-        print(s, self.normalize(s), self._apply_squaredness_to_value(self.normalize(s)))
         # We can't just normalize() it here, need to handle squaredness
         return self._apply_squaredness_to_value(self.normalize(s))
             
@@ -133,14 +126,26 @@ class EngineerAreaIO(EngineerIO):
         else: # No need to modify
             return result.value
     
+    @cached_property
+    def conversion_table(self):
+        """
+        Factors from every area unit (with SI prefix) to the SI base unit,
+        computed on first use
+        """
+        return ConversionTable(self, self.normalize_area)
+
     @returns_unit("m²")
     def convert_area_to_square_meters(self, value, unit):
         """
         Given a number or Engineer string (unit ignored) <value>
         in <unit>, convert it to square meters.
+
+        value may also be a list or ndarray of numbers and unit
+        may be an array of unit strings (converted element-wise).
         """
-        # Currently a hack, but doing it directly will not parse SI units
-        return self.normalize_area(f"{value} {unit}")
+        if isinstance(value, (str, bytes)):
+            return self.normalize_area(f"{value} {unit}")
+        return self.conversion_table.to_base(value, unit)
 
 
 @returns_unit("m²")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Split delimited byte buffers (bytes, memoryview, mmap, ...) into
+fixed-width NumPy bytes arrays without creating a Python object
+per field.
+
+The fields of each chunk are gathered into a 'S' array, which can be
+processed by the bulk engine (see Bulk.py) so only distinct values
+are ever decoded and parsed.
+"""
+import numpy as np
+
+__all__ = ["delimiter_table", "iter_field_chunks"]
+
+def delimiter_table(delimiters):
+    """
+    Build a 256-entry boolean lookup table from a delimiter spec.
+
+    delimiters is a bytes (or ASCII str) object. Every byte is
+    a delimiter on its own, e.g. b",\\n" splits at commas and newlines.
+    Only ASCII delimiters are allowed so that UTF-8 multibyte
+    characters such as "µ" or "Ω" are never split.
+    """
+    if isinstance(delimiters, str):
+        delimiters = delimiters.encode("ascii")
+    if not delimiters:
+        raise ValueError("At least one delimiter is required")
+    table = np.zeros(256, dtype=bool)
+    for byte in bytes(delimiters):
+        if byte >= 0x80:
+            raise ValueError(f"Delimiters must be ASCII characters, not {bytes([byte])!r}")
+        table[byte] = True
+    return table
+
+def _gather_fields(data, starts, ends):
+    """
+    Copy the fields data[starts[i]:ends[i]] into a 'S' ndarray
+    """
+    if len(starts) == 0:
+        return np.zeros(0, dtype="S1")
+    widths = ends - starts
+    width = max(int(widths.max()), 1)
+    fields = np.zeros((len(starts), width), dtype=np.uint8)
+    # Gather fields of similar width together (widths up to 8, 16, 32, ...),
+    # so the index matrices are at most about twice as large as the fields
+    low, high = 0, min(8, width)
+    while True:
+        rows = np.flatnonzero((widths > low) & (widths <= high))
+        if rows.size:
+            offsets = np.arange(high)
+            indices = np.minimum(starts[rows, None] + offsets, len(data) - 1)
+            block = data[indices]
+            # Trailing NUL bytes are ignored by the 'S' dtype
+            block[offsets >= widths[rows, None]] = 0
+            fields[rows, :high] = block
+        if high >= width:
+            break
+        low, high = high, min(2 * high, width)
+    return fields.view(f"S{width}").reshape(-1)
+
+def _gather_chunk(data, starts, ends, max_width):
+    """
+    Yield the fields data[starts[i]:ends[i]] as 'S' ndarrays.
+    Fields longer than max_width are yielded as separate single-element
+    arrays, so a single long field (e.g. a header line) doesn't
+    make every field of the chunk as wide as itself.
+    """
+    overlong = np.flatnonzero(ends - starts > max_width)
+    pos = 0
+    for i in overlong.tolist():
+        if i > pos:
+            yield _gather_fields(data, starts[pos:i], ends[pos:i])
+        yield np.asarray([data[starts[i]:ends[i]].tobytes()])
+        pos = i + 1
+    if pos < len(starts) or len(starts) == 0:
+        yield _gather_fields(data, starts[pos:], ends[pos:])
+
+def iter_field_chunks(buffer, delimiters=b"\n", chunk_size=1 << 20, max_width=64):
+    """
+    Split a buffer into fields and yield them as 'S' ndarrays,
+    one array for roughly every chunk_size bytes of input.
+    Fields longer than max_width bytes are yielded as separate
+    single-element arrays, so the memory usage for a chunk is bounded
+    by its size times max_width, regardless of the longest field.
+
+    The buffer is not copied, so memory-mapped files are only
+    read chunk by chunk. A trailing delimiter at the end of the buffer
+    does not produce an empty field (like str.splitlines()).
+    Fields are not stripped.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive, not {chunk_size}")
+    table = delimiter_table(delimiters)
+    data = np.frombuffer(memoryview(buffer).cast("B"), dtype=np.uint8)
+    size = len(data)
+    pos = 0
+    while pos < size:
+        end = min(pos + chunk_size, size)
+        delimiter_positions = np.flatnonzero(table[data[pos:end]]) + pos
+        # Fields longer than one chunk: Extend the chunk until a delimiter is found
+        while len(delimiter_positions) == 0 and end < size:
+            new_end = min(end + chunk_size, size)
+            delimiter_positions = np.flatnonzero(table[data[end:new_end]]) + end
+            end = new_end
+        if end < size: # Process up to the last delimiter, the rest goes into the next chunk
+            ends = delimiter_positions
+            next_pos = int(ends[-1]) + 1
+        elif len(delimiter_positions) and delimiter_positions[-1] == size - 1:
+            ends = delimiter_positions
+            next_pos = size
+        else: # The last field is not terminated by a delimiter
+            ends = np.append(delimiter_positions, size)
+            next_pos = size
+        starts = np.empty_like(ends)
+        starts[0] = pos
+        starts[1:] = ends[:-1] + 1
+        yield from _gather_chunk(data, starts, ends, max_width)
+        pos = next_pos
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bulk normalization engine for EngineerIO.
+
+Real-world columns (measurement exports, BOMs, ...) contain the same
+few value strings over and over again. Instead of running the full
+parser once per element, the engine groups identical values,
+parses every distinct value once and scatters the results back.
+"""
+import numpy as np
+
+__all__ = ["unique_inverse", "parse_plain_numbers", "as_bulk_array", "bulk_apply"]
+
+# Characters of plain decimal numbers like " -1.5e-3", which NumPy and
+# EngineerIO parse identically. Note that "E" is the exa prefix and
+# "nan" / "inf" are not accepted by EngineerIO. NUL pads 'S' & 'U' arrays.
+_plain_number_chars = "0123456789.+-e \t\r\n"
+_plain_number_table = np.zeros(256, dtype=bool)
+_plain_number_table[np.frombuffer((_plain_number_chars + "\0").encode("ascii"), dtype=np.uint8)] = True
+
+def _hash_fixed_width(arr):
+    """
+    Compute a 64 bit hash of every element of a flat 'U' / 'S' ndarray
+    from its raw buffer, processing 8 bytes of every element at once.
+    """
+    size = arr.dtype.itemsize
+    words = -(-size // 8)
+    raw = np.ascontiguousarray(arr).view(np.uint8).reshape(arr.size, size)
+    if size % 8: # Pad every element to whole 64 bit words
+        padded = np.zeros((arr.size, words * 8), dtype=np.uint8)
+        padded[:, :size] = raw
+        raw = padded
+    blocks = raw.view(np.uint64)
+    hashes = blocks[:, 0].copy()
+    multiplier = np.uint64(0x9E3779B97F4A7C15)
+    with np.errstate(over="ignore"):
+        for word in range(1, words):
+            hashes *= multiplier
+            hashes ^= blocks[:, word]
+    return hashes
+
+def _group_by_hash(arr):
+    """
+    Group a flat 'U' / 'S' ndarray by the hashes of its elements.
+    Sorting integer hashes is much faster than sorting the strings.
+    Returns (uniques, inverse) like np.unique(). The caller must
+    check for hash collisions.
+    """
+    hashes = _hash_fixed_width(arr)
+    order = np.argsort(hashes)
+    sorted_hashes = hashes[order]
+    # True for the first element of every group
+    is_first = np.empty(arr.size, dtype=bool)
+    is_first[:1] = True
+    np.not_equal(sorted_hashes[1:], sorted_hashes[:-1], out=is_first[1:])
+    inverse = np.empty(arr.size, dtype=np.intp)
+    inverse[order] = np.cumsum(is_first) - 1
+    return arr[order[is_first]], inverse
+
+def unique_inverse(arr):
+    """
+    Group identical values of a flat ndarray.
+
+    Returns a tuple (uniques, inverse) where uniques is a sequence
+    of distinct values and inverse is an intp ndarray so that
+    uniques[inverse[i]] == arr[i].
+
+    Fixed-width string arrays ('U' / 'S') are grouped by hashing
+    their raw buffer without creating Python objects per element.
+    StringDType and object arrays are grouped using a dict.
+
+    Returns None if the values can't be grouped (e.g. unhashable elements).
+    """
+    if arr.dtype.kind in "US":
+        uniques, inverse = _group_by_hash(arr)
+        if not np.array_equal(uniques[inverse], arr): # Hash collision
+            uniques, inverse = np.unique(arr, return_inverse=True)
+        # Only the distinct values are converted to Python str / bytes
+        return uniques.tolist(), inverse.reshape(-1)
+    # Object & StringDType arrays: Group by hash
+    index = {}
+    try:
+        inverse = np.fromiter(
+            (index.setdefault(value, len(index)) for value in arr),
+            dtype=np.intp, count=arr.size)
+    except TypeError: # Unhashable element
+        return None
+    return list(index), inverse
+
+def _only_plain_number_chars(arr):
+    """
+    Check if all elements of a string array consist only of
+    _plain_number_chars, working on the raw character buffer
+    for fixed-width arrays.
+    """
+    kind = arr.dtype.kind
+    if kind == "S":
+        codes = np.ascontiguousarray(arr).view(np.uint8)
+        return bool(_plain_number_table[codes].all())
+    if kind == "U":
+        codes = np.ascontiguousarray(arr).view(np.uint32)
+        return bool(_plain_number_table[np.minimum(codes, 255)].all())
+    # StringDType: Elements are not stored inline.
+    # Stripping the allowed characters leaves nothing for plain numbers.
+    return not np.strings.str_len(np.strings.strip(arr, _plain_number_chars)).any()
+
+def parse_plain_numbers(arr):
+    """
+    Parse a 'U', 'S' or StringDType ndarray consisting only of plain decimal
+    numbers like "1.5" or "-2e-3" natively in NumPy, without creating
+    a Python object per element.
+
+    Returns a float64 ndarray with the same shape as arr or None if
+    any element is not a plain number (e.g. "1k" or "3 V"), in which case
+    the caller should use the general parser.
+    """
+    if arr.dtype.kind not in "UST":
+        return None
+    if arr.size == 0:
+        return np.zeros(arr.shape, dtype=np.float64)
+    # Reject engineer notation columns quickly before scanning all elements
+    if not _only_plain_number_chars(arr.reshape(-1)[:16]) or not _only_plain_number_chars(arr):
+        return None
+    try:
+        return arr.astype(np.float64)
+    except (ValueError, TypeError): # e.g. "1e", "1-2", "" or missing values
+        return None
+
+def as_bulk_array(arg):
+    """
+    Convert a list, tuple or ndarray to an ndarray for the bulk engine.
+
+    np.asarray() converts every element of a list mixing strings and
+    other values (numbers, NaN, bools, ...) to a string. Such lists are
+    converted to object arrays instead, so the other values are passed
+    through unchanged. Lists of only strings (or only bytes) become
+    'U' (or 'S') arrays, lists without strings numeric arrays.
+
+    Raises ValueError for ragged nested lists.
+    """
+    if not isinstance(arg, (list, tuple)):
+        return np.asarray(arg)
+    if all(type(value) is str for value in arg):
+        return np.asarray(arg)
+    objects = np.asarray(arg, dtype=object)
+    if not any(isinstance(value, (str, bytes)) for value in objects.flat):
+        return np.asarray(arg)
+    if all(type(value) is bytes for value in objects.flat):
+        return np.asarray(arg)
+    return objects
+
+def bulk_apply(arg, func, plain_numbers=False):
+    """
+    Apply a scalar normalization function to every element of arg.
+
+    arg may be a list, tuple or ndarray (of any shape).
+    Every distinct value is passed to func exactly once.
+    If plain_numbers is True, func(s) is assumed to be float(s) for
+    plain decimal numbers, so string arrays consisting only of plain
+    numbers are parsed by NumPy instead (see parse_plain_numbers()).
+    Returns a float64 ndarray with the same shape as arg,
+    or None if arg can't be processed by the bulk engine
+    (the caller should fall back to per-element processing).
+    """
+    try:
+        arr = as_bulk_array(arg)
+    except ValueError: # e.g. ragged nested lists
+        return None
+    # Purely numeric data doesn't need any parsing
+    if arr.dtype.kind in "biuf":
+        return arr.astype(np.float64)
+    if arr.dtype.kind not in "USOT":
+        return None
+    if plain_numbers:
+        values = parse_plain_numbers(arr)
+        if values is not None:
+            return values
+    grouped = unique_inverse(arr.reshape(-1))
+    if grouped is None:
+        return None
+    uniques, inverse = grouped
+    values = np.fromiter((func(value) for value in uniques),
+                         dtype=np.float64, count=len(uniques))
+    return values[inverse].reshape(arr.shape)
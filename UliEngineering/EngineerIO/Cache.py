@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bounded LRU cache used by EngineerIO to memoize parse results
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import weakref
+
+from .Registry import after_fork
+
+__all__ = ["CacheInfo", "LRUCache"]
+
+# All caches, so their locks can be re-created after fork
+_caches = weakref.WeakSet()
+
+@after_fork
+def _reinitialize_locks():
+    for cache in list(_caches):
+        cache._lock = threading.Lock()
+
+@dataclass
+class CacheInfo:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    maxsize: int = 0
+    currsize: int = 0
+
+class LRUCache(object):
+    """
+    Thread-safe, size-bounded least-recently-used cache
+    with hit / miss / eviction statistics.
+    """
+    def __init__(self, maxsize=4096):
+        if maxsize <= 0:
+            raise ValueError(f"Cache size must be positive, not {maxsize}")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _caches.add(self)
+
+    def get(self, key):
+        """
+        Get the value for key or None if it is not cached.
+        Marks key as most recently used.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Insert a value, evicting the least recently used entry
+        if the cache is full.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            maxsize=self.maxsize,
+            currsize=len(self._data)
+        )
+
+    def __len__(self):
+        return len(self._data)
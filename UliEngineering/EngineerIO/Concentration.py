@@ -1,14 +1,15 @@
 """
 Utilities for concentration
 """
+from functools import cached_property, lru_cache
 from numpy import ndarray
 import numpy as np
 
 from . import EngineerIO
+from .Conversion import ConversionTable
 from .Decorators import returns_unit
 from .UnitInfo import EngineerIOConfiguration, UnitAlias, UnitInfo
-from .Defaults import default_si_prefix_map
-from scipy.constants import N_A  # Avogadro's number
+from .Defaults import N_A, default_si_prefix_map
 
 __all__ = [
     "normalize_mass_concentration", "convert_mass_concentration_to_per_liter", "EngineerMassConcentrationIO",
@@ -76,36 +77,31 @@ def mass_concentration_unit_infos():
         UnitInfo('ppt', 1e-12, ['parts per trillion']),
     ]
 
+@lru_cache(maxsize=None)
 def _create_amount_concentration_config():
     config = EngineerIOConfiguration.default()
     return EngineerIOConfiguration(
         units=amount_concentration_unit_infos(),
         unit_prefixes=config.unit_prefixes,
         si_prefix_map=default_si_prefix_map(include_length_unit_prefixes=True)
-    )
+    ).freeze()
 
+@lru_cache(maxsize=None)
 def _create_mass_concentration_config():
     config = EngineerIOConfiguration.default()
     return EngineerIOConfiguration(
         units=mass_concentration_unit_infos(),
         unit_prefixes=config.unit_prefixes,
         si_prefix_map=default_si_prefix_map(include_length_unit_prefixes=True)
-    )
+    ).freeze()
 
 class EngineerAmountConcentrationIO(EngineerIO):
     """
     EngineerIO subclass specialized for amount concentration unit parsing and conversion.
     """
-    _instance = None
 
-    def __init__(self):
-        super().__init__(config=_create_amount_concentration_config())
-
-    @classmethod
-    def instance(cls):
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+    def __init__(self, config=None, **kwargs):
+        super().__init__(config=_create_amount_concentration_config() if config is None else config, **kwargs)
 
     @returns_unit("1/l")
     def normalize_amount_concentration(self, s):
@@ -117,24 +113,27 @@ class EngineerAmountConcentrationIO(EngineerIO):
             return np.asarray([self.normalize_amount_concentration(v) for v in s])
         return self.normalize(s).value
 
+    @cached_property
+    def conversion_table(self):
+        """
+        Factors from every amount concentration unit (with SI prefix) to the SI base unit,
+        computed on first use
+        """
+        return ConversionTable(self, self.normalize_amount_concentration)
+
     @returns_unit("1/l")
     def convert_amount_concentration_to_grams_per_liter(self, value, unit):
-        return self.normalize_amount_concentration(f"{value} {unit}")
+        if isinstance(value, (str, bytes)):
+            return self.normalize_amount_concentration(f"{value} {unit}")
+        return self.conversion_table.to_base(value, unit)
 
 class EngineerMassConcentrationIO(EngineerIO):
     """
     EngineerIO subclass specialized for mass concentration unit parsing and conversion.
     """
-    _instance = None
 
-    def __init__(self):
-        super().__init__(config=_create_mass_concentration_config())
-
-    @classmethod
-    def instance(cls):
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+    def __init__(self, config=None, **kwargs):
+        super().__init__(config=_create_mass_concentration_config() if config is None else config, **kwargs)
 
     @returns_unit("mol/l")
     def normalize_mass_concentration(self, s):
@@ -146,9 +145,19 @@ class EngineerMassConcentrationIO(EngineerIO):
             return np.asarray([self.normalize_mass_concentration(v) for v in s])
         return self.normalize(s).value
 
+    @cached_property
+    def conversion_table(self):
+        """
+        Factors from every mass concentration unit (with SI prefix) to the SI base unit,
+        computed on first use
+        """
+        return ConversionTable(self, self.normalize_mass_concentration)
+
     @returns_unit("1/l")
     def convert_mass_concentration_to_per_liter(self, value, unit):
-        return self.normalize_mass_concentration(f"{value} {unit}")
+        if isinstance(value, (str, bytes)):
+            return self.normalize_mass_concentration(f"{value} {unit}")
+        return self.conversion_table.to_base(value, unit)
 
 @returns_unit("1/l")
 def convert_amount_concentration_to_grams_per_liter(value, unit, instance=None):
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Precomputed unit conversion factor tables for the
+unit-specific EngineerIO subclasses (length, area, ...)
+
+Instead of formatting and re-parsing f"{value} {unit}" for every
+conversion, the factor of every unit (with every SI prefix) to the
+SI base unit is computed once. Conversions are then a single
+(vectorized) multiplication.
+"""
+from itertools import chain
+
+import numpy as np
+
+__all__ = ["ConversionTable"]
+
+class ConversionTable(object):
+    """
+    Maps unit strings like "mm", "inch" or "kpc" to the factor
+    that converts a value in that unit to the SI base unit.
+
+    The factors are computed using the normalize function of
+    the IO class, so they match normalize(f"1 {unit}") exactly,
+    including special rules such as squared prefixes for areas.
+    """
+    def __init__(self, io, normalize):
+        """
+        io : EngineerIO
+            Instance providing the units & prefixes
+        normalize : callable
+            Converts a string like "1 mm" to the SI base unit,
+            e.g. EngineerLengthIO.normalize_length
+        """
+        self._io = io
+        self._normalize = normalize
+        self.factors = {}
+        for unit in chain(io.units, io.unit_aliases):
+            for prefix in chain([""], io.unit_prefix_map):
+                key = prefix + unit
+                if key in self.factors:
+                    continue
+                try:
+                    self.factors[key] = float(normalize(f"1 {key}"))
+                except ValueError: # Prefix can't be combined with this unit
+                    pass
+
+    def factor(self, unit):
+        """
+        Get the factor for a single unit string.
+        Units which are not in the table are parsed (and then cached).
+        Raises the normalize() exceptions for invalid units.
+        """
+        try:
+            return self.factors[unit]
+        except KeyError:
+            factor = self.factors[unit] = float(self._normalize(f"1 {unit}"))
+            return factor
+
+    def __call__(self, unit):
+        """
+        Get the factor for a unit string or a float64 ndarray of factors
+        for an array of unit strings.
+        """
+        if isinstance(unit, str):
+            return self.factor(unit)
+        units = np.asarray(unit)
+        uniques, inverse = np.unique(units.reshape(-1), return_inverse=True)
+        factors = np.asarray([self.factor(u) for u in uniques.tolist()], dtype=np.float64)
+        return factors[inverse].reshape(units.shape)
+
+    def to_base(self, value, unit):
+        """
+        Convert value (a number or a list / ndarray of numbers
+        or engineer strings) given in unit (a unit string or
+        an array of unit strings) to the SI base unit.
+
+        Engineer strings in a list or ndarray are parsed together
+        with their unit using the normalize function, exactly like
+        scalar strings (e.g. "1k" in "m²" is 1e6 m²).
+        None elements result in NaN.
+        """
+        if isinstance(value, (list, tuple)):
+            array = np.asarray(value)
+            # Don't let numpy stringify numbers in mixed lists
+            value = np.asarray(value, dtype=object) if array.dtype.kind in "US" else array
+        if isinstance(value, np.ndarray) and value.dtype.kind not in "biuf":
+            # Strings, None or mixed elements
+            return self._sequence_to_base(value, unit)
+        return value * self(unit)
+
+    def _sequence_to_base(self, value, unit):
+        """
+        to_base() for non-numeric ndarrays
+        """
+        values = value.astype(object)
+        is_parsed = np.frompyfunc(
+            lambda v: v is None or isinstance(v, (str, bytes)), 1, 1)(values).astype(bool)
+        # Plain numbers (and their results) are converted all at once
+        numbers = np.where(is_parsed, 0, values).astype(np.float64)
+        result = np.multiply(numbers, self(unit))
+        if not np.any(is_parsed):
+            return result
+        values = np.broadcast_to(values, result.shape)
+        units = np.broadcast_to(np.asarray(unit, dtype=object), result.shape)
+        parsed = {}
+        for idx in zip(*np.nonzero(np.broadcast_to(is_parsed, result.shape))):
+            key = (values[idx], units[idx])
+            if key not in parsed:
+                parsed[key] = self._parse(*key)
+            result[idx] = parsed[key]
+        return result
+
+    def _parse(self, value, unit):
+        """
+        Convert a single engineer string (or None => NaN) given in unit
+        """
+        if value is None:
+            return np.nan
+        if isinstance(value, bytes):
+            value = value.decode("utf8")
+        return float(self._normalize(f"{value} {unit}"))
+
+    def convert(self, value, from_unit, to_unit):
+        """
+        Convert value (see to_base()) from from_unit to to_unit
+        """
+        return self.to_base(value, from_unit) / self(to_unit)
@@ -4,8 +4,30 @@ import functools
 import inspect
 from typing import Optional
 
+import numpy as np
+
 from UliEngineering.EngineerIO import EngineerIO
 
+# Values which normalize_numeric() would return unchanged
+_NORMALIZED_TYPES = frozenset((int, float, bool))
+
+def _is_normalized(value):
+    """
+    Check if value can be passed to the decorated function as-is.
+    Arrays are never passed as-is, see _normalize_value().
+    """
+    return isinstance(value, (int, float, np.number))
+
+def _normalize_value(instance, value):
+    """
+    normalize_numeric() for a single argument.
+    float64 arrays are only copied, not parsed. Like normalize_numeric(),
+    this ensures the decorated function can't modify the caller's array.
+    """
+    if isinstance(value, np.ndarray) and value.dtype == np.float64:
+        return np.array(value)
+    return instance.normalize_numeric(value)
+
 
 def returns_unit(unit):
     """
@@ -29,6 +51,15 @@ def normalize_numeric_args(func=None, *, exclude=None, instance:Optional[Enginee
     -----------
     exclude : list of str, optional
         List of parameter names that should not be normalized
+    instance : EngineerIO, optional
+        The EngineerIO instance used for normalization.
+        By default, the global instance is used.
+
+    The argument plan (excluded positions, normalized string defaults)
+    is computed once when decorating. Calls where all arguments are
+    already numbers skip normalization entirely. float64 arrays are
+    copied instead of parsed, so the decorated function always gets
+    its own array it may modify in-place.
     
     Example:
         @normalize_numeric_args
@@ -54,7 +85,12 @@ def normalize_numeric_args(func=None, *, exclude=None, instance:Optional[Enginee
         
         # Create new parameters with normalized default values
         new_params = []
-        for param in sig.parameters.values():
+        # (position or None for keyword-only, name, normalized value)
+        # of string defaults which have to be passed explicitly
+        injected_defaults = []
+        # Positional-only parameters can't be injected by name
+        use_bind = False
+        for position, param in enumerate(sig.parameters.values()):
             if param.name not in exclude_set and param.default != inspect.Parameter.empty and isinstance(param.default, str):
                 # Normalize string default values
                 try:
@@ -63,6 +99,13 @@ def normalize_numeric_args(func=None, *, exclude=None, instance:Optional[Enginee
                 except:
                     # If normalization fails, keep the original default
                     new_param = param
+                else:
+                    if param.kind == inspect.Parameter.POSITIONAL_ONLY:
+                        use_bind = True
+                    elif param.kind == inspect.Parameter.KEYWORD_ONLY:
+                        injected_defaults.append((None, param.name, normalized_default))
+                    else:
+                        injected_defaults.append((position, param.name, normalized_default))
             else:
                 new_param = param
             new_params.append(new_param)
@@ -70,34 +113,48 @@ def normalize_numeric_args(func=None, *, exclude=None, instance:Optional[Enginee
         # Create new signature with normalized defaults
         new_sig = sig.replace(parameters=new_params)
 
-        def wrapper(*args, **kwargs):
-            # Get parameter names from signature
-            param_names = list(sig.parameters.keys())
-            
+        # Argument plan, computed once: Which positional arguments are normalized.
+        # Positional arguments beyond the named parameters are always normalized
+        param_names = list(sig.parameters.keys())
+        normalize_position = [name not in exclude_set for name in param_names]
+        num_params = len(param_names)
+
+        def normalize_arguments(args, kwargs):
             # Normalize positional arguments (skip excluded ones)
-            normalized_args = []
-            for i, arg in enumerate(args):
-                param_name = param_names[i] if i < len(param_names) else None
-                if param_name in exclude_set:
-                    normalized_args.append(arg)
-                else:
-                    normalized_args.append(instance.normalize_numeric(arg))
-            normalized_args = tuple(normalized_args)
-            
+            args = tuple(
+                _normalize_value(instance, arg)
+                if i >= num_params or normalize_position[i] else arg
+                for i, arg in enumerate(args)
+            )
             # Normalize keyword arguments (skip excluded ones)
-            normalized_kwargs = {}
-            for key, value in kwargs.items():
-                if key in exclude_set:
-                    normalized_kwargs[key] = value
-                else:
-                    normalized_kwargs[key] = instance.normalize_numeric(value)
-            
-            # Bind arguments to new signature to get all parameters with defaults applied
-            bound_args = new_sig.bind(*normalized_args, **normalized_kwargs)
-            bound_args.apply_defaults()
-            
-            # Call the original function with all normalized arguments (including defaults)
-            return func(*bound_args.args, **bound_args.kwargs)
+            kwargs = {
+                key: value if key in exclude_set else _normalize_value(instance, value)
+                for key, value in kwargs.items()
+            }
+            return args, kwargs
+
+        def wrapper(*args, **kwargs):
+            # Fast path: Numbers don't need to be normalized
+            for value in args:
+                if not (type(value) in _NORMALIZED_TYPES or _is_normalized(value)):
+                    args, kwargs = normalize_arguments(args, kwargs)
+                    break
+            else:
+                for value in kwargs.values():
+                    if not (type(value) in _NORMALIZED_TYPES or _is_normalized(value)):
+                        args, kwargs = normalize_arguments(args, kwargs)
+                        break
+
+            if use_bind:
+                # Bind arguments to new signature to get all parameters with defaults applied
+                bound_args = new_sig.bind(*args, **kwargs)
+                bound_args.apply_defaults()
+                return func(*bound_args.args, **bound_args.kwargs)
+            # Pass normalized string defaults for parameters which have not been given
+            for position, name, value in injected_defaults:
+                if name not in kwargs and (position is None or position >= len(args)):
+                    kwargs[name] = value
+            return func(*args, **kwargs)
         
         # Preserve function metadata
         functools.update_wrapper(wrapper, func)
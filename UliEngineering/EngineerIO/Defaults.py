@@ -3,10 +3,30 @@
 """
 Default values and configurations for the EngineerIO library.
 """
+import math
 from toolz import functoolz
 from typing import Callable, Dict, List, Tuple, Union
 from UliEngineering.EngineerIO.UnitInfo import UnitAlias, UnitInfo
-from scipy.constants import N_A
+
+# Avogadro constant in 1/mol (exact since the 2019 SI redefinition).
+# Same value as scipy.constants.N_A, defined here so importing
+# EngineerIO doesn't have to import SciPy
+N_A = 6.02214076e23
+
+# Lengths in m, computed like scipy.constants (CODATA 2022) for the same
+# reason. Used by the length, area & volume units
+INCH = 0.0254
+FOOT = 12 * INCH
+YARD = 3 * FOOT
+MILE = 1760 * YARD
+POINT = INCH / 72
+NAUTICAL_MILE = 1852.0
+ANGSTROM = 1e-10
+ASTRONOMICAL_UNIT = 149597870700.0
+LIGHT_YEAR = 365.25 * 24 * 60 * 60.0 * 299792458.0 # Julian year * c
+PARSEC = ASTRONOMICAL_UNIT / (math.pi / 180 / 60 / 60) # AU / arcsecond
+BOHR_RADIUS = 5.29177210544e-11
+PLANCK_LENGTH = 1.616255e-35
 
 __all__ = [
     'default_unit_prefixes',
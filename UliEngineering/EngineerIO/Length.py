@@ -3,11 +3,13 @@
 """
 Utilities for length
 """
-import scipy.constants
+from functools import cached_property, lru_cache
 
 from UliEngineering.EngineerIO.Decorators import returns_unit
-from UliEngineering.EngineerIO.Defaults import default_si_prefix_map
+from UliEngineering.EngineerIO.Defaults import (default_si_prefix_map, INCH, FOOT, YARD, MILE, POINT,
+                                                NAUTICAL_MILE, ANGSTROM, ASTRONOMICAL_UNIT, LIGHT_YEAR, PARSEC)
 from . import EngineerIO
+from .Conversion import ConversionTable
 from .UnitInfo import EngineerIOConfiguration, UnitInfo
 
 __all__ = ["normalize_length", "convert_length_to_meters", "convert_length_to_unit", "EngineerLengthIO"]
@@ -21,21 +23,21 @@ def _length_unit_infos():
         UnitInfo('m', 1.0, ['meter', 'meters']),
         
         # Imperial units
-        UnitInfo('mil', 1e-3 * scipy.constants.inch, ['mils']),
-        UnitInfo('in', scipy.constants.inch, ['"', 'inch', 'inches']),
-        UnitInfo('ft', scipy.constants.foot, ['foot', 'feet']),
-        UnitInfo('yd', scipy.constants.yard, ['yard', 'yards']),
-        UnitInfo('mile', scipy.constants.mile, ['miles']),
-        UnitInfo('nautical mile', scipy.constants.nautical_mile, ['nautical miles']),
-        UnitInfo('pt', scipy.constants.point, ['point', 'points']),
+        UnitInfo('mil', 1e-3 * INCH, ['mils']),
+        UnitInfo('in', INCH, ['"', 'inch', 'inches']),
+        UnitInfo('ft', FOOT, ['foot', 'feet']),
+        UnitInfo('yd', YARD, ['yard', 'yards']),
+        UnitInfo('mile', MILE, ['miles']),
+        UnitInfo('nautical mile', NAUTICAL_MILE, ['nautical miles']),
+        UnitInfo('pt', POINT, ['point', 'points']),
         
         # Astronomical units
-        UnitInfo('AU', scipy.constants.astronomical_unit, ['au', 'AUs']),
-        UnitInfo('ly', scipy.constants.light_year, ['lightyear', 'lightyears', 'light years', 'light year']),
-        UnitInfo('pc', scipy.constants.parsec, ['parsec', 'parsecs']),
+        UnitInfo('AU', ASTRONOMICAL_UNIT, ['au', 'AUs']),
+        UnitInfo('ly', LIGHT_YEAR, ['lightyear', 'lightyears', 'light years', 'light year']),
+        UnitInfo('pc', PARSEC, ['parsec', 'parsecs']),
         
         # Other units
-        UnitInfo('Å', scipy.constants.angstrom, ['angstrom', 'Angstrom']),
+        UnitInfo('Å', ANGSTROM, ['angstrom', 'Angstrom']),
     ]
 
 def _default_unit_prefix_map_length():
@@ -50,6 +52,7 @@ def _default_unit_prefix_map_length():
         'E': 18, 'Z': 21, 'Y': 24
     }
 
+@lru_cache(maxsize=None)
 def _create_length_config():
     """
     Create a custom EngineerIOConfiguration for length units with extended SI prefixes
@@ -59,26 +62,16 @@ def _create_length_config():
         units=_length_unit_infos(),
         unit_prefixes=config.unit_prefixes,
         si_prefix_map=default_si_prefix_map(include_length_unit_prefixes=True)
-    )
+    ).freeze()
 
 class EngineerLengthIO(EngineerIO):
     """
     EngineerIO subclass specialized for length unit parsing and conversion.
     """
-    _instance = None
     
-    def __init__(self):
-        # Use length-specific configuration
-        super().__init__(config=_create_length_config())
-    
-    @classmethod
-    def instance(cls):
-        """
-        Get the singleton instance of EngineerLengthIO
-        """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+    def __init__(self, config=None, **kwargs):
+        # Use length-specific configuration by default
+        super().__init__(config=_create_length_config() if config is None else config, **kwargs)
     
     @returns_unit("m")
     def normalize_length(self, s):
@@ -98,14 +91,26 @@ class EngineerLengthIO(EngineerIO):
         """
         return self.normalize_numeric(s)
     
+    @cached_property
+    def conversion_table(self):
+        """
+        Factors from every length unit (with SI prefix) to the SI base unit,
+        computed on first use
+        """
+        return ConversionTable(self, self.normalize_length)
+
     @returns_unit("m")
     def convert_length_to_meters(self, value, unit):
         """
         Given a number or Engineer string (unit ignored) <value>
         in <unit>, convert it to meters.
+
+        value may also be a list or ndarray of numbers and unit
+        may be an array of unit strings (converted element-wise).
         """
-        # Currently a hack, but doing it directly will not parse SI units
-        return self.normalize_length(f"{value} {unit}")
+        if isinstance(value, (str, bytes)):
+            return self.normalize_length(f"{value} {unit}")
+        return self.conversion_table.to_base(value, unit)
 
     def convert_length_to_unit(self, value, from_unit, to_unit):
         """
@@ -118,11 +123,10 @@ class EngineerLengthIO(EngineerIO):
             # If value already contains a unit, use it and ignore `from_unit`.
             meters = self.normalize_length(value)
         else:
-            meters = self.convert_length_to_meters(value, from_unit)
+            meters = self.conversion_table.to_base(value, from_unit)
 
         # Determine how many meters are in one target unit
-        per_target_unit = self.convert_length_to_meters(1.0, to_unit)
-        return meters / per_target_unit
+        return meters / self.conversion_table(to_unit)
 
 
 # Backward compatibility functions
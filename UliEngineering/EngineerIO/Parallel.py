@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process-parallel normalization of large arrays.
+
+String parsing is GIL-bound, so the distinct values of the input
+are split across a process pool. Every worker process creates its
+EngineerIO instance once and writes its results directly into a
+float array in shared memory, so only the input strings are pickled.
+
+Subclasses whose unit-specific normalizer differs from normalize_numeric()
+(e.g. squared prefixes in EngineerAreaIO.normalize_area()) name it in
+their _unit_normalizer attribute, which is then used for every value.
+"""
+import os
+
+import numpy as np
+
+from .Bulk import unique_inverse
+
+__all__ = ["parallel_normalize_numeric"]
+
+# Per-process EngineerIO instances by construction arguments
+_worker_instances = {}
+
+def _worker_instance(cls, kwargs):
+    key = (cls, tuple(sorted(kwargs.items())))
+    io = _worker_instances.get(key)
+    if io is None:
+        io = _worker_instances[key] = cls(**kwargs)
+    return io
+
+def _unit_normalize(io, value):
+    """
+    Normalize a single value using the unit-specific normalizer of io
+    """
+    if value is None: # The unit-specific normalizers might return None
+        raise ValueError("Can't normalize None")
+    return getattr(io, io._unit_normalizer)(value)
+
+def _try_unit_normalize(io, value):
+    """
+    Like EngineerIO._try_normalize_scalar() using the unit-specific normalizer.
+    Returns a tuple (value, error) where error is True if value is invalid.
+    """
+    try:
+        return float(_unit_normalize(io, value)), False
+    except Exception:
+        return np.nan, True
+
+def _try_normalize_values(io, values):
+    """
+    Normalize a list of values without raising.
+    Returns a tuple (float64 ndarray, index of the first invalid value or -1)
+    """
+    if io._unit_normalizer is None:
+        results = [io._try_normalize_scalar(value) for value in values]
+    else:
+        results = [_try_unit_normalize(io, value) for value in values]
+    normalized = np.fromiter((result[0] for result in results), dtype=np.float64, count=len(results))
+    invalid = next((idx for idx, result in enumerate(results) if result[1]), -1)
+    return normalized, invalid
+
+def _normalize_chunk(construction_args, shm_name, size, start, values):
+    """
+    Normalize values in a worker process and write the results
+    to shared_array[start:start + len(values)].
+
+    Returns the index (in the shared array) of the first value
+    which could not be normalized or -1.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    io = _worker_instance(*construction_args)
+    normalized, invalid = _try_normalize_values(io, values)
+    shm = SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+        out[start:start + len(values)] = normalized
+        del out # Release the buffer before closing
+    finally:
+        shm.close()
+    return start + invalid if invalid >= 0 else -1
+
+def _raise_invalid(io, value):
+    """
+    Raise the exception the (unit-specific) normalizer raises for value
+    """
+    if io._unit_normalizer is None:
+        io.normalize_numeric(value)
+    else:
+        _unit_normalize(io, value)
+    raise ValueError(f"Can't normalize {value!r}")
+
+def parallel_normalize_numeric(io, arg, workers=None, strict=True, chunk_size=65536, executor=None):
+    """
+    Normalize a (large) list, tuple or ndarray using a process pool.
+    Works for EngineerIO and its subclasses, using their unit-specific
+    normalizer (e.g. normalize_area()) if it differs from normalize_numeric().
+
+    Parameters:
+    -----------
+    io : EngineerIO
+        The instance to use. Worker processes create an equivalent instance.
+    arg : list, tuple or ndarray
+        The values to normalize
+    workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs.
+    strict : bool
+        If True, raise the exception normalize_numeric() would raise
+        for invalid values. Otherwise, invalid values are NaN.
+    chunk_size : int
+        Number of distinct values sent to a worker at once.
+        Inputs with fewer distinct values are processed in this process.
+    executor : concurrent.futures.ProcessPoolExecutor, optional
+        Use an existing pool (the worker processes keep their
+        EngineerIO instances between calls) instead of creating one.
+
+    Returns a float64 ndarray with the same shape as arg.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    arr = io._asarray(arg)
+    if arr.dtype.kind in "biuf":
+        return arr.astype(np.float64)
+    flat = arr.reshape(-1)
+    grouped = unique_inverse(flat)
+    if grouped is None: # Unhashable elements: parse every element
+        uniques, inverse = flat.tolist(), np.arange(flat.size)
+    else:
+        uniques, inverse = grouped
+    # Not worth the process pool overhead
+    if len(uniques) <= chunk_size or (workers <= 1 and executor is None):
+        if io._unit_normalizer is not None:
+            normalized, invalid = _try_normalize_values(io, uniques)
+            if strict and invalid >= 0:
+                _raise_invalid(io, uniques[invalid])
+            return normalized[inverse].reshape(arr.shape)
+        if strict:
+            return io.normalize_numeric(arr)
+        return io.try_normalize_array(arr)[0]
+
+    import concurrent.futures
+    from multiprocessing.shared_memory import SharedMemory
+    construction_args = io._construction_args()
+    shm = SharedMemory(create=True, size=len(uniques) * np.dtype(np.float64).itemsize)
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(_normalize_chunk, construction_args, shm.name,
+                            len(uniques), start, uniques[start:start + chunk_size])
+            for start in range(0, len(uniques), chunk_size)
+        ]
+        errors = [future.result() for future in futures]
+        shared_values = np.ndarray((len(uniques),), dtype=np.float64, buffer=shm.buf)
+        result = shared_values[inverse].reshape(arr.shape)
+        del shared_values # Release the buffer before closing
+    finally:
+        if own_executor:
+            executor.shutdown()
+        shm.close()
+        shm.unlink()
+    errors = [error for error in errors if error >= 0]
+    if strict and errors:
+        # Raise the same exception as the (unit-specific) normalizer
+        _raise_invalid(io, uniques[min(errors)])
+    return result
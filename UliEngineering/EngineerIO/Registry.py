@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Thread-safe & fork-safe registry of the shared EngineerIO instances
+returned by EngineerIO.instance() and its subclasses.
+
+Instances are created lazily, exactly once per class, while holding
+a lock. Once created, EngineerIO.instance() doesn't acquire the lock.
+
+The shared instances are used by all code in the process (including
+the module-level functions like normalize_numeric()), so their parse
+configuration is read-only: set_engine(), add_unit(), add_alias(),
+add_units(), remove_unit() and batch_update() raise FrozenInstanceError.
+For a privately configured parser, create a new instance instead, e.g.
+EngineerIO(engine="scan", cache_size=1024), and call its methods (the
+module-level functions of the unit-specific modules like Length.py also
+accept it as instance=...).
+
+Opting into the parse cache or statistics is allowed and safe, even while
+other threads are parsing: enable_cache(), disable_cache(), cache_clear(),
+enable_stats() and disable_stats() atomically replace or clear a
+thread-safe object, and normalize() reads it once per call.
+
+After os.fork(), the locks (of the registry, the caches and the
+statistics) are re-created in the child process, so a lock held by
+another thread at fork time can't deadlock it. The instances are
+inherited by the child including their configuration, cache contents
+and statistics, which are independent of the parent from then on.
+"""
+import os
+import threading
+
+__all__ = ["after_fork", "create_instance", "prewarm"]
+
+_lock = threading.RLock()
+_after_fork_hooks = []
+
+def after_fork(func):
+    """
+    Register a function which is called without arguments in
+    the child process after os.fork(), e.g. to re-create locks.
+    Can be used as a decorator.
+    """
+    _after_fork_hooks.append(func)
+    return func
+
+def _reinitialize_after_fork():
+    global _lock
+    _lock = threading.RLock()
+    for hook in _after_fork_hooks:
+        hook()
+
+if hasattr(os, "register_at_fork"): # Not available on Windows
+    os.register_at_fork(after_in_child=_reinitialize_after_fork)
+
+def create_instance(cls):
+    """
+    Get the shared instance of cls, creating it if required.
+    Only one thread creates the instance, all others wait for it.
+    """
+    with _lock:
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls()
+            # Shared by all users, see above
+            instance._read_only = True
+            # Only publish completely initialized instances
+            cls._instance = instance
+        return instance
+
+def prewarm(*classes):
+    """
+    Create the shared instances of the given EngineerIO classes,
+    e.g. at application startup or before forking worker processes.
+    By default, EngineerIO and all of its builtin subclasses are created.
+
+    Returns the list of instances.
+    """
+    if not classes:
+        from . import EngineerIO
+        from .Area import EngineerAreaIO
+        from .Concentration import EngineerAmountConcentrationIO, EngineerMassConcentrationIO
+        from .Length import EngineerLengthIO
+        from .Timespan import EngineerTimespanIO
+        from .Volume import EngineerVolumeIO
+        classes = (EngineerIO, EngineerLengthIO, EngineerAreaIO, EngineerVolumeIO,
+                   EngineerTimespanIO, EngineerAmountConcentrationIO, EngineerMassConcentrationIO)
+    return [cls.instance() for cls in classes]
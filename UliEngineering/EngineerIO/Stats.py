@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Opt-in instrumentation of the EngineerIO parse paths.
+
+If enabled using EngineerIO.enable_stats(), every normalize() call
+records which branches of split_input() it took (alias rewrite,
+mid-string prefix, comma/dot transform, the "cm" rule, ...) and which
+exception it raised, together with a histogram of the call durations.
+If disabled (the default), only a single attribute check is performed.
+
+Branch names:
+    cache_hit             Result was taken from the normalize() cache
+    interpunctation       Comma/dot transform ("1,5", "1,234.56")
+    alias                 Unit alias rewrite ("parts per million" => "ppm")
+    unit                  Unit found ("V" in "3.3 V")
+    unit_prefix           Unit prefix found ("°" in "10 °C")
+    leading_prefix        Leading prefix found ("±" in "±5V")
+    suffix_si_prefix      SI prefix at the end of the number ("2.5k")
+    mid_string_si_prefix  SI prefix inside the number ("1k25", "1cm")
+    prefix_as_decimal     SI prefix used as decimal separator ("1k25")
+    cm_rule               Special rule for two SI prefixes, e.g. "1cm"
+"""
+import bisect
+from dataclasses import dataclass, field
+import threading
+import time
+import weakref
+
+from .Registry import after_fork
+
+__all__ = ["HISTOGRAM_BOUNDS", "PathStats", "ParseStats"]
+
+# Upper bounds (in seconds) of the duration histogram buckets:
+# 0.5µs, 1µs, 2µs, ..., 1024µs. The last bucket counts everything slower.
+HISTOGRAM_BOUNDS = tuple(0.5e-6 * 2 ** k for k in range(12))
+
+# All statistics, so their locks can be re-created after fork
+_stats = weakref.WeakSet()
+
+@after_fork
+def _reinitialize_locks():
+    for stats in list(_stats):
+        stats._lock = threading.Lock()
+
+@dataclass
+class PathStats:
+    count: int = 0
+    total_time: float = 0.
+    # Number of calls per duration bucket, see HISTOGRAM_BOUNDS
+    histogram: list = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS) + 1))
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.count if self.count else 0.
+
+    def add(self, elapsed, bucket):
+        self.count += 1
+        self.total_time += elapsed
+        self.histogram[bucket] += 1
+
+    def copy(self):
+        return PathStats(self.count, self.total_time, list(self.histogram))
+
+class ParseStats(object):
+    """
+    Thread-safe counters & duration histograms of the parse paths,
+    overall, per branch and per exception type.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+        _stats.add(self)
+
+    def reset(self):
+        """
+        Reset all counters & histograms
+        """
+        with self._lock:
+            self.calls = PathStats()
+            self.branches = {}
+            self.exceptions = {}
+
+    def measure(self, func, *args):
+        """
+        Call func(*args, trace=trace) and record its duration,
+        the branches appended to trace and the exception it raised, if any.
+        """
+        trace = []
+        start = time.perf_counter()
+        try:
+            result = func(*args, trace=trace)
+        except Exception as exc:
+            self.record(trace, time.perf_counter() - start, exc)
+            raise
+        self.record(trace, time.perf_counter() - start)
+        return result
+
+    def record(self, trace, elapsed, exception=None):
+        """
+        Record a call which took the given branches and elapsed seconds
+        """
+        bucket = bisect.bisect_left(HISTOGRAM_BOUNDS, elapsed)
+        with self._lock:
+            self.calls.add(elapsed, bucket)
+            # Count every branch only once per call
+            for branch in set(trace):
+                stats = self.branches.get(branch)
+                if stats is None:
+                    stats = self.branches[branch] = PathStats()
+                stats.add(elapsed, bucket)
+            if exception is not None:
+                name = type(exception).__name__
+                stats = self.exceptions.get(name)
+                if stats is None:
+                    stats = self.exceptions[name] = PathStats()
+                stats.add(elapsed, bucket)
+
+    def snapshot(self):
+        """
+        Get a consistent copy of the statistics as a dict with the keys
+        "calls" (PathStats of all calls), "branches" and "exceptions"
+        (dicts of name => PathStats)
+        """
+        with self._lock:
+            return {
+                "calls": self.calls.copy(),
+                "branches": {name: stats.copy() for name, stats in self.branches.items()},
+                "exceptions": {name: stats.copy() for name, stats in self.exceptions.items()},
+            }
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Helpers for normalizing unbounded streams of values
+(sockets, log tails, generators, ...) with constant memory.
+
+The stream is consumed in fixed-size blocks. Each block is parsed
+by the bulk engine, so only its distinct values are parsed.
+"""
+from itertools import islice
+
+__all__ = ["iter_blocks", "column_extractor"]
+
+def iter_blocks(iterable, block_size):
+    """
+    Lazily split an iterable into lists of at most block_size elements.
+    Only one block is kept in memory at a time.
+    """
+    if block_size < 1:
+        raise ValueError(f"Block size must be at least 1, not {block_size}")
+    iterator = iter(iterable)
+    while True:
+        block = list(islice(iterator, block_size))
+        if not block:
+            return
+        yield block
+
+def column_extractor(column=0, delimiter=","):
+    """
+    Create a function that extracts the given (0-based) column from a
+    str or bytes line, e.g. for CSV data.
+    Returns None if the line doesn't have enough columns.
+    """
+    bdelimiter = delimiter.encode("utf8") if isinstance(delimiter, str) else delimiter
+    sdelimiter = bdelimiter.decode("utf8")
+    def extract(line):
+        fields = line.split(bdelimiter if isinstance(line, bytes) else sdelimiter)
+        try:
+            return fields[column]
+        except IndexError:
+            return None
+    return extract
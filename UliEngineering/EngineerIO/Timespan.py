@@ -3,6 +3,7 @@
 """
 Timespan normalization and conversion utilities for UliEngineering
 """
+from functools import lru_cache
 import numpy as np
 
 from UliEngineering.EngineerIO.Decorators import returns_unit
@@ -42,6 +43,7 @@ def _timespan_unit_infos():
         UnitAlias('Ty', aliases=['terayear', 'terayears', 'Tyr', 'Tyrs']),
     ]
 
+@lru_cache(maxsize=None)
 def _create_timespan_config():
     """
     Create a custom EngineerIOConfiguration for timespan units
@@ -51,18 +53,17 @@ def _create_timespan_config():
         units=_timespan_unit_infos(),
         unit_prefixes=config.unit_prefixes,
         si_prefix_map=config.si_prefix_map
-    )
+    ).freeze()
 
 class EngineerTimespanIO(EngineerIO):
     """
     Specialized EngineerIO class for timespan operations
     """
     
-    _instance = None
     
-    def __init__(self):
-        # Use timespan-specific configuration
-        super().__init__(config=_create_timespan_config())
+    def __init__(self, config=None, **kwargs):
+        # Use timespan-specific configuration by default
+        super().__init__(config=_create_timespan_config() if config is None else config, **kwargs)
     
     @returns_unit("s")
     def normalize_timespan(self, arg: str | bytes | int | float | np.generic | np.ndarray) -> int | float | np.generic | np.ndarray:
@@ -72,14 +73,6 @@ class EngineerTimespanIO(EngineerIO):
         """
         return self.normalize_numeric(arg)
 
-    @classmethod
-    def instance(cls):
-        """
-        Get the singleton instance of EngineerTimespanIO
-        """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
 
 def normalize_timespan(v: str | bytes | int | float | np.generic | np.ndarray) -> int | float | np.generic | np.ndarray:
     """
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single-pass tokenizer for engineer notation strings.
+
+This is an alternative to the regex-based EngineerIO.split_input()
+pipeline. It produces identical SplitResults, but works on
+indices instead of building intermediate strings for every step:
+units, aliases and unit prefixes are detected from the end of the
+string using the suffix tries of the EngineerIO instance.
+
+Select it using EngineerIO(engine="scan") or io.set_engine("scan").
+"""
+from ..Exceptions import (FirstCharacterInStringIsUnitPrefixException,
+                          MultipleUnitPrefixesException,
+                          RemainderOfStringContainsNonNumericCharacters)
+from .Types import ParseErrorCode, SplitResult
+
+__all__ = ["ScanTokenizer"]
+
+class ScanTokenizer(object):
+    """
+    Splits strings into SplitResults using the unit & prefix
+    tables of an EngineerIO instance.
+    """
+    def __init__(self, io):
+        # Suffix tries are shared with the EngineerIO instance
+        self.units_trie = io.units_trie
+        self.unit_alias_trie = io.unit_alias_trie
+        self.unit_prefix_suffix_trie = io.unit_prefix_suffix_trie
+        # SI prefixes such as "k", "M"
+        self.si_prefixes = frozenset(io.all_unit_prefixes)
+        # Unit prefixes such as "Δ", "±", "°". Order matters for the leading prefix
+        self.unit_prefixes = [pfx for pfx in io.unit_prefixes if pfx]
+        self._unit_prefix_set = frozenset(self.unit_prefixes)
+        self._single_char_unit_prefixes = all(len(pfx) == 1 for pfx in self.unit_prefixes)
+        self._unit_prefix_first_chars = frozenset(pfx[0] for pfx in self.unit_prefixes)
+        self._unit_prefix_last_chars = frozenset(pfx[-1] for pfx in self.unit_prefixes)
+        self._numeric_allowed = frozenset(io._numeric_allowed)
+        self.strippable = io.strippable
+
+    def _unit_prefix_run_start(self, s):
+        """
+        Find the start index of the run of unit prefixes at the end of s.
+        Equivalent to re.search("(prefix1|prefix2|...)+$", s).start()
+        Returns len(s) if there is no such run
+        """
+        n = len(s)
+        if self._single_char_unit_prefixes:
+            i = n
+            while i > 0 and s[i - 1] in self._unit_prefix_set:
+                i -= 1
+            return i
+        # Multi-character prefixes: Find leftmost index from which
+        # the rest of the string can be split into prefixes
+        tileable = [False] * (n + 1)
+        tileable[n] = True
+        start = n
+        for i in range(n - 1, -1, -1):
+            for pfx in self.unit_prefixes:
+                if s.startswith(pfx, i) and tileable[i + len(pfx)]:
+                    tileable[i] = True
+                    start = i
+                    break
+        return start
+
+    def _leading_unit_prefix_length(self, s):
+        """
+        Length of the run of unit prefixes at the start of s.
+        Equivalent to re.search("^(prefix1|prefix2|...)+", s)
+        """
+        if self._single_char_unit_prefixes:
+            pos = 0
+            while pos < len(s) and s[pos] in self._unit_prefix_set:
+                pos += 1
+            return pos
+        pos = 0
+        while True:
+            for pfx in self.unit_prefixes:
+                if s.startswith(pfx, pos):
+                    pos += len(pfx)
+                    break
+            else:
+                return pos
+
+    def scan(self, s, trace=None):
+        """
+        Split s into a SplitResult.
+        Returns a ParseErrorCode instead of a SplitResult
+        if the string can't be split. Never raises.
+
+        If trace is a list, the names of the branches taken
+        are appended to it (see Stats.py).
+        """
+        # Normalize interpunctation (see EngineerIO.normalize_interpunctation)
+        comma_idx = s.find(",")
+        if comma_idx >= 0:
+            if trace is not None:
+                trace.append("interpunctation")
+            dot_idx = s.find(".")
+            if dot_idx < 0:
+                s = s.replace(",", ".")
+            elif comma_idx < dot_idx:
+                s = s.replace(",", "")
+            else:
+                s = s.replace(".", "").replace(",", ".")
+        # Split off unit
+        unit = ""
+        if len(s) <= 1:
+            remainder = s
+            unit_prefix = ""
+        else:
+            alias_match = self.unit_alias_trie.match(s)
+            if alias_match is not None:
+                start, end, canonical_unit = alias_match
+                s = s[:start] + canonical_unit + s[end:]
+                if trace is not None:
+                    trace.append("alias")
+            unit_match = self.units_trie.match(s)
+            if unit_match is not None:
+                start, end, unit = unit_match
+                remainder = s[:start].strip()
+                if trace is not None:
+                    trace.append("unit")
+            else:
+                remainder = s.rstrip(self.strippable)
+            # Split off unit prefix run such as "°"
+            if remainder and remainder[-1] in self._unit_prefix_last_chars:
+                run_start = self._unit_prefix_run_start(remainder)
+                unit_prefix = remainder[run_start:]
+                remainder = remainder[:run_start].rstrip(self.strippable)
+                if trace is not None and unit_prefix:
+                    trace.append("unit_prefix")
+            else:
+                unit_prefix = ""
+        s = remainder.replace(" ", "")
+        # Split off leading prefix run such as "±"
+        if s and s[0] in self._unit_prefix_first_chars:
+            prefix_length = self._leading_unit_prefix_length(s)
+            prefix = s[:prefix_length]
+            s = s[prefix_length:]
+            if trace is not None and prefix:
+                trace.append("leading_prefix")
+        else:
+            prefix = ""
+        if not s:
+            return ParseErrorCode.EMPTY
+        # SI prefix at the end of the number: "2.5k"
+        match = self.unit_prefix_suffix_trie.match(s)
+        if match is not None:
+            unit_prefix_char = match[2]
+            s = s[:match[0]]
+            if trace is not None:
+                trace.append("suffix_si_prefix")
+        elif self.si_prefixes.isdisjoint(s):
+            unit_prefix_char = ""
+        else: # SI prefix somewhere in the middle: "1k25"
+            if s[0] in self.si_prefixes:
+                return ParseErrorCode.FIRST_CHARACTER_IS_UNIT_PREFIX
+            indices = [idx for idx, ch in enumerate(s) if ch in self.si_prefixes]
+            # Special rule for "cm" (two prefixes, the last one is "m")
+            if len(indices) > 1 and not (len(indices) == 2 and s[indices[-1]] == "m"):
+                return ParseErrorCode.MULTIPLE_UNIT_PREFIXES
+            idx = indices[0]
+            unit_prefix_char = s[idx]
+            if trace is not None:
+                trace.append("mid_string_si_prefix")
+                if len(indices) == 2:
+                    trace.append("cm_rule")
+            # Prefix-as-decimal-separator
+            if 0 < idx < len(s) - 1 and s[idx - 1].isdigit() and s[idx + 1].isdigit():
+                if trace is not None:
+                    trace.append("prefix_as_decimal")
+                if "." in s:
+                    return ParseErrorCode.AMBIGUOUS_DECIMAL_SEPARATOR
+                s = s.replace(unit_prefix_char, ".")
+        s = s.strip(self.strippable)
+        if not self._numeric_allowed.issuperset(s):
+            return ParseErrorCode.NON_NUMERIC_REMAINDER
+        return SplitResult(
+            prefix=prefix,
+            number=s,
+            unit_prefix_char=unit_prefix_char,
+            unit_prefix=unit_prefix,
+            unit=unit
+        )
+
+    def split(self, s, trace=None):
+        """
+        Split s into a SplitResult.
+        Raises the same exceptions as EngineerIO.split_input()
+        """
+        result = self.scan(s, trace)
+        if isinstance(result, SplitResult):
+            return result
+        if result == ParseErrorCode.EMPTY:
+            raise ValueError("Can't split empty string")
+        elif result == ParseErrorCode.FIRST_CHARACTER_IS_UNIT_PREFIX:
+            raise FirstCharacterInStringIsUnitPrefixException(f"The first character in '{s}' is registered as a SI prefix, hence the meaning of that string is not clear")
+        elif result == ParseErrorCode.MULTIPLE_UNIT_PREFIXES:
+            raise MultipleUnitPrefixesException(f"More than one SI unit prefix in the string '{s}'")
+        elif result == ParseErrorCode.AMBIGUOUS_DECIMAL_SEPARATOR:
+            raise ValueError(f"Unit prefix as decimal separator, but dot is also in string: {s}")
+        raise RemainderOfStringContainsNonNumericCharacters(f"'{s}' contains non-numeric characters after removing prefixes & unit")
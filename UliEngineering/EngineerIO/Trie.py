@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reversed-suffix trie used to match units, unit aliases and SI prefixes
+at the end of a string.
+
+In contrast to a "(unit1|unit2|...)$" regex alternation, the lookup
+cost only depends on the length of the matched suffix, not on the
+number of registered strings. Strings can be added and removed
+without rebuilding the trie.
+"""
+
+__all__ = ["SuffixTrie"]
+
+# Key of the value stored in a terminal node.
+# Can't collide with the (single character) edge keys
+_VALUE = None
+
+class SuffixTrie(object):
+    """
+    Maps strings to values and finds the longest key
+    that is a suffix of a given string.
+    """
+    def __init__(self, items=()):
+        """
+        items may be an iterable of keys (the value will be the key itself)
+        or a dict of key => value
+        """
+        self.root = {}
+        self._size = 0
+        if isinstance(items, dict):
+            for key, value in items.items():
+                self.add(key, value)
+        else:
+            for key in items:
+                self.add(key)
+
+    def add(self, key, value=None):
+        """
+        Add a key. If value is None, the key itself is stored as value.
+        Replaces the value if the key already exists.
+        """
+        node = self.root
+        for ch in reversed(key):
+            node = node.setdefault(ch, {})
+        if _VALUE not in node:
+            self._size += 1
+        node[_VALUE] = key if value is None else value
+
+    def remove(self, key):
+        """
+        Remove a key. Raises KeyError if the key doesn't exist.
+        """
+        path = [self.root]
+        for ch in reversed(key):
+            node = path[-1].get(ch)
+            if node is None:
+                raise KeyError(key)
+            path.append(node)
+        if _VALUE not in path[-1]:
+            raise KeyError(key)
+        del path[-1][_VALUE]
+        self._size -= 1
+        # Prune nodes which became empty, starting at the leaf.
+        # path[idx] is reached from path[idx - 1] via key[-idx]
+        for idx in range(len(key), 0, -1):
+            if path[idx]:
+                break
+            del path[idx - 1][key[-idx]]
+
+    def get(self, key, default=None):
+        node = self.root
+        for ch in reversed(key):
+            node = node.get(ch)
+            if node is None:
+                return default
+        return node.get(_VALUE, default)
+
+    def __contains__(self, key):
+        node = self.root
+        for ch in reversed(key):
+            node = node.get(ch)
+            if node is None:
+                return False
+        return _VALUE in node
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def keys(self):
+        """
+        Iterate all keys (in no particular order)
+        """
+        stack = [(self.root, "")]
+        while stack:
+            node, suffix = stack.pop()
+            for ch, child in node.items():
+                if ch is _VALUE:
+                    yield suffix
+                else:
+                    stack.append((child, ch + suffix))
+
+    def _longest_suffix(self, s, end):
+        """
+        Find the longest key that is a suffix of s[:end].
+        Returns (start index, value). start is -1 if no key matches.
+        """
+        node = self.root
+        start, value = (end, node[_VALUE]) if _VALUE in node else (-1, None)
+        i = end
+        while i > 0:
+            node = node.get(s[i - 1])
+            if node is None:
+                break
+            i -= 1
+            if _VALUE in node:
+                start, value = i, node[_VALUE]
+        return start, value
+
+    def longest_suffix_start(self, s, end=None):
+        """
+        Find the longest key that is a suffix of s[:end].
+        Returns the start index of that suffix or -1 if no key matches.
+        """
+        return self._longest_suffix(s, len(s) if end is None else end)[0]
+
+    def match(self, s):
+        """
+        Find the longest key that is a suffix of s.
+        Equivalent to re.search("(key1|key2|...)$", s), including
+        the rule that "$" also matches before a trailing newline.
+
+        Returns (start, end, value) or None if no key matches.
+        """
+        end = len(s)
+        start, value = self._longest_suffix(s, end)
+        if end and s[-1] == "\n":
+            nl_start, nl_value = self._longest_suffix(s, end - 1)
+            if nl_start >= 0 and (start < 0 or nl_start < start):
+                start, end, value = nl_start, end - 1, nl_value
+        if start < 0:
+            return None
+        return start, end, value
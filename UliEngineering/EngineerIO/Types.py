@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from dataclasses import dataclass, field
+from enum import IntEnum
 
 @dataclass
 class UnitSplitResult:
@@ -32,3 +33,26 @@ class NormalizeResult:
     prefix_multiplier: float = field(default=1.0)
     # Multiplier from unit factor
     unit_factor: float = field(default=1.0)
+
+class ParseErrorCode(IntEnum):
+    """
+    Compact reason codes for strings that could not be parsed.
+    Fits into an uint8 array.
+    """
+    OK = 0
+    # Nothing left after removing unit & prefixes
+    EMPTY = 1
+    # e.g. "k12"
+    FIRST_CHARACTER_IS_UNIT_PREFIX = 2
+    # e.g. "1.2kkA"
+    MULTIPLE_UNIT_PREFIXES = 3
+    # e.g. "1k2.4": Unit prefix used as decimal separator, but there's also a dot
+    AMBIGUOUS_DECIMAL_SEPARATOR = 4
+    # e.g. "1x5"
+    NON_NUMERIC_REMAINDER = 5
+    # Only valid characters, but not a valid number, e.g. "1e" or "1.2.3"
+    INVALID_NUMBER = 6
+    # Value is None
+    NONE = 7
+    # Value is neither a number nor a string, or bytes that can't be decoded
+    INVALID_TYPE = 8
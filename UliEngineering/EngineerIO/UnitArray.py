@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit-tagged float arrays, as returned by EngineerIO.normalize_array()
+
+Normalizing a column like ["10 kΩ", "4.7 kΩ"] returns the values
+together with the unit they were given in, so later pipeline stages
+can check or convert units without parsing the strings again.
+"""
+import numpy as np
+
+from ..Units import InvalidUnitInContextException
+
+__all__ = ["UnitArray"]
+
+def _unit_string(unit):
+    # Accept both plain strings and Unit namedtuples
+    return getattr(unit, "unit", unit)
+
+class UnitArray(object):
+    """
+    A float64 ndarray plus the units of its elements.
+
+    If all elements have the same unit, only that unit is stored.
+    Mixed units are stored as a small integer code per element,
+    indexing into the units tuple.
+
+    Attributes:
+    -----------
+    values : ndarray
+        The normalized values (as returned by normalize_numeric(),
+        i.e. unit factors like the one of "inch" have been applied)
+    units : tuple of str
+        Distinct units which occur in the array ('' = no unit given)
+    unit_codes : ndarray or None
+        Index into units for every element or None if there
+        is only one unit
+    """
+    __slots__ = ["values", "units", "unit_codes"]
+
+    def __init__(self, values, unit="", units=None, unit_codes=None):
+        self.values = np.asarray(values, dtype=np.float64)
+        if units is None:
+            units = (_unit_string(unit),)
+        self.units = tuple(units)
+        if unit_codes is not None:
+            unit_codes = np.asarray(unit_codes)
+            if unit_codes.shape != self.values.shape:
+                raise ValueError(f"Shape of unit codes {unit_codes.shape} doesn't match values {self.values.shape}")
+        elif len(self.units) != 1:
+            raise ValueError("unit_codes are required unless there is exactly one unit")
+        self.unit_codes = unit_codes
+
+    @classmethod
+    def from_units(cls, values, units):
+        """
+        Create a UnitArray from values and an array of per-element unit strings
+        """
+        units = np.asarray(units, dtype=str)
+        table, codes = np.unique(units.reshape(-1), return_inverse=True)
+        if len(table) == 1:
+            return cls(values, unit=str(table[0]))
+        codes = codes.astype(np.min_scalar_type(len(table) - 1)).reshape(units.shape)
+        return cls(values, units=table.tolist(), unit_codes=codes)
+
+    @property
+    def mixed(self):
+        """True if the elements don't all have the same unit"""
+        return self.unit_codes is not None
+
+    @property
+    def unit(self):
+        """The unit of all elements or None if the units are mixed"""
+        return None if self.mixed else self.units[0]
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    def __len__(self):
+        return len(self.values)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or dtype == self.values.dtype:
+            return self.values.copy() if copy else self.values
+        return self.values.astype(dtype)
+
+    def __getitem__(self, key):
+        values = self.values[key]
+        if np.ndim(values) == 0:
+            return values
+        if not self.mixed:
+            return UnitArray(values, units=self.units)
+        return UnitArray(values, units=self.units, unit_codes=self.unit_codes[key])
+
+    def __repr__(self):
+        if self.mixed:
+            return f"UnitArray({self.values!r}, units={self.units!r}, unit_codes={self.unit_codes!r})"
+        return f"UnitArray({self.values!r}, unit={self.units[0]!r})"
+
+    def element_units(self):
+        """
+        Get a str ndarray containing the unit of every element
+        """
+        if not self.mixed:
+            return np.full(self.shape, self.units[0])
+        return np.asarray(self.units)[self.unit_codes]
+
+    def unit_mask(self, unit):
+        """
+        Get a boolean array which is True for elements with the given unit
+        """
+        unit = _unit_string(unit)
+        if not self.mixed:
+            return np.full(self.shape, self.units[0] == unit)
+        if unit not in self.units:
+            return np.zeros(self.shape, dtype=bool)
+        return self.unit_codes == self.units.index(unit)
+
+    def verify_unit(self, unit):
+        """
+        Check that every element either has the given unit or no unit at all,
+        like normalize_numeric_verify_unit() does for single values.
+        Raises InvalidUnitInContextException otherwise.
+
+        Returns the values ndarray.
+        """
+        unit = _unit_string(unit)
+        invalid = [u for u in self.units if u and u != unit]
+        if invalid and (not self.mixed or np.any(np.isin(
+                self.unit_codes, [self.units.index(u) for u in invalid]))):
+            raise InvalidUnitInContextException(f"Invalid unit: Expected {unit} but found {invalid[0]}")
+        return self.values
+
+    def convert_to(self, unit, unit_factors):
+        """
+        Express the values in the given unit.
+
+        unit_factors maps units to their factor relative to the SI base unit,
+        e.g. EngineerLengthIO().unit_factors. As the values are already
+        normalized to the base unit, this is a single division.
+        """
+        unit = _unit_string(unit)
+        try:
+            factor = unit_factors[unit]
+        except KeyError:
+            raise InvalidUnitInContextException(f"Unknown unit: {unit}") from None
+        return UnitArray(self.values / factor, unit=unit)
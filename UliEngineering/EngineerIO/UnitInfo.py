@@ -3,7 +3,8 @@
 """
 Unit information dataclass for UliEngineering
 """
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
+from types import MappingProxyType
 from typing import Dict, List, Union
 
 @dataclass
@@ -86,11 +87,85 @@ class UnitInfo:
         return [self.canonical] + self.aliases
 
 
-@dataclass
+@dataclass(eq=False)
 class EngineerIOConfiguration:
+    """
+    Units, unit prefixes and SI prefixes known to an EngineerIO instance.
+
+    Two configurations with the same content compare equal and
+    have the same hash (see cache_key()), so EngineerIO can share
+    the tables compiled from a configuration between instances.
+    """
     units: List[Union[UnitInfo, UnitAlias]] = field()
     unit_prefixes: List[str] = field()
     si_prefix_map: Dict[str, float] = field()
+
+    def cache_key(self) -> tuple:
+        """
+        Returns a hashable snapshot of the configuration content.
+
+        For frozen configurations, the key is only computed once.
+        """
+        key = self.__dict__.get("_cache_key")
+        if key is not None:
+            return key
+        units = tuple(
+            (type(unit).__name__, unit.canonical,
+             getattr(unit, "factor", None), tuple(unit.aliases))
+            for unit in self.units
+        )
+        # Order of si_prefix_map doesn't matter, but keys may be of mixed types
+        si_prefixes = tuple(sorted(self.si_prefix_map.items(), key=repr))
+        key = (units, tuple(self.unit_prefixes), si_prefixes)
+        if self.frozen:
+            object.__setattr__(self, "_cache_key", key)
+        return key
+
+    @property
+    def frozen(self) -> bool:
+        return self.__dict__.get("_frozen", False)
+
+    def freeze(self) -> 'EngineerIOConfiguration':
+        """
+        Make this configuration immutable: The lists are converted to tuples,
+        si_prefix_map to a read-only mapping and assigning attributes
+        raises FrozenInstanceError.
+
+        Note that the UnitInfo objects themselves are not frozen,
+        so they must not be modified after freezing.
+
+        Returns self so it can be chained.
+        """
+        if not self.frozen:
+            object.__setattr__(self, "units", tuple(self.units))
+            object.__setattr__(self, "unit_prefixes", tuple(self.unit_prefixes))
+            object.__setattr__(self, "si_prefix_map", MappingProxyType(dict(self.si_prefix_map)))
+            object.__setattr__(self, "_frozen", True)
+        return self
+
+    def __setattr__(self, name, value):
+        if self.frozen:
+            raise FrozenInstanceError(f"cannot assign to field '{name}' of frozen configuration")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if self.frozen:
+            raise FrozenInstanceError(f"cannot delete field '{name}' of frozen configuration")
+        object.__delattr__(self, name)
+
+    def __reduce__(self):
+        # Read-only mappings can't be pickled
+        args = (type(self), list(self.units), list(self.unit_prefixes),
+                dict(self.si_prefix_map), self.frozen)
+        return (_restore_configuration, args)
+
+    def __eq__(self, other):
+        if not isinstance(other, EngineerIOConfiguration):
+            return NotImplemented
+        return self.cache_key() == other.cache_key()
+
+    def __hash__(self):
+        return hash(self.cache_key())
     
     @classmethod
     def default(cls) -> 'EngineerIOConfiguration':
@@ -109,3 +184,10 @@ class EngineerIOConfiguration:
             unit_prefixes=default_unit_prefixes(),
             si_prefix_map=default_si_prefix_map()
         )
+
+def _restore_configuration(cls, units, unit_prefixes, si_prefix_map, frozen):
+    """
+    Unpickle an EngineerIOConfiguration, see EngineerIOConfiguration.__reduce__
+    """
+    config = cls(units=units, unit_prefixes=unit_prefixes, si_prefix_map=si_prefix_map)
+    return config.freeze() if frozen else config
@@ -3,15 +3,17 @@
 """
 Utilities for volume
 """
+from functools import cached_property, lru_cache
 from numpy import ndarray
-import scipy.constants
 import numpy as np
 
 from UliEngineering.EngineerIO.Types import NormalizeResult
 from . import EngineerIO
+from .Conversion import ConversionTable
 from .Decorators import returns_unit
 from .UnitInfo import EngineerIOConfiguration, UnitAlias, UnitInfo
-from .Defaults import default_si_prefix_map
+from .Defaults import (default_si_prefix_map, INCH, FOOT, YARD, ASTRONOMICAL_UNIT,
+                       LIGHT_YEAR, PARSEC, BOHR_RADIUS, PLANCK_LENGTH)
 
 __all__ = ["normalize_volume", "convert_volume_to_cubic_meters", "EngineerVolumeIO"]
 
@@ -29,9 +31,9 @@ def volume_unit_infos():
         UnitAlias('nm³', aliases=['nm^3', 'cubic nanometer', 'cubic nanometers', 'cubic nm', 'cu nm', 'nm cu', 'nm cubed', 'nanometer cubed', 'nanometers cubed']),
         
         # Imperial volume units
-        UnitInfo('in³', scipy.constants.inch**3, ['in^3', 'cubic inch', 'cubic inches', 'cu in']),
-        UnitInfo('ft³', scipy.constants.foot**3, ['ft^3', 'cubic foot', 'cubic feet', 'cu ft']),
-        UnitInfo('yd³', scipy.constants.yard**3, ['yd^3', 'cubic yard', 'cubic yards', 'cu yd']),
+        UnitInfo('in³', INCH**3, ['in^3', 'cubic inch', 'cubic inches', 'cu in']),
+        UnitInfo('ft³', FOOT**3, ['ft^3', 'cubic foot', 'cubic feet', 'cu ft']),
+        UnitInfo('yd³', YARD**3, ['yd^3', 'cubic yard', 'cubic yards', 'cu yd']),
         
         # Liquid volume units (US liquid measurements)
         UnitInfo('L', 0.001, ['liter', 'liters', 'litre', 'litres']),
@@ -48,20 +50,21 @@ def volume_unit_infos():
         
         # Scientific units
         UnitInfo('Å³', 1e-30, ['angstrom cubed', 'angstrom^3', 'A^3', 'A³']),
-        UnitInfo('bohr³', (scipy.constants.physical_constants['Bohr radius'][0])**3, 
+        UnitInfo('bohr³', BOHR_RADIUS**3, 
                 ['bohr cubed', 'bohr^3', 'a0³', 'a0^3', 'atomic unit of volume']),
         
         # Astronomical units
-        UnitInfo('AU³', (scipy.constants.au)**3, ['AU^3', 'astronomical unit cubed']),
-        UnitInfo('pc³', (scipy.constants.parsec)**3, ['parsec cubed', 'parsec^3']),
-        UnitInfo('ly³', (scipy.constants.c * scipy.constants.Julian_year)**3, 
+        UnitInfo('AU³', ASTRONOMICAL_UNIT**3, ['AU^3', 'astronomical unit cubed']),
+        UnitInfo('pc³', PARSEC**3, ['parsec cubed', 'parsec^3']),
+        UnitInfo('ly³', LIGHT_YEAR**3, 
                 ['light year cubed', 'light-year cubed', 'ly^3', 'lightyear³']),
         
         # Planck volume
-        UnitInfo('lP³', (scipy.constants.physical_constants['Planck length'][0])**3, 
+        UnitInfo('lP³', PLANCK_LENGTH**3, 
                 ['Planck volume', 'planck volume', 'lp^3', 'lp³']),
     ]
 
+@lru_cache(maxsize=None)
 def _create_volume_config():
     """
     Create a custom EngineerIOConfiguration for volume units with extended SI prefixes
@@ -71,27 +74,18 @@ def _create_volume_config():
         units=volume_unit_infos(),
         unit_prefixes=config.unit_prefixes,
         si_prefix_map=default_si_prefix_map(include_length_unit_prefixes=True)
-    )
+    ).freeze()
 
 class EngineerVolumeIO(EngineerIO):
     """
     EngineerIO subclass specialized for volume unit parsing and conversion.
     """
+    _unit_normalizer = "normalize_volume"
     
-    _instance = None
     
-    def __init__(self):
-        # Use volume-specific configuration
-        super().__init__(config=_create_volume_config())
-    
-    @classmethod
-    def instance(cls):
-        """
-        Get the singleton instance of EngineerVolumeIO
-        """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+    def __init__(self, config=None, **kwargs):
+        # Use volume-specific configuration by default
+        super().__init__(config=_create_volume_config() if config is None else config, **kwargs)
     
     @returns_unit("m³")
     def normalize_volume(self, s):
@@ -133,14 +127,26 @@ class EngineerVolumeIO(EngineerIO):
         else: # No need to modify
             return result.value
     
+    @cached_property
+    def conversion_table(self):
+        """
+        Factors from every volume unit (with SI prefix) to the SI base unit,
+        computed on first use
+        """
+        return ConversionTable(self, self.normalize_volume)
+
     @returns_unit("m³")
     def convert_volume_to_cubic_meters(self, value, unit):
         """
         Given a number or Engineer string (unit ignored) <value>
         in <unit>, convert it to cubic meters.
+
+        value may also be a list or ndarray of numbers and unit
+        may be an array of unit strings (converted element-wise).
         """
-        # Currently a hack, but doing it directly will not parse SI units
-        return self.normalize_volume(f"{value} {unit}")
+        if isinstance(value, (str, bytes)):
+            return self.normalize_volume(f"{value} {unit}")
+        return self.conversion_table.to_base(value, unit)
 
 
 @returns_unit("m³")
@@ -18,7 +18,10 @@ Usage example:
 
 Originally published at techoverflow.net.
 """
-from functools import partial
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
+from functools import lru_cache, partial
+import inspect
 import math
 import re
 from typing import List, Optional
@@ -34,19 +37,71 @@ from ..Exceptions import (FirstCharacterInStringIsUnitPrefixException,
                           MultipleUnitPrefixesException,
                           RemainderOfStringContainsNonNumericCharacters)
 from ..Utils.NaN import none_to_nan
-from .Types import NormalizeResult, SplitResult, UnitSplitResult
+from .Buffer import iter_field_chunks
+from .Bulk import as_bulk_array, bulk_apply, parse_plain_numbers, unique_inverse
+from .Cache import LRUCache
+from .Parallel import parallel_normalize_numeric as _parallel_normalize_numeric
+from .Registry import create_instance, prewarm
+from .Stats import ParseStats
+from .Stream import column_extractor, iter_blocks
+from .Tokenizer import ScanTokenizer
+from .Trie import SuffixTrie
+from .Types import NormalizeResult, ParseErrorCode, SplitResult, UnitSplitResult
+from .UnitArray import UnitArray
 from .UnitInfo import EngineerIOConfiguration, UnitAlias, UnitInfo
 
 __all__ = ["EngineerIO",
-           "auto_format", "normalize_numeric", "format_value", "auto_print",
+           "auto_format", "normalize_numeric", "format_value", "format_array", "auto_print",
            "normalize_engineer_notation", "normalize_engineer_notation_safe",
-           "normalize_numeric_verify_unit", "SplitResult"]
+           "normalize_numeric_verify_unit", "try_normalize_array", "normalize_buffer",
+           "parallel_normalize_numeric", "prewarm", "normalize_stream", "normalize_array", "UnitArray",
+           "SplitResult", "ParseErrorCode"]
+
+# Marker for regexes which have not been compiled yet
+_NOT_COMPILED = object()
+# Numbers accepted by float(), restricted to the characters
+# which can remain after splitting (see EngineerIO._numeric_allowed)
+_float_regex = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:e[+-]?[0-9]+)?\Z")
+
+# Attributes computed by EngineerIO._compile_configuration().
+# They only depend on the configuration, so instances with
+# equal configurations share them (see _compiled_configurations)
+_COMPILED_ATTRIBUTES = (
+    "_numeric_allowed", "_interpunct_transform_map",
+    "units", "unit_aliases", "unit_factors",
+    "unit_prefix_map", "unit_prefixes", "prefix_re", "unit_prefix_re",
+    "strippable", "all_unit_prefixes",
+    "exp_unit_prefix_map", "unit_prefix_exp_map", "exp_map_min", "exp_map_max",
+    "units_trie", "unit_alias_trie", "unit_prefix_suffix_trie", "_scanner",
+)
+# Compiled attributes by EngineerIOConfiguration.cache_key()
+_compiled_configurations = LRUCache(64)
+
+@lru_cache(maxsize=None)
+def _default_configuration():
+    """
+    Frozen default configuration, shared by all instances
+    which are created without an explicit configuration
+    """
+    return EngineerIOConfiguration.default().freeze()
+
 class EngineerIO(object):
     _instance: Optional["EngineerIO"] = None
     """
     Default instance, used for global functions. Initialized on first use
     """
-    def __init__(self, config: Optional[EngineerIOConfiguration] = None):
+    _read_only: bool = False
+    """
+    True for the shared instances (see Registry.py), whose parse
+    configuration can't be modified
+    """
+    _unit_normalizer: Optional[str] = None
+    """
+    Name of the method which normalizes a single value in the unit of
+    this class, if it differs from normalize_numeric() (e.g. squared
+    prefixes for areas). Used by parallel_normalize_numeric()
+    """
+    def __init__(self, config: Optional[EngineerIOConfiguration] = None, cache_size: Optional[int] = None, engine: str = "regex"):
         """
         Initialize a new EngineerIO instance with configuration object
 
@@ -55,11 +110,45 @@ class EngineerIO(object):
         config : EngineerIOConfiguration, optional
             Configuration object containing unit information, prefixes, and SI prefix mappings.
             If None, uses default configuration.
+        cache_size : int, optional
+            If given, memoize up to this many normalize() results (LRU eviction).
+            By default, no cache is used.
+        engine : str, optional
+            Parse engine used by split_input(): "regex" (default) or
+            "scan" (single-pass tokenizer, see Tokenizer.py).
+            Both produce identical results.
         """
         # Use default configuration if none provided
         if config is None:
-            config = EngineerIOConfiguration.default()
-            
+            config = _default_configuration()
+        # Instances with identical configurations share the compiled tables
+        key = config.cache_key()
+        compiled = _compiled_configurations.get(key)
+        if compiled is None:
+            self._compile_configuration(config)
+            compiled = {name: getattr(self, name) for name in _COMPILED_ATTRIBUTES}
+            _compiled_configurations.put(key, compiled)
+        else:
+            self.__dict__.update(compiled)
+        self.config = config
+        # Regexes are only compiled on first access (see units_regex etc)
+        self._unit_alias_regex = _NOT_COMPILED
+        self._units_regex = _NOT_COMPILED
+        self._unit_prefix_suffix_regex = _NOT_COMPILED
+        # Optional parse result cache
+        self._cache = LRUCache(cache_size) if cache_size else None
+        # Optional parse path statistics (see enable_stats())
+        self._stats = None
+        self.set_engine(engine)
+
+    def _compile_configuration(self, config):
+        """
+        Build the unit, prefix & interpunctation tables from config.
+
+        The resulting attributes (see _COMPILED_ATTRIBUTES) are shared
+        between all instances created from an equal configuration,
+        so they must not be modified in place.
+        """
         self._numeric_allowed = set("+0123456789-e.")
         
         # Interpunctation config. Default allows both comma and dot as decimal separators, and handles thousands separators correctly
@@ -84,7 +173,8 @@ class EngineerIO(object):
                 for alias in unit_info.aliases:
                     self.unit_aliases[alias] = unit_info.canonical
         
-        self.unit_prefix_map = config.si_prefix_map
+        self.unit_prefix_map = dict(config.si_prefix_map)
+        self.unit_prefixes = list(config.unit_prefixes)
         # Build prefix regex
         _prefix_set = "|".join(re.escape(pfx) for pfx in config.unit_prefixes)
         self.prefix_re = re.compile('^(' + _prefix_set + ')+')
@@ -96,12 +186,233 @@ class EngineerIO(object):
         # Compute maps
         self.all_unit_prefixes = set(self.unit_prefix_map.keys())
         self._recompute_unit_prefix_maps()
-        # Compile unit alias regex
-        self._compile_unit_alias_regex()
-        # Compile units regex
-        self._compile_units_regex()
-        # Compile unit prefix regex
-        self._compile_unit_prefix_suffix_regex()
+        # Build suffix tries for unit, alias & unit prefix matching
+        self._build_suffix_tries()
+        # The scan tokenizer is also used by the non-raising APIs
+        self._scanner = ScanTokenizer(self)
+
+    def _construction_args(self):
+        """
+        Returns (class, keyword arguments) to create an equivalent
+        instance, e.g. in another process.
+        Subclasses which don't accept a config argument
+        create their own configuration.
+        """
+        kwargs = {"engine": self.engine}
+        if "config" in inspect.signature(type(self).__init__).parameters:
+            kwargs["config"] = self.config
+        return type(self), kwargs
+
+    def set_engine(self, engine):
+        """
+        Select the parse engine used by split_input():
+        "regex" or "scan" (single-pass tokenizer)
+        """
+        self._check_writable()
+        if engine == "regex":
+            self._tokenizer = None
+        elif engine == "scan":
+            self._tokenizer = self._scanner
+        else:
+            raise ValueError(f"Unknown parse engine: {engine}")
+        self.engine = engine
+
+    def enable_cache(self, maxsize=4096):
+        """
+        Memoize the results of normalize() for strings,
+        keyed by (string, prefix_exponent).
+        Replaces any existing cache.
+        """
+        self._cache = LRUCache(maxsize)
+
+    def disable_cache(self):
+        """
+        Disable and discard the normalize() cache
+        """
+        self._cache = None
+
+    def cache_info(self):
+        """
+        Get a CacheInfo with hit/miss/eviction statistics of the normalize() cache.
+        Returns None if caching is disabled.
+        """
+        return self._cache.info() if self._cache is not None else None
+
+    def cache_clear(self):
+        """
+        Remove all entries from the normalize() cache and reset its statistics
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def enable_stats(self):
+        """
+        Record which parse paths normalize() takes, see Stats.py.
+        Replaces any existing statistics.
+        """
+        self._stats = ParseStats()
+
+    def disable_stats(self):
+        """
+        Stop recording and discard the parse path statistics
+        """
+        self._stats = None
+
+    def stats(self):
+        """
+        Get the parse path statistics of this instance as a dict with the keys
+        - "calls": PathStats of all normalize() calls
+        - "branches": dict of split_input() branch name => PathStats
+        - "exceptions": dict of exception type name => PathStats
+        Every PathStats contains a count, the total time and a duration histogram.
+        Returns None if statistics are disabled (see enable_stats()).
+
+        Only normalize() calls (including normalize_numeric(), safe_normalize(),
+        decorated functions, ...) are recorded, not the try_normalize_array()
+        engine.
+        """
+        return self._stats.snapshot() if self._stats is not None else None
+
+    def reset_stats(self):
+        """
+        Reset the parse path statistics
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def add_unit(self, unit: UnitInfo):
+        """
+        Register a unit (including its aliases) with this instance.
+        See add_units() for details.
+        """
+        if not isinstance(unit, UnitInfo):
+            raise TypeError(f"Expected UnitInfo, not {type(unit).__name__}")
+        self.add_units((unit,))
+
+    def add_alias(self, alias: UnitAlias):
+        """
+        Register aliases of an existing unit with this instance.
+        See add_units() for details.
+        """
+        if not isinstance(alias, UnitAlias):
+            raise TypeError(f"Expected UnitAlias, not {type(alias).__name__}")
+        self.add_units((alias,))
+
+    def add_units(self, units):
+        """
+        Register multiple UnitInfo and UnitAlias objects at once.
+
+        Only the entries of the new units & aliases are inserted into the
+        lookup tables, nothing is recompiled. Units & aliases which
+        already exist are replaced. self.config is updated accordingly.
+
+        The tables are shared between all instances with the same
+        configuration, so they are copied before the first modification
+        of an instance. Afterwards, registering n units costs O(n).
+        Use batch_update() to combine multiple calls.
+
+        Instances are not locked while they are modified. The shared
+        instances (EngineerIO.instance()) are read-only, see _check_writable().
+        """
+        with self.batch_update():
+            for unit in units:
+                if isinstance(unit, UnitInfo):
+                    self.units.add(unit.canonical)
+                    self.unit_factors[unit.canonical] = unit.factor
+                    self.units_trie.add(unit.canonical)
+                elif not isinstance(unit, UnitAlias):
+                    raise TypeError(f"Expected UnitInfo or UnitAlias, not {type(unit).__name__}")
+                for alias in unit.aliases:
+                    self.unit_aliases[alias] = unit.canonical
+                    self.unit_alias_trie.add(alias, unit.canonical)
+                self._pending_units.append(unit)
+
+    def remove_unit(self, canonical: str):
+        """
+        Unregister a unit and all aliases which map to it
+        (both UnitInfo aliases and UnitAlias objects).
+        Raises KeyError if there is no such unit or alias.
+        """
+        with self.batch_update():
+            aliases = [alias for alias, unit in self.unit_aliases.items() if unit == canonical]
+            if canonical not in self.units and not aliases:
+                raise KeyError(f"Unknown unit: {canonical}")
+            if canonical in self.units:
+                self.units.remove(canonical)
+                del self.unit_factors[canonical]
+                self.units_trie.remove(canonical)
+            for alias in aliases:
+                del self.unit_aliases[alias]
+                self.unit_alias_trie.remove(alias)
+            self._pending_units = [unit for unit in self._pending_units
+                                   if unit.canonical != canonical]
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Context manager combining multiple add_unit(), add_alias(),
+        add_units() and remove_unit() calls. The configuration and
+        the tokenizer are only updated once, when leaving the
+        outermost batch_update() block.
+        """
+        self._check_writable()
+        depth = self.__dict__.get("_batch_depth", 0)
+        if depth == 0:
+            self._copy_unit_tables()
+            self._pending_units = list(self.config.units)
+        self._batch_depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._batch_depth = depth
+            if depth == 0:
+                self._finish_unit_update()
+
+    def _check_writable(self):
+        """
+        Raise FrozenInstanceError if this is a shared instance, because
+        modifying it would affect all of its users in this process.
+        The opt-in cache & statistics (enable_cache(), ...) can still be used.
+        """
+        if self._read_only:
+            name = type(self).__name__
+            raise FrozenInstanceError(
+                f"The shared {name} instance is read-only. "
+                f"Create and configure a private instance instead, e.g. {name}(engine=...)")
+
+    def _copy_unit_tables(self):
+        """
+        Copy the unit tables which are shared with other instances
+        (see _compiled_configurations) before modifying them
+        """
+        if self.__dict__.get("_owns_unit_tables"):
+            return
+        self.units = set(self.units)
+        self.unit_aliases = dict(self.unit_aliases)
+        self.unit_factors = dict(self.unit_factors)
+        self.units_trie = SuffixTrie(self.units)
+        self.unit_alias_trie = SuffixTrie(self.unit_aliases)
+        self._owns_unit_tables = True
+
+    def _finish_unit_update(self):
+        """
+        Update everything derived from the unit tables
+        after add_units() or remove_unit()
+        """
+        config = EngineerIOConfiguration(
+            units=self._pending_units,
+            unit_prefixes=list(self.config.unit_prefixes),
+            si_prefix_map=dict(self.config.si_prefix_map))
+        self.config = config.freeze() if self.config.frozen else config
+        del self._pending_units
+        # The tokenizer references the tries, which may have been copied
+        self._scanner = ScanTokenizer(self)
+        self.set_engine(self.engine)
+        self._unit_alias_regex = _NOT_COMPILED
+        self._units_regex = _NOT_COMPILED
+        # Derived tables of subclasses (see e.g. EngineerLengthIO)
+        self.__dict__.pop("conversion_table", None)
+        self.cache_clear()
 
     def _recompute_unit_prefix_maps(self):
         """
@@ -132,6 +443,46 @@ class EngineerIO(object):
             self.exp_map_min = 0
             self.exp_map_max = 0
             
+    def _build_suffix_tries(self):
+        """
+        Build the reversed-suffix tries used to find units, unit aliases
+        and unit prefixes at the end of strings.
+        Lookup cost is independent of the number of units.
+        """
+        self.units_trie = SuffixTrie(self.units)
+        self.unit_alias_trie = SuffixTrie(self.unit_aliases)
+        self.unit_prefix_suffix_trie = SuffixTrie(self.all_unit_prefixes)
+
+    @property
+    def unit_alias_regex(self):
+        """
+        Regex matching unit aliases at the end of strings.
+        Not used for parsing (see unit_alias_trie), compiled on first access.
+        """
+        if self._unit_alias_regex is _NOT_COMPILED:
+            self._compile_unit_alias_regex()
+        return self._unit_alias_regex
+
+    @property
+    def units_regex(self):
+        """
+        Regex matching units at the end of strings.
+        Not used for parsing (see units_trie), compiled on first access.
+        """
+        if self._units_regex is _NOT_COMPILED:
+            self._compile_units_regex()
+        return self._units_regex
+
+    @property
+    def unit_prefix_suffix_regex(self):
+        """
+        Regex matching unit prefixes at the end of strings.
+        Not used for parsing (see unit_prefix_suffix_trie), compiled on first access.
+        """
+        if self._unit_prefix_suffix_regex is _NOT_COMPILED:
+            self._compile_unit_prefix_suffix_regex()
+        return self._unit_prefix_suffix_regex
+
     def _generate_unit_alias_pattern(self):
         """
         Generate a regex pattern to match unit aliases at the end of strings.
@@ -154,11 +505,11 @@ class EngineerIO(object):
         """
         pattern = self._generate_unit_alias_pattern()
         if pattern is None:
-            self.unit_alias_regex = None
+            self._unit_alias_regex = None
             return
         
         # NOTE: Needs to be case-sensitive for some special units
-        self.unit_alias_regex = re.compile(pattern, flags=re.UNICODE)
+        self._unit_alias_regex = re.compile(pattern, flags=re.UNICODE)
 
     def _generate_units_pattern(self):
         """
@@ -182,18 +533,18 @@ class EngineerIO(object):
         """
         pattern = self._generate_units_pattern()
         if pattern is None:
-            self.units_regex = None
+            self._units_regex = None
             return
         
         # NOTE: Needs to be case-sensitive for some special units
-        self.units_regex = re.compile(pattern, flags=re.UNICODE)
+        self._units_regex = re.compile(pattern, flags=re.UNICODE)
 
     def _compile_unit_prefix_suffix_regex(self):
         """
         Compile a regex pattern to match unit prefixes at the end of strings.
         """
         if not self.all_unit_prefixes:
-            self.unit_prefix_suffix_regex = None
+            self._unit_prefix_suffix_regex = None
             return
         
         # Sort unit prefixes by length (longest first) to ensure proper matching
@@ -204,7 +555,7 @@ class EngineerIO(object):
         pattern = f"({'|'.join(escaped_prefixes)})$"
         
         # NOTE: Needs to be case-sensitive for unit prefixes
-        self.unit_prefix_suffix_regex = re.compile(pattern, flags=re.UNICODE)
+        self._unit_prefix_suffix_regex = re.compile(pattern, flags=re.UNICODE)
 
     def _resolve_unit_alias(self, unit):
         """
@@ -220,18 +571,13 @@ class EngineerIO(object):
         - unit_prefix_char: the unit prefix character found (or empty string)
         - remainder: the string with the unit prefix removed (or original string)
         """
-        if not self.unit_prefix_suffix_regex:
-            return False, "", s
-        
-        match = self.unit_prefix_suffix_regex.search(s)
-        if match:
-            unit_prefix_char = match.group(1)
-            remainder = s[:match.start()]
-            return True, unit_prefix_char, remainder
-        
+        match = self.unit_prefix_suffix_trie.match(s)
+        if match is not None:
+            start, _, unit_prefix_char = match
+            return True, unit_prefix_char, s[:start]
         return False, "", s
 
-    def split_input(self, s):
+    def split_input(self, s, trace=None):
         """
         Separate a string into a number, suffix and unit plus prefixes.
         Does not try to parse the numbers.
@@ -247,12 +593,19 @@ class EngineerIO(object):
 
         Thousands separators and suffix-as-decimal-separators may NOT
         be mixed. Whitespace is removed automatically.
+
+        If trace is a list, the names of the branches taken
+        are appended to it (see Stats.py).
         """
+        if self._tokenizer is not None:
+            return self._tokenizer.split(s, trace)
         orig_str = s
+        if trace is not None and "," in s:
+            trace.append("interpunctation")
         # Remove thousands separator & ensure dot is used
         s = self.normalize_interpunctation(s)
         # Split off unit: "120kV" => "120k", "V"
-        split_result = self.split_unit(s)
+        split_result = self.split_unit(s, trace)
         # Print remainder
         s = split_result.remainder
         s = s.replace(" ", "")
@@ -263,6 +616,8 @@ class EngineerIO(object):
             prefix = prefix_hit.group(0)
             # Remove prefix
             s = self.prefix_re.sub("", s)
+            if trace is not None:
+                trace.append("leading_prefix")
         else:
             prefix = ""
         # Check string
@@ -272,6 +627,8 @@ class EngineerIO(object):
         string_is_suffixed_by_unit_prefix, unit_prefix_char, remainder = self.has_any_unit_prefix(s)
         if string_is_suffixed_by_unit_prefix: # e.g. "2.5k" is terminated by "k"
             s = remainder
+            if trace is not None:
+                trace.append("suffix_si_prefix")
         else:  # Try to find unit prefix anywhere, e.g. in the middle
             # Check every character in the string for being a SI prefix
             is_unit_prefix_list: List[bool] = [(ch in self.all_unit_prefixes) for ch in s]
@@ -295,6 +652,8 @@ class EngineerIO(object):
                     unit_prefix_index = is_unit_prefix_list.index(True)
                     unit_prefix_char = detected_prefixes[0]
                     # Leave unitPrefixIndex as the first True index
+                    if trace is not None:
+                        trace.append("cm_rule")
                 else: # Special rule does not apply => fail!
                     raise MultipleUnitPrefixesException(f"More than one SI unit prefix in the string '{s}'. Orig str: {orig_str}, Detected unit prefixes: '{detected_prefixes}'")
             else: # unit_prefix_count == 0
@@ -303,12 +662,16 @@ class EngineerIO(object):
             # Perform additional checks & conversions for prefix-as-decimal-separator
             if unit_prefix_char:
                 # Unit prefix found in the middle of the string such as "1k25"
+                if trace is not None:
+                    trace.append("mid_string_si_prefix")
                 # Check if unit prefix is between two digits (prefix-as-decimal-separator)
                 unit_prefix_char = s[unit_prefix_index]
                 is_between_digits = (unit_prefix_index > 0 and unit_prefix_index < len(s) - 1 and
                                     s[unit_prefix_index - 1].isdigit() and s[unit_prefix_index + 1].isdigit())
                 
                 if is_between_digits:
+                    if trace is not None:
+                        trace.append("prefix_as_decimal")
                     # Unit prefix-as-decimal-separator --> there must be no other decimal separator
                     if "." in s:  # Comma-to-dot conversion already handled by normalize_interpunctation
                         raise ValueError(f"Unit prefix as decimal separator, but dot is also in string: {s}")
@@ -328,39 +691,41 @@ class EngineerIO(object):
             unit=split_result.unit
         )
 
-    def split_unit(self, s):
+    def split_unit(self, s, trace=None):
         """
         Split a string into (remainder, unit).
         Only units in the units set are recognized
         unit may be '' if no unit is recognized
+
+        If trace is a list, the names of the branches taken
+        are appended to it (see Stats.py).
         """
         # Fallback for strings which are too short
         if len(s) <= 1:
             return UnitSplitResult(s, '', '')
         # Check for unit aliases first
-        if self.unit_alias_regex:
-            alias_match = self.unit_alias_regex.search(s)
-            if alias_match:
-                alias = alias_match.group(1)
-                canonical_unit = self._resolve_unit_alias(alias)
+        if self.unit_alias_trie:
+            alias_match = self.unit_alias_trie.match(s)
+            if alias_match is not None:
+                start_idx, end_idx, canonical_unit = alias_match
                 # NOTE: We need to replace the unit alias by the unit explicitly
                 # (and let the rest of the code handle it).
                 # This is since the aliased unit may contain a SI prefix such as
                 # "sq cm" => "cm²"
                 # Hence, we need to replace the matched alias by the unit 
                 # in the string, and the safest way to do that is to use the match indexes
-                start_idx = alias_match.start(1)
-                end_idx = alias_match.end(1)
                 # Modify the string in-place
                 s = s[:start_idx] + canonical_unit + s[end_idx:]
+                if trace is not None:
+                    trace.append("alias")
                 # Now continue with the loop
         
-        # Check for units using compiled regex
-        if self.units_regex:
-            unit_match = self.units_regex.search(s)
-            if unit_match:
-                unit = unit_match.group(1)
-                remainder = s[:unit_match.start()].strip()
+        # Check for units using the suffix trie
+        if self.units_trie:
+            unit_match = self.units_trie.match(s)
+            if unit_match is not None:
+                unit_start, _, unit = unit_match
+                remainder = s[:unit_start].strip()
                 # Remove unit prefix, if any
                 unit_prefix_hit = self.unit_prefix_re.search(remainder)
                 if unit_prefix_hit:
@@ -370,6 +735,10 @@ class EngineerIO(object):
                     remainder = self.unit_prefix_re.sub("", remainder)
                 else:
                     unit_prefix = ""
+                if trace is not None:
+                    trace.append("unit")
+                    if unit_prefix:
+                        trace.append("unit_prefix")
                 # Remove extra whitespace
                 remainder = remainder.rstrip(self.strippable)
                 return UnitSplitResult(remainder, unit_prefix, unit)
@@ -385,6 +754,8 @@ class EngineerIO(object):
             unit_prefix = unit_prefix_hit.group(0)
             # Remove unit_prefix
             value_str = self.unit_prefix_re.sub("", value_str)
+            if trace is not None:
+                trace.append("unit_prefix")
         else:
             unit_prefix = ""
         # Remove extra whitespace
@@ -400,6 +771,10 @@ class EngineerIO(object):
         
         prefix_exponent is used for converting area & volume units etc
 
+        If caching is enabled (see enable_cache()), results for strings
+        are memoized. Cached NormalizeResult instances are shared between
+        calls and must not be modified.
+
         See split_input() for further details on supported formats
         """
         if s is None:
@@ -413,8 +788,32 @@ class EngineerIO(object):
         # Handle lists / array
         if isinstance(s, (list, tuple, np.ndarray)):
             return [self.normalize(elem) for elem in s]
+        if self._stats is not None:
+            return self._stats.measure(self._normalize_cached, s, prefix_exponent)
+        return self._normalize_cached(s, prefix_exponent)
+
+    def _normalize_cached(self, s, prefix_exponent=1.0, trace=None):
+        """
+        Normalize a single (decoded) string using the cache, if enabled
+        """
+        cache = self._cache
+        if cache is None:
+            return self._normalize_string(s, prefix_exponent, trace)
+        key = (s, prefix_exponent)
+        result = cache.get(key)
+        if result is None:
+            result = self._normalize_string(s, prefix_exponent, trace)
+            cache.put(key, result)
+        elif trace is not None:
+            trace.append("cache_hit")
+        return result
+
+    def _normalize_string(self, s, prefix_exponent=1.0, trace=None):
+        """
+        Normalize a single (decoded) string. See normalize()
+        """
         # Perform splitting
-        split_result = self.split_input(s.strip())
+        split_result = self.split_input(s.strip(), trace)
         
         # Compute the factor to multiply with based on the SI prefix
         # e.g. "k" => 1e3, "m" => 1e-3
@@ -439,6 +838,273 @@ class EngineerIO(object):
             unit_factor=unit_factor
         )
 
+    def _try_normalize_scalar(self, v, encoding="utf8"):
+        """
+        Normalize a single value without raising.
+        Returns a tuple (value, ParseErrorCode, unit).
+        value is NaN if the value could not be normalized
+        """
+        if v is None:
+            return np.nan, ParseErrorCode.NONE, ""
+        if isinstance(v, (int, float, np.number)):
+            return v, ParseErrorCode.OK, ""
+        if isinstance(v, bytes):
+            try:
+                v = v.decode(encoding)
+            except UnicodeDecodeError:
+                return np.nan, ParseErrorCode.INVALID_TYPE, ""
+        if not isinstance(v, str):
+            return np.nan, ParseErrorCode.INVALID_TYPE, ""
+        split_result = self._scanner.scan(v.strip())
+        if not isinstance(split_result, SplitResult):
+            return np.nan, split_result, ""
+        # Check syntax to avoid exceptions in float()
+        if _float_regex.match(split_result.number) is None:
+            return np.nan, ParseErrorCode.INVALID_NUMBER, ""
+        prefix_multiplicator = 10 ** self.unit_prefix_exp_map[split_result.unit_prefix_char] if split_result.unit_prefix_char else 1
+        unit_factor = self.unit_factors.get(split_result.unit, 1.0) if split_result.unit else 1.0
+        return float(split_result.number) * prefix_multiplicator * unit_factor, ParseErrorCode.OK, split_result.unit
+
+    def try_normalize_array(self, arr, return_units=False, encoding="utf8"):
+        """
+        Normalize every element of an iterable without ever raising.
+        Intended for triaging large, dirty datasets.
+
+        Returns a tuple (values, errors) or, if return_units is True,
+        (values, errors, units) where
+        - values is a float64 ndarray (NaN where parsing failed)
+        - errors is an uint8 ndarray of ParseErrorCode values
+          (ParseErrorCode.OK == 0 for elements which were parsed successfully)
+        - units is a str ndarray containing the unit of each element
+          ('' if no unit was found or parsing failed)
+
+        All arrays have the same shape as the input.
+        Every distinct value is only parsed once. String arrays
+        containing only plain numbers are parsed natively by NumPy.
+        """
+        arr = self._asarray(arr)
+        values = arr.astype(np.float64) if arr.dtype.kind in "biuf" else parse_plain_numbers(arr)
+        if values is not None:
+            results = [values, np.zeros(arr.shape, dtype=np.uint8)]
+            if return_units:
+                results.append(np.zeros(arr.shape, dtype=str))
+            return tuple(results)
+        _, parsed, inverse = self._try_normalize_distinct(arr, encoding=encoding)
+        values = np.fromiter((result[0] for result in parsed), dtype=np.float64, count=len(parsed))
+        errors = np.fromiter((result[1] for result in parsed), dtype=np.uint8, count=len(parsed))
+        results = [values[inverse].reshape(arr.shape), errors[inverse].reshape(arr.shape)]
+        if return_units:
+            units = np.asarray([result[2] for result in parsed], dtype=str)
+            results.append(units[inverse].reshape(arr.shape))
+        return tuple(results)
+
+    @staticmethod
+    def _asarray(arr):
+        try:
+            return as_bulk_array(arr)
+        except ValueError: # e.g. ragged nested lists
+            return np.asarray(list(arr), dtype=object)
+
+    def _try_normalize_distinct(self, arr, encoding="utf8"):
+        """
+        Parse every distinct value of arr once using _try_normalize_scalar().
+        Returns (uniques, parsed, inverse) where parsed is a list of
+        (value, ParseErrorCode, unit) for each distinct value in uniques
+        and inverse maps the flattened elements of arr to these lists.
+        """
+        flat = arr.reshape(-1)
+        grouped = unique_inverse(flat)
+        if grouped is None: # Unhashable elements: parse every element
+            uniques, inverse = flat.tolist(), np.arange(flat.size)
+        else:
+            uniques, inverse = grouped
+        parsed = [self._try_normalize_scalar(value, encoding=encoding) for value in uniques]
+        return uniques, parsed, inverse
+
+    def normalize_array(self, arg, strict=True, encoding="utf8"):
+        """
+        Normalize every element of a list, tuple or ndarray and
+        keep track of the units, see UnitArray.
+
+        If strict is True, raise the exception normalize() would raise
+        for the first invalid element. Otherwise, invalid elements are NaN
+        (with no unit).
+        Every distinct value is only parsed once.
+        """
+        arr = self._asarray(arg)
+        values = arr if arr.dtype.kind in "biuf" else parse_plain_numbers(arr)
+        if values is not None:
+            return UnitArray(values)
+        uniques, parsed, inverse = self._try_normalize_distinct(arr, encoding=encoding)
+        unit_table = {}
+        codes = np.empty(len(parsed), dtype=np.intp)
+        for idx, result in enumerate(parsed):
+            if result[1] and strict:
+                # Raise the same exception as normalize_numeric()
+                self.normalize_numeric(uniques[idx])
+                raise ValueError(f"Can't normalize {uniques[idx]!r}")
+            codes[idx] = unit_table.setdefault(result[2], len(unit_table))
+        values = np.fromiter((result[0] for result in parsed), dtype=np.float64, count=len(parsed))
+        values = values[inverse].reshape(arr.shape)
+        if len(unit_table) <= 1:
+            return UnitArray(values, unit=next(iter(unit_table), ""))
+        codes = codes.astype(np.min_scalar_type(len(unit_table) - 1))
+        return UnitArray(values, units=list(unit_table), unit_codes=codes[inverse].reshape(arr.shape))
+
+    def normalize_buffer(self, buffer, delimiters=b"\n", out=None, strict=True,
+                         skip_empty=True, encoding="utf8", chunk_size=1 << 20):
+        """
+        Normalize all delimited fields in a byte buffer
+        (bytes, bytearray, memoryview, mmap, ...) to float values.
+
+        The buffer is split into fields in NumPy, without creating
+        a Python object per field. Only the distinct values of each
+        chunk are decoded and parsed (see try_normalize_array()).
+
+        Parameters:
+        -----------
+        buffer : bytes-like object
+            UTF-8 (or encoding) encoded text, e.g. a memory-mapped file
+        delimiters : bytes or str
+            Field delimiters. Every character is a delimiter on its own,
+            e.g. b",\n" for comma separated values. Only ASCII characters
+            are allowed. Whitespace around fields (including "\r") is ignored.
+        out : ndarray, optional
+            Preallocated float array the values are written to.
+            Raises ValueError if it is too small.
+        strict : bool
+            If True, raise the exception normalize() would raise for the
+            first invalid field. Otherwise, invalid fields are NaN.
+        skip_empty : bool
+            If True, empty fields are skipped. Otherwise they are
+            treated as invalid.
+        chunk_size : int
+            Approximate number of bytes processed at once
+
+        Returns:
+        --------
+        A float64 ndarray containing the values. If out is given,
+        this is the view of out which has been filled.
+        """
+        chunks = []
+        count = 0
+        for fields in iter_field_chunks(buffer, delimiters, chunk_size=chunk_size):
+            values, errors = self.try_normalize_array(fields, encoding=encoding)
+            if skip_empty:
+                nonempty = errors != ParseErrorCode.EMPTY
+                if not nonempty.all():
+                    fields, values, errors = fields[nonempty], values[nonempty], errors[nonempty]
+            if strict and errors.any():
+                self._raise_first_invalid(fields, errors, encoding=encoding)
+            if out is None:
+                chunks.append(values)
+            else:
+                if count + len(values) > len(out):
+                    raise ValueError(f"Output array is too small: Has {len(out)} elements, but buffer contains more fields")
+                out[count:count + len(values)] = values
+            count += len(values)
+        if out is not None:
+            return out[:count]
+        return np.concatenate(chunks) if chunks else np.zeros(0)
+
+    def _raise_first_invalid(self, fields, errors, encoding="utf8"):
+        """
+        Raise the exception normalize() raises for the first
+        field with a non-OK ParseErrorCode
+        """
+        invalid_field = fields[np.argmax(errors != ParseErrorCode.OK)]
+        self.normalize(invalid_field, encoding=encoding)
+        raise ValueError(f"Can't normalize {invalid_field!r}")
+
+    def normalize_stream(self, iterable, chunk_size=65536, strict=True,
+                         return_errors=False, skip_empty=False, encoding="utf8"):
+        """
+        Lazily normalize a (potentially endless) iterable of values,
+        e.g. lines read from a socket or a growing log file.
+
+        The iterable is consumed in blocks of chunk_size values.
+        Every block is normalized by the bulk engine (see try_normalize_array())
+        and yielded as soon as it is complete, so memory usage is bounded
+        by chunk_size regardless of the length of the stream.
+
+        Parameters:
+        -----------
+        iterable : iterable of str, bytes or numbers
+            The values to normalize. Surrounding whitespace is ignored.
+        chunk_size : int
+            Maximum number of values per yielded block
+        strict : bool
+            If True, raise the exception normalize() would raise for the
+            first invalid value. Otherwise, invalid values are NaN.
+        return_errors : bool
+            If True, yield (values, errors) tuples where errors is an uint8
+            ndarray of ParseErrorCode values (see try_normalize_array())
+        skip_empty : bool
+            If True, empty values are dropped from the output
+
+        Yields:
+        -------
+        A float64 ndarray per block or (values, errors) if return_errors is True.
+        Blocks contain fewer than chunk_size values if skip_empty is True
+        or at the end of the stream.
+        """
+        for block in iter_blocks(iterable, chunk_size):
+            fields = self._asarray(block)
+            values, errors = self.try_normalize_array(fields, encoding=encoding)
+            if skip_empty:
+                nonempty = errors != ParseErrorCode.EMPTY
+                if not nonempty.all():
+                    fields, values, errors = fields[nonempty], values[nonempty], errors[nonempty]
+            if strict and errors.any():
+                self._raise_first_invalid(fields, errors, encoding=encoding)
+            yield (values, errors) if return_errors else values
+
+    def normalize_column_stream(self, lines, extractcol=None, column=0, delimiter=",",
+                                isline=None, chunk_size=65536, strict=True,
+                                return_errors=False, encoding="utf8"):
+        """
+        Like normalize_stream(), but for an iterable of raw lines
+        (e.g. an open CSV file or socket.makefile()) from which
+        one column is extracted, similar to Utils.Files.extract_column().
+
+        Parameters:
+        -----------
+        lines : iterable of str or bytes
+            The raw lines
+        extractcol : callable, optional
+            Extracts the value from a line. Returning None marks the value
+            as invalid. By default, the given column is extracted after
+            splitting the line at delimiter.
+        column : int
+            The 0-based column index used if extractcol is None
+        delimiter : str or bytes
+            The column delimiter used if extractcol is None
+        isline : callable, optional
+            Lines for which isline(line) is False are ignored.
+            By default, empty or whitespace-only lines are ignored.
+
+        See normalize_stream() for the remaining parameters.
+        """
+        if extractcol is None:
+            extractcol = column_extractor(column, delimiter)
+        if isline is None:
+            isline = lambda line: bool(line.strip())
+        values = (extractcol(line) for line in lines if isline(line))
+        return self.normalize_stream(values, chunk_size=chunk_size, strict=strict,
+                                     return_errors=return_errors, encoding=encoding)
+
+    def parallel_normalize_numeric(self, arg, workers=None, strict=True, chunk_size=65536, executor=None):
+        """
+        Like normalize_numeric() (or the unit-specific normalizer of
+        subclasses, e.g. normalize_area()) for large lists, tuples or arrays,
+        but the distinct values are parsed by a pool of worker processes.
+        If strict is False, invalid values are NaN instead of raising.
+
+        See Parallel.parallel_normalize_numeric() for details.
+        """
+        return _parallel_normalize_numeric(self, arg, workers=workers, strict=strict,
+                                           chunk_size=chunk_size, executor=executor)
+
     def safe_normalize(self, s, encoding="utf8"):
         """
         Same as normalize(), but returns None instead of raising
@@ -478,6 +1144,88 @@ class EngineerIO(object):
             significant_digits=significant_digits
         )
 
+    def format_array(self, values, unit="", significant_digits=3, common_prefix=False):
+        """
+        Format an array of values using SI unit prefixes with optional units.
+        Produces the same strings as calling format() for every value,
+        but computes prefixes, scaling and rounding for all values at once.
+
+        If common_prefix is True, all values share one unit prefix
+        (determined using auto_suffix_1d()), e.g. for a table column.
+
+        Returns a str ndarray with the same shape as values.
+        """
+        if unit is None:
+            unit = ""
+        values = np.asarray(values, dtype=np.float64)
+        flat = values.reshape(-1)
+        nan_mask = np.isnan(flat)
+        # Like format(), there is no representation for ±inf
+        inf_mask = np.isinf(flat)
+        if np.any(inf_mask):
+            raise ValueError(f"Value out of range: {flat[inf_mask][0]}")
+        if common_prefix:
+            finite = flat[np.isfinite(flat)]
+            multiplier, unit_prefix = self.auto_suffix_1d(finite) if finite.size else (1.0, "")
+            scaled = flat * multiplier
+            suffix = unit_prefix + unit
+            suffixes = np.full(flat.shape, f" {suffix}" if suffix else "", dtype=object)
+        else:
+            abs_values = np.abs(flat)
+            # Unit prefix map is indexed by one third of the decadic logarithm.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                exp3 = np.where(flat == 0., 0., np.log(abs_values) / math.log(10.)) / 3.
+            exp3[nan_mask] = 0.
+            # format() uses math.log(), which might differ by an ULP.
+            # Recompute values close to an unit prefix boundary exactly.
+            boundary = np.flatnonzero((np.abs(exp3 - np.round(exp3)) < 1e-9) & (abs_values > 0.))
+            for idx in boundary:
+                exp3[idx] = math.log(abs_values[idx], 10.) / 3.
+            prefix_idxs = np.floor(exp3).astype(np.int64)
+            out_of_range = (prefix_idxs <= self.exp_map_min) | (prefix_idxs >= self.exp_map_max)
+            if np.any(out_of_range):
+                raise ValueError(f"Value out of range: {flat[out_of_range][0]}")
+            # Lookup tables (indexed by prefix_idxs - exp_map_min) for factors & suffixes
+            table_start = int(self.exp_map_min)
+            table_idxs = range(table_start, int(self.exp_map_max) + 1)
+            factors = np.asarray([10.0 ** -(idx * 3) for idx in table_idxs])
+            suffix_table = np.asarray([
+                f" {self.exp_unit_prefix_map.get(idx, '')}{unit}" if self.exp_unit_prefix_map.get(idx, '') + unit else ""
+                for idx in table_idxs], dtype=object)
+            scaled = flat * factors[prefix_idxs - table_start]
+            suffixes = suffix_table[prefix_idxs - table_start]
+        # NaNs are formatted without unit prefix
+        suffixes[nan_mask] = f" {unit}" if unit else ""
+        numbers = self._format_numbers(scaled, nan_mask, significant_digits)
+        return np.char.add(numbers.astype(str), suffixes.astype(str)).reshape(values.shape)
+
+    def _format_numbers(self, v, nan_mask, significant_digits=3):
+        """
+        Vectorized equivalent of the numeric part of _format_with_suffix()
+        for a 1D array of pre-multiplied values.
+        Returns an object ndarray of strings.
+        """
+        abs_v = np.abs(v)
+        result = np.empty(v.shape, dtype=object)
+        result[nan_mask] = "-"
+        # Values >= 100 are rounded to integers. "%.0f" rounds like
+        # str(int(round(v))), but without int64 overflow for huge values
+        integer_mask = (abs_v >= 100.0) & ~nan_mask
+        result[integer_mask] = np.char.mod("%.0f", v[integer_mask])
+        # Number of decimals depending on magnitude
+        decimal_mask = ~(integer_mask | nan_mask)
+        decimals = np.select(
+            [abs_v < 1.0, abs_v < 10.0],
+            [significant_digits, significant_digits - 1],
+            default=significant_digits - 2)
+        for ndecimals in np.unique(decimals[decimal_mask]):
+            mask = decimal_mask & (decimals == ndecimals)
+            if ndecimals >= 0:
+                result[mask] = np.char.mod(f"%.{ndecimals}f", v[mask])
+            else: # Invalid number of significant digits, raise the same error as format()
+                result[mask] = [self._format_with_suffix(x, significant_digits=significant_digits) for x in v[mask]]
+        return result
+
     def print(self, v, unit="", significant_digits=3):
         """
         Like format_value, but also prints the value
@@ -538,7 +1286,15 @@ class EngineerIO(object):
     def normalize_iterable(self, arg, func):
         """
         Normalize an iterable (works for lists, tuples, numpy arrays and generators)
+
+        Lists, tuples and arrays are processed by the bulk engine,
+        which applies func only once for every distinct value.
+        func must return plain numbers like "1.5" unchanged.
         """
+        if isinstance(arg, (list, tuple, np.ndarray)):
+            result = bulk_apply(arg, func, plain_numbers=True)
+            if result is not None:
+                return result
         vectorized_func = np.vectorize(func, otypes=[float])
         return vectorized_func(arg)
 
@@ -610,16 +1366,21 @@ class EngineerIO(object):
                 raise InvalidUnitInContextException(f"Invalid unit: Expected {unit} but found {normalize_result.unit} in source string '{arg}'")
             return normalize_result.value
         # It's an iterable
+        if isinstance(arg, (list, tuple, np.ndarray)):
+            return self.normalize_array(arg).verify_unit(unit)
         return self.normalize_iterable(arg, func=partial(self.normalize_numeric_verify_unit, unit=unit))
     
     @classmethod
     def instance(cls):
         """
-        Get the singleton instance of EngineerIO
+        Get the shared instance of this class (EngineerIO or a subclass).
+        Thread-safe, the instance is created on first use (see Registry.py).
         """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        # Every class has its own instance, so don't use inherited attributes
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            return create_instance(cls)
+        return instance
 
     def normalize_interpunctation(self, s):
         """
@@ -681,6 +1442,9 @@ def normalize_engineer_notation(s, encoding="utf8"):
 def format_value(v, unit="", significant_digits=3):
     return EngineerIO.instance().format(v, unit, significant_digits=significant_digits)
 
+def format_array(values, unit="", significant_digits=3, common_prefix=False):
+    return EngineerIO.instance().format_array(values, unit, significant_digits=significant_digits, common_prefix=common_prefix)
+
 def print_value(v, unit="", significant_digits=3):
     return EngineerIO.instance().print(v, unit, significant_digits=significant_digits)
 
@@ -696,6 +1460,22 @@ def normalize_numeric(v):
 def normalize(v):
     return EngineerIO.instance().normalize(v)
 
+def try_normalize_array(arr, return_units=False):
+    return EngineerIO.instance().try_normalize_array(arr, return_units=return_units)
+
+def normalize_array(arg, strict=True):
+    return EngineerIO.instance().normalize_array(arg, strict=strict)
+
+def normalize_buffer(buffer, delimiters=b"\n", out=None, strict=True):
+    return EngineerIO.instance().normalize_buffer(buffer, delimiters=delimiters, out=out, strict=strict)
+
+def normalize_stream(iterable, chunk_size=65536, strict=True, return_errors=False):
+    return EngineerIO.instance().normalize_stream(iterable, chunk_size=chunk_size, strict=strict,
+                                                  return_errors=return_errors)
+
+def parallel_normalize_numeric(arg, workers=None, strict=True):
+    return EngineerIO.instance().parallel_normalize_numeric(arg, workers=workers, strict=strict)
+
 def normalize_timespan(v: str | bytes | int | float | np.generic | np.ndarray) -> int | float | np.generic | np.ndarray:
     raise NotImplementedError("Please use normalize_timespan() from UliEngineering.EngineerIO.Timespan instead!")
 
@@ -3,7 +3,9 @@
 """
 Utilities regarding temperatures
 """
-from UliEngineering.EngineerIO import normalize
+import numpy as np
+
+from UliEngineering.EngineerIO import normalize, normalize_array
 from UliEngineering.EngineerIO.Decorators import normalize_numeric_args, returns_unit
 from UliEngineering.Exceptions import InvalidUnitException
 
@@ -38,13 +40,34 @@ def fahrenheit_to_kelvin(f):
 def fahrenheit_to_celsius(f):
     return kelvin_to_celsius(fahrenheit_to_kelvin(f))
 
+# Temperature unit => (offset, scale) so that kelvin = (value + offset) * scale
+_temperature_units = {
+    "°C": (zero_Celsius, 1.0),
+    "C": (zero_Celsius, 1.0),
+    "°K": (0.0, 1.0),
+    "K": (0.0, 1.0),
+    "°F": (459.67, 5.0 / 9.0),
+    "F": (459.67, 5.0 / 9.0),
+}
+
+def _temperature_unit_transform(unit):
+    try:
+        return _temperature_units[unit]
+    except KeyError:
+        raise InvalidUnitException("Unknown temperature unit: '{}'".format(unit)) from None
+
 @returns_unit("K")
 def normalize_temperature(t, default_unit="°C"):
     """
     Normalize a temperature to kelvin.
     If it is a number or it has no unit, assume it is a default unit
     Else, evaluate the unit(K, °C, °F, C, F)
+
+    Lists, tuples and arrays may contain a mix of units,
+    they are converted in a single vectorized pass.
     """
+    if isinstance(t, (list, tuple, np.ndarray)):
+        return _normalize_temperature_array(t, default_unit)
     unit = ""
     if isinstance(t, str):
         res = normalize(t)
@@ -63,6 +86,20 @@ def normalize_temperature(t, default_unit="°C"):
     else:
         raise InvalidUnitException("Unknown temperature unit: '{}'".format(unit))
 
+def _normalize_temperature_array(t, default_unit):
+    """
+    Normalize an array of temperatures (numbers or strings with mixed units)
+    to kelvin: Every distinct string is parsed once, then the offset & scale
+    of each element's unit are applied using a lookup on the unit codes.
+    """
+    arr = normalize_array(t)
+    transforms = np.asarray([_temperature_unit_transform(unit or default_unit)
+                             for unit in arr.units])
+    if not arr.mixed:
+        offset, scale = transforms[0]
+        return (arr.values + offset) * scale
+    return (arr.values + transforms[arr.unit_codes, 0]) * transforms[arr.unit_codes, 1]
+
 normalize_temperature_kelvin = normalize_temperature
 
 @returns_unit("°C")
@@ -11,7 +11,8 @@ import concurrent.futures
 
 __all__ = ["ChunkGenerator", "overlapping_chunks", "reshaped_chunks",
            "random_sample_chunks", "random_sample_chunks_nonoverlapping",
-           "array_to_chunkgen", "IndexChunkGenerator", "sliding_window"]
+           "array_to_chunkgen", "IndexChunkGenerator", "OverlappingChunkGenerator",
+           "sliding_window"]
 
 
 class ChunkGenerator(object):
@@ -151,6 +152,39 @@ class IndexChunkGenerator(ChunkGenerator):
         """
         return self.index_generator(i)
 
+class OverlappingChunkGenerator(IndexChunkGenerator):
+    """
+    The index chunk generator returned by overlapping_chunks().
+    As all chunks have the same size and are equidistant,
+    blocks of chunks can be viewed as a 2D array without copying.
+    """
+    def __init__(self, data, chunksize, shiftsize, func=None, copy=False):
+        self.chunksize = chunksize
+        self.shiftsize = shiftsize
+        # Start index of every chunk. A range, so huge (memory-mapped)
+        # arrays don't require an offset table
+        self.offsets = range(0, data.shape[0] - (chunksize - 1), shiftsize)
+        gen = functools.partial(_overlapping_chunks_worker, self.offsets, chunksize)
+        super().__init__(data, gen, len(self.offsets), func=func, copy=copy)
+
+    def strided_view(self, start=0, stop=None):
+        """
+        Get a read-only 2D view of the chunks start ... stop-1
+        (one chunk per row) without copying any data.
+        In contrast to __getitem__(), the chunks are not processed using self.func().
+
+        Only supported if self.data is a 1D NumPy array (or memmap).
+        """
+        if not isinstance(self.data, np.ndarray) or self.data.ndim != 1:
+            raise ValueError("Strided views are only supported for 1D NumPy arrays")
+        start, stop, _ = slice(start, stop).indices(len(self))
+        nchunks = max(stop - start, 0)
+        data = self.data[self.offsets[start]:] if nchunks else self.data[:0]
+        return np.lib.stride_tricks.as_strided(
+            data, shape=(nchunks, self.chunksize),
+            strides=(self.shiftsize * data.strides[0], data.strides[0]),
+            writeable=False)
+
 def _overlapping_chunks_worker(offsets, chunksize, i):
     return slice(offsets[i], offsets[i] + chunksize)
 
@@ -172,11 +206,7 @@ def overlapping_chunks(arr, chunksize, shiftsize, func=None, copy=False):
     """
     if chunksize == 0:
         raise ValueError("chunksize must not be 0")
-    # Precompute offset table
-    chunksize = int(chunksize)
-    offsets = np.asarray(range(0, arr.shape[0] - (chunksize - 1), shiftsize))
-    gen = functools.partial(_overlapping_chunks_worker, offsets, chunksize)
-    return IndexChunkGenerator(arr, gen, offsets.size, func=func, copy=copy)
+    return OverlappingChunkGenerator(arr, int(chunksize), shiftsize, func=func, copy=copy)
 
 def sliding_window(data, window_size, shift_size=1, window_func=None, copy=False):
     """
@@ -7,10 +7,11 @@ import warnings
 import numpy as np
 import functools
 from .Selection import find_closest_index, sorted_range_indices
-from .Chunks import overlapping_chunks
-from .Window import create_and_apply_window, WindowFunctor
+from .Chunks import overlapping_chunks, OverlappingChunkGenerator
+from .Window import WindowFunctor
 import concurrent.futures
 from collections import namedtuple
+from toolz import functoolz
 from UliEngineering.Utils.Concurrency import QueuedThreadExecutor
 from UliEngineering.SignalProcessing.Utils import remove_mean
 
@@ -19,16 +20,122 @@ __all__ = ["compute_fft", "parallel_fft_reduce", "simple_fft_reduce", "FFTPoint"
            "fft_cut_dc_artifacts", "fft_cut_dc_artifacts_multi", "fft_frequencies", "FFT",
            "serial_fft_reduce", "simple_serial_fft_reduce", "simple_parallel_fft_reduce",
            "spectral_power_reducer", "parallel_spectral_power_fft_reduce", "serial_spectral_power_fft_reduce",
-           "simple_serial_spectral_power_fft_reduce", "simple_parallel_spectral_power_fft_reduce"]
+           "simple_serial_spectral_power_fft_reduce", "simple_parallel_spectral_power_fft_reduce",
+           "FFTBackend", "register_fft_backend", "get_fft_backend", "set_fft_backend"]
+
+FFTBackend = namedtuple("FFTBackend", ["rfft", "fft"])
+FFTBackend.__doc__ = """
+FFT implementation used by compute_fft() and the *_fft_reduce() functions.
+rfft(x, axis=-1) computes the FFT of real input, fft(x, axis=-1) the FFT
+of complex input, both like numpy.fft.rfft() and numpy.fft.fft().
+"""
+
+def _scipy_fft_backend(workers=None):
+    import scipy.fft
+    return FFTBackend(functools.partial(scipy.fft.rfft, workers=workers),
+                      functools.partial(scipy.fft.fft, workers=workers))
+
+def _numpy_fft_backend(workers=None):
+    # NumPy does not support multithreaded FFTs
+    return FFTBackend(np.fft.rfft, np.fft.fft)
+
+# Backend name => function(workers) which creates the backend
+_fft_backend_factories = {
+    "scipy": _scipy_fft_backend,
+    "numpy": _numpy_fft_backend,
+}
+# Backend used if none is given explicitly: (name or FFTBackend, workers).
+# Name None selects scipy if available, else numpy
+_default_fft_backend = (None, None)
+
+@functools.lru_cache(maxsize=None)
+def _load_fft_backend(name=None, workers=None):
+    """
+    Import the FFT implementation on first use, SciPy is slow to import.
+    Optional scipy dependency: Use either faster scipy or fallback to numpy
+    """
+    if name is None:
+        try:
+            return _scipy_fft_backend(workers)
+        except ModuleNotFoundError:
+            warnings.warn("Using NumPy FFT backend fallback, install scipy for faster FFTs!", RuntimeWarning)
+            return _numpy_fft_backend(workers)
+    try:
+        factory = _fft_backend_factories[name]
+    except KeyError:
+        raise ValueError(f"Unknown FFT backend {name!r}, registered backends: {', '.join(_fft_backend_factories)}") from None
+    return factory(workers)
+
+def register_fft_backend(name, backend):
+    """
+    Register a user-supplied FFT backend so it can be selected by name.
+
+    Parameters
+    ----------
+    name : str
+        The backend name. Replaces any backend with the same name.
+    backend : FFTBackend or callable
+        Either the backend itself or a function workers => FFTBackend
+        (workers is the number of threads to use or None)
+    """
+    if isinstance(backend, FFTBackend):
+        backend = functools.partial(lambda backend, workers: backend, backend)
+    _fft_backend_factories[name] = backend
+    _load_fft_backend.cache_clear()
 
-# Optional scipy dependency: Use either faster scipy or fallback to numpy
-try:
-    import scipy.fftpack
-    _fft_backend = scipy.fftpack.fft
-except ModuleNotFoundError:
-    import numpy.fft
-    _fft_backend = numpy.fft.fft
-    warnings.warn("Using NumPy FFT backend fallback, install scipy for faster FFTs!", RuntimeWarning)
+def get_fft_backend(backend=None, workers=None):
+    """
+    Get a FFTBackend instance.
+
+    Parameters
+    ----------
+    backend : str, FFTBackend or None
+        The name of a registered backend ("scipy", "numpy", ...) or a FFTBackend.
+        None selects the default backend, see set_fft_backend()
+    workers : int or None
+        Number of threads per FFT (scipy only). None selects the default.
+    """
+    if backend is None:
+        backend, default_workers = _default_fft_backend
+        workers = default_workers if workers is None else workers
+    if isinstance(backend, FFTBackend):
+        return backend
+    return _load_fft_backend(backend, workers)
+
+def set_fft_backend(backend=None, workers=None):
+    """
+    Select the FFT backend used if none is given explicitly.
+    Use set_fft_backend() to restore the default (scipy if installed, else numpy).
+
+    Parameters
+    ----------
+    backend : str, FFTBackend or None
+        See get_fft_backend()
+    workers : int or None
+        Number of threads per FFT (scipy only)
+    """
+    global _default_fft_backend
+    # Fail early for unknown backends
+    if backend is not None:
+        get_fft_backend(backend, workers)
+    _default_fft_backend = (backend, workers)
+
+@functools.lru_cache(maxsize=32)
+def _cached_window_functor(size, window, param):
+    functor = WindowFunctor(size, window, param=param)
+    # Shared between calls, so must not be modified
+    functor.window.flags.writeable = False
+    return functor
+
+def _window_functor(size, window, param=None):
+    """
+    Get a (shared) WindowFunctor, so the window array is only computed
+    once for subsequent FFTs of the same size.
+    """
+    try:
+        return _cached_window_functor(size, window, param)
+    except TypeError: # Unhashable window or parameter
+        return WindowFunctor(size, window, param=param)
 
 FFTPoint = namedtuple("FFTPoint", ["frequency", "amplitude", "angle"])
 
@@ -144,7 +251,8 @@ class FFTReductionOverTime(object):
     Attributes
     ----------
     powers : numpy.ndarray
-        1D array with one value per FFT chunk containing the reduced power.
+        1D array with one value per FFT chunk containing the reduced power,
+        or a (chunks x bands) array if bands is set.
     start_indices : numpy.ndarray
         Start sample index of the time slice for each FFT chunk (float).
     end_indices : numpy.ndarray
@@ -159,8 +267,10 @@ class FFTReductionOverTime(object):
         Start frequency used for the band selection.
     end_freq : float or None
         End frequency used for the band selection.
+    bands : list of (start, end) tuples or None
+        Frequency bands of the columns of powers, if multiple bands were selected.
     """
-    def __init__(self, powers, start_indices, end_indices, fftsize, samplerate=None, start_freq=None, end_freq=None):
+    def __init__(self, powers, start_indices, end_indices, fftsize, samplerate=None, start_freq=None, end_freq=None, bands=None):
         import numpy as _np
         self.powers = _np.asarray(powers)
         self.start_indices = _np.asarray(start_indices, dtype=float)
@@ -170,6 +280,7 @@ class FFTReductionOverTime(object):
         self.samplerate = None if samplerate is None else float(samplerate)
         self.start_freq = start_freq
         self.end_freq = end_freq
+        self.bands = bands
         if not (self.powers.shape[0] == self.start_indices.shape[0] == self.end_indices.shape[0]):
             raise ValueError("powers, start_indices and end_indices must have the same length")
 
@@ -190,10 +301,14 @@ class FFTReductionOverTime(object):
         return self.powers
 
     def mean(self):
-        """Return mean power over time."""
+        """Return mean power over time (an array with one value per band if bands is set)."""
+        if self.bands is not None:
+            return self.powers.mean(axis=0)
         return float(self.powers.mean())
 
     def __repr__(self):
+        if self.bands is not None:
+            return f"FFTReductionOverTime(len={len(self)}, fftsize={self.fftsize}, bands={self.bands})"
         return f"FFTReductionOverTime(len={len(self)}, fftsize={self.fftsize}, start_freq={self.start_freq}, end_freq={self.end_freq})"
 
 
@@ -202,7 +317,7 @@ def fft_frequencies(fftsize, samplerate):
     """Return the frequencies associated to a real-onl FFT array"""
     return np.fft.fftfreq(fftsize)[:fftsize // 2] * samplerate
 
-def compute_fft(y, samplerate, window="blackman", window_param=None):
+def compute_fft(y, samplerate, window="blackman", window_param=None, backend=None):
     """
     Compute the real FFT of a dataset and return an FFT object which can directly be visualized using matplotlib etc:
     result = compute_fft(...)
@@ -212,17 +327,24 @@ def compute_fft(y, samplerate, window="blackman", window_param=None):
     Usually, due to the oscillating phases of spectral leakage,
     it doesn't make sense to visualize the angles directly but to
     select the angle e.g. where the amplitudes have a peak
+
+    backend selects the FFT implementation, see get_fft_backend().
     """
     n = len(y)
-    windowedY = create_and_apply_window(y, window, param=window_param)
-    w = _fft_backend(windowedY)[:n // 2]
+    windowedY = _window_functor(n, window, window_param)(y)
+    backend = get_fft_backend(backend)
+    # Real input only requires half of the spectrum to be computed
+    if np.iscomplexobj(windowedY):
+        w = backend.fft(windowedY)[:n // 2]
+    else:
+        w = backend.rfft(windowedY)[:n // 2]
     # Perform amplitude normalization (use centralized helper)
     w_norm = normalize_fft_reduction(np.abs(w), n, nchunks=1, power=False)
     x = fft_frequencies(n, samplerate)
     angles = np.rad2deg(np.angle(w))
     return FFT(x, w_norm, angles)
 
-def __fft_reduce_worker(chunkgen, i, window, fftsize, removeDC):
+def __fft_reduce_worker(chunkgen, i, window, fftsize, removeDC, backend):
     chunk = chunkgen[i]
     if chunk.size < fftsize:
         raise ValueError("Chunk too small: FFT size {0}, chunk size {1}".format(fftsize, chunk.size))
@@ -232,7 +354,7 @@ def __fft_reduce_worker(chunkgen, i, window, fftsize, removeDC):
     if removeDC:
         yslice = remove_mean(yslice)
     # Compute FFT
-    fftresult = _fft_backend(window(yslice))
+    fftresult = backend.rfft(window(yslice))
     # Perform amplitude normalization
     return i, np.abs(fftresult[:fftsize // 2])
 
@@ -245,6 +367,88 @@ def spectral_power_reducer(fx, gen):
     "FFT reducer that computes the sum of squares of the FFT y values."
     return sum(y**2 for _, y in gen)
 
+# Equivalents of the builtin reducers for a 2D block of FFT y values
+# (one FFT per row), used by the batched mode
+_block_reducers = {
+    sum_reducer: lambda ys: ys.sum(axis=0),
+    spectral_power_reducer: lambda ys: np.einsum("ij,ij->j", ys, ys),
+}
+
+# Default number of samples per block in the batched mode
+_batched_block_samples = 1 << 18
+
+def _check_fft_mode(mode):
+    if mode not in ("per_chunk", "batched"):
+        raise ValueError(f"Invalid FFT reduce mode {mode!r}, use 'per_chunk' or 'batched'")
+
+def _chunk_block(chunkgen, start, stop, fftsize):
+    """
+    Get the first fftsize values of the chunks start ... stop-1 as 2D array
+    (one chunk per row). This is a zero-copy view for overlapping_chunks()
+    of 1D arrays without a chunk postprocessor function.
+    """
+    if (isinstance(chunkgen, OverlappingChunkGenerator) and chunkgen.func == functoolz.identity
+            and isinstance(chunkgen.data, np.ndarray) and chunkgen.data.ndim == 1):
+        if chunkgen.chunksize < fftsize:
+            raise ValueError("Chunk too small: FFT size {0}, chunk size {1}".format(fftsize, chunkgen.chunksize))
+        return chunkgen.strided_view(start, stop)[:, :fftsize]
+    chunks = [np.asarray(chunkgen[i]) for i in range(start, stop)]
+    for chunk in chunks:
+        if chunk.size < fftsize:
+            raise ValueError("Chunk too small: FFT size {0}, chunk size {1}".format(fftsize, chunk.size))
+    return np.stack([chunk[:fftsize] for chunk in chunks])
+
+def _batched_fft_reduce_worker(chunkgen, start, stop, window, fftsize, removeDC, backend, block_reducer=None):
+    """
+    Compute the FFT y values of the chunks start ... stop-1 in a single
+    vectorized FFT call. Returns (start, block_reducer(ys)) or (start, ys)
+    if block_reducer is None.
+    """
+    yslices = _chunk_block(chunkgen, start, stop, fftsize)
+    # If enabled, remove DC. This creates a copy, the data is never modified
+    if removeDC:
+        yslices = yslices - yslices.mean(axis=1, keepdims=True)
+    fftresult = backend.rfft(yslices * window.window, axis=-1)
+    ys = np.abs(fftresult[:, :fftsize // 2])
+    return start, (ys if block_reducer is None else block_reducer(ys))
+
+def _batched_fft_reduce(chunkgen, fftsize, window, removeDC, backend, executor, block_size=None, block_reducer=None):
+    """
+    Submit one task per block of block_size chunks to the executor.
+    Yields the results of _batched_fft_reduce_worker() as they are completed.
+    """
+    if block_size is None:
+        block_size = max(1, _batched_block_samples // fftsize)
+    if block_size < 1:
+        raise ValueError(f"Block size must be at least 1, not {block_size}")
+    nchunks = len(chunkgen)
+    futures = [
+        executor.submit(_batched_fft_reduce_worker, chunkgen, start,
+                        min(start + block_size, nchunks), window, fftsize, removeDC, backend, block_reducer)
+        for start in range(0, nchunks, block_size)
+    ]
+    return (f.result() for f in concurrent.futures.as_completed(futures))
+
+def _chunk_start_end_indices(chunkgen, fftsize):
+    """
+    Get the start & end sample index of every chunk as float arrays.
+    If the chunk generator does not provide the original indexes,
+    (i, i + fftsize) is used for the ith chunk.
+    """
+    nchunks = len(chunkgen)
+    if isinstance(chunkgen, OverlappingChunkGenerator):
+        starts = np.arange(nchunks, dtype=float) * chunkgen.shiftsize
+        return starts, starts + chunkgen.chunksize
+    starts = np.zeros(nchunks, dtype=float)
+    ends = np.zeros(nchunks, dtype=float)
+    for i in range(nchunks):
+        try:
+            sl = chunkgen.original_indexes(i)
+            starts[i], ends[i] = sl.start, sl.stop
+        except Exception:
+            starts[i], ends[i] = i, i + fftsize
+    return starts, ends
+
 
 def normalize_fft_reduction(values, fftsize, nchunks=1, power=False):
     """Normalize FFT reduction results.
@@ -273,7 +477,7 @@ def normalize_fft_reduction(values, fftsize, nchunks=1, power=False):
         factor = 2.0 / (nchunks * fftsize)
     return vals * factor
 
-def parallel_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", reducer=sum_reducer, normalize=True, executor=None, window_param=None):
+def parallel_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", reducer=sum_reducer, normalize=True, executor=None, window_param=None, mode="per_chunk", block_size=None, backend=None):
     """
     Perform multiple FFTs on a single dataset, returning the reduction of all FFTs.
     The default reduction method is sum, however any reduction method may be given that
@@ -291,45 +495,106 @@ def parallel_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="b
     a new ThreadPoolExecutor() is used automatically. Using a process-based executor
     is not required as scipy/numpy unlock the GIL during the computationally expensive
     operations.
+
+    With mode="per_chunk" (the default), one executor task is submitted per chunk.
+    With mode="batched", one task is submitted per block of block_size chunks
+    (by default, about 256k samples per block) which computes all FFTs of the block
+    in a single vectorized call. For overlapping_chunks() of 1D arrays, the block
+    is a zero-copy view of the data. The builtin reducers are applied to the whole
+    block at once, other reducers still receive the FFT y values one by one.
+    This mode is much faster for many small FFTs.
+
+    backend selects the FFT implementation, see get_fft_backend().
     """
+    _check_fft_mode(mode)
     if len(chunkgen) == 0:
         raise ValueError("Can't perform FFT on empty chunk generator")
     if executor is None:
         executor = QueuedThreadExecutor()
     # Compute common parameters
-    window = WindowFunctor(fftsize, window, param=window_param)
-    fftSum = np.zeros(fftsize // 2)
-    # Initialize threadpool
-    futures = [
-        executor.submit(__fft_reduce_worker, chunkgen, i, window, fftsize, removeDC)
-        for i in range(len(chunkgen))
-    ]
-    # Sum up the results
+    window = _window_functor(fftsize, window, window_param)
+    backend = get_fft_backend(backend)
     x = fft_frequencies(fftsize, samplerate)
-    fftSum = reducer(x, (f.result() for f in concurrent.futures.as_completed(futures)))
+    if mode == "batched":
+        block_reducer = _block_reducers.get(reducer)
+        blocks = _batched_fft_reduce(chunkgen, fftsize, window, removeDC, backend, executor,
+                                     block_size=block_size, block_reducer=block_reducer)
+        if block_reducer is not None:
+            fftSum = np.zeros(fftsize // 2)
+            for _, blocksum in blocks:
+                np.add(fftSum, blocksum, out=fftSum)
+        else:
+            fftSum = reducer(x, ((i, y) for start, ys in blocks for i, y in enumerate(ys, start)))
+    else:
+        # Initialize threadpool
+        futures = [
+            executor.submit(__fft_reduce_worker, chunkgen, i, window, fftsize, removeDC, backend)
+            for i in range(len(chunkgen))
+        ]
+        # Sum up the results
+        fftSum = reducer(x, (f.result() for f in concurrent.futures.as_completed(futures)))
     # Perform normalization once
     if normalize:
         fftSum = normalize_fft_reduction(fftSum, fftsize, len(chunkgen), power=False)
     return FFT(x, fftSum, None)
 
 
-def serial_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", reducer=sum_reducer, normalize=True, window_param=None):
+def serial_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", reducer=sum_reducer, normalize=True, window_param=None, mode="per_chunk", block_size=None, backend=None):
     """
     Serial wrapper that calls the parallel implementation with a single-threaded executor.
     """
     if len(chunkgen) == 0:
         raise ValueError("Can't perform FFT on empty chunk generator")
     executor = QueuedThreadExecutor(nthreads=1)
-    return parallel_fft_reduce(chunkgen, samplerate, fftsize, removeDC=removeDC, window=window, reducer=reducer, normalize=normalize, executor=executor, window_param=window_param)
+    return parallel_fft_reduce(chunkgen, samplerate, fftsize, removeDC=removeDC, window=window, reducer=reducer, normalize=normalize, executor=executor, window_param=window_param, mode=mode, block_size=block_size, backend=backend)
 
 
-def parallel_spectral_power_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", normalize=True, start=0.0, end=None, executor=None, window_param=None):
+def _band_indices(frequencies, bands):
+    """
+    Get the (start, end) index arrays of the given (start, end) frequency bands.
+    None selects the first or last frequency.
+    """
+    starts = np.zeros(len(bands), dtype=int)
+    ends = np.zeros(len(bands), dtype=int)
+    for i, (start, end) in enumerate(bands):
+        startidx, endidx = sorted_range_indices(frequencies, start, end)
+        starts[i] = 0 if startidx is None else startidx
+        ends[i] = frequencies.shape[0] if endidx is None else endidx
+    return starts, ends
+
+def _band_powers(ys, band_starts, band_ends):
+    """
+    Compute the sum of squares of the FFT y values in every band
+    for a 1D or 2D (one FFT per row) array.
+    Returns a (FFTs x bands) array.
+
+    The squares are summed once per segment between subsequent band
+    boundaries and the segment sums are then added up for every band.
+    In contrast to the differences of a cumulative sum, this does not
+    lose precision for small bands next to large (e.g. DC) values.
+    """
+    ys = np.atleast_2d(ys)
+    bounds = np.unique(np.concatenate((band_starts, band_ends)))
+    if bounds[-1] == bounds[0]: # Only empty bands
+        return np.zeros((ys.shape[0], band_starts.shape[0]))
+    squares = np.square(ys[:, bounds[0]:bounds[-1]])
+    # Segment k is bounds[k] ... bounds[k + 1]
+    segment_sums = np.add.reduceat(squares, bounds[:-1] - bounds[0], axis=1)
+    in_band = (band_starts <= bounds[:-1, None]) & (bounds[1:, None] <= band_ends)
+    return segment_sums @ in_band
+
+def __spectral_power_worker(chunkgen, i, window, fftsize, removeDC, backend, band_starts, band_ends):
+    i, ys = __fft_reduce_worker(chunkgen, i, window, fftsize, removeDC, backend)
+    return i, _band_powers(ys, band_starts, band_ends)
+
+def parallel_spectral_power_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", normalize=True, start=0.0, end=None, executor=None, window_param=None, mode="per_chunk", block_size=None, backend=None, bands=None):
     """
     Like (parallel|serial)_fft_reduce, but computes a single power value per FFT chunk
     representing the total power inside the requested frequency band.
 
-    Returns a numpy array of length equal to the number of chunks. Each element is the
-    spectral power for one FFT (time slot).
+    Returns a FFTReductionOverTime whose powers have one element per chunk. Each element
+    is the spectral power for one FFT (time slot). The start & end sample indices are
+    computed from the chunk offsets for overlapping_chunks().
 
     Parameters
     ----------
@@ -337,7 +602,17 @@ def parallel_spectral_power_fft_reduce(chunkgen, samplerate, fftsize, removeDC=F
         Start frequency (inclusive). Defaults to 0.0.
     end : float or None
         End frequency (exclusive). Defaults to the maximum frequency.
+    mode : str
+        "per_chunk" or "batched", see parallel_fft_reduce()
+    block_size : int or None
+        Number of chunks per block in the batched mode
+    backend : str, FFTBackend or None
+        The FFT implementation, see get_fft_backend()
+    bands : list of (start, end) tuples or None
+        If given, start and end are ignored and the power of every band
+        is computed. The powers are then a (chunks x bands) matrix.
     """
+    _check_fft_mode(mode)
     if len(chunkgen) == 0:
         raise ValueError("Can't perform FFT on empty chunk generator")
     nchunks = len(chunkgen)
@@ -345,48 +620,34 @@ def parallel_spectral_power_fft_reduce(chunkgen, samplerate, fftsize, removeDC=F
         executor = QueuedThreadExecutor()
     # Compute frequency array and selection indices
     x = fft_frequencies(fftsize, samplerate)
-    startidx, endidx = sorted_range_indices(x, start, end)
-    # Convert None to bounds
-    startidx = 0 if startidx is None else startidx
-    endidx = x.shape[0] if endidx is None else endidx
-    # Prepare result array (one value per FFT chunk)
-    powers = np.zeros(nchunks)
+    band_starts, band_ends = _band_indices(x, [(start, end)] if bands is None else bands)
+    # Prepare result array (one row of band powers per FFT chunk)
+    powers = np.zeros((nchunks, band_starts.shape[0]))
     # Prepare common window
-    windowfun = WindowFunctor(fftsize, window)
-    # Submit workers
-    futures = [executor.submit(__fft_reduce_worker, chunkgen, i, windowfun, fftsize, removeDC)
-               for i in range(nchunks)]
-    # As futures complete, compute per-chunk band power and store at correct index
-    starts = []
-    ends = []
-    for f in concurrent.futures.as_completed(futures):
-        i, mags = f.result()
-        # Compute integral
-        p = np.sum(mags[startidx:endidx] ** 2)
-        if normalize:
-            # For a single FFT, power normalization uses nchunks=1
-            p = normalize_fft_reduction(p, fftsize, nchunks=1, power=True)
-        powers[i] = p
-        # Attempt to obtain the original index slice for time mapping
-        try:
-            sl = chunkgen.original_indexes(i)
-            starts.append((i, float(sl.start)))
-            ends.append((i, float(sl.stop)))
-        except Exception:
-            # Fallback: approximate using chunk index and fftsize
-            starts.append((i, float(i)))
-            ends.append((i, float(i + fftsize)))
-    # Recreate ordered arrays
-    starts_arr = np.zeros(len(powers), dtype=float)
-    ends_arr = np.zeros(len(powers), dtype=float)
-    for i, v in starts:
-        starts_arr[i] = v
-    for i, v in ends:
-        ends_arr[i] = v
-    return FFTReductionOverTime(powers, starts_arr, ends_arr, fftsize, samplerate=samplerate, start_freq=start, end_freq=end)
+    windowfun = _window_functor(fftsize, window, window_param)
+    backend = get_fft_backend(backend)
+    if mode == "batched":
+        band_powers = functools.partial(_band_powers, band_starts=band_starts, band_ends=band_ends)
+        for i, p in _batched_fft_reduce(chunkgen, fftsize, windowfun, removeDC, backend, executor,
+                                        block_size=block_size, block_reducer=band_powers):
+            powers[i:i + p.shape[0]] = p
+    else:
+        futures = [executor.submit(__spectral_power_worker, chunkgen, i, windowfun, fftsize, removeDC,
+                                   backend, band_starts, band_ends)
+                   for i in range(nchunks)]
+        for f in concurrent.futures.as_completed(futures):
+            i, p = f.result()
+            powers[i] = p
+    if normalize:
+        # For a single FFT, power normalization uses nchunks=1
+        powers = normalize_fft_reduction(powers, fftsize, nchunks=1, power=True)
+    starts_arr, ends_arr = _chunk_start_end_indices(chunkgen, fftsize)
+    if bands is None:
+        return FFTReductionOverTime(powers[:, 0], starts_arr, ends_arr, fftsize, samplerate=samplerate, start_freq=start, end_freq=end)
+    return FFTReductionOverTime(powers, starts_arr, ends_arr, fftsize, samplerate=samplerate, bands=bands)
 
 
-def serial_spectral_power_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", normalize=True, start=0.0, end=None, window_param=None):
+def serial_spectral_power_fft_reduce(chunkgen, samplerate, fftsize, removeDC=False, window="blackman", normalize=True, start=0.0, end=None, window_param=None, mode="per_chunk", block_size=None, backend=None, bands=None):
     """
     Like serial_fft_reduce, but computes the average spectral power (amplitude squared) only in
     the requested frequency band. The selection is applied while computing the spectrum.
@@ -397,45 +658,22 @@ def serial_spectral_power_fft_reduce(chunkgen, samplerate, fftsize, removeDC=Fal
         Start frequency (inclusive). Defaults to 0.0.
     end : float or None
         End frequency (exclusive). Defaults to the maximum frequency.
+    mode : str
+        "per_chunk" or "batched", see parallel_fft_reduce()
+    block_size : int or None
+        Number of chunks per block in the batched mode
+    backend : str, FFTBackend or None
+        The FFT implementation, see get_fft_backend()
+    bands : list of (start, end) tuples or None
+        See parallel_spectral_power_fft_reduce()
     """
     if len(chunkgen) == 0:
         raise ValueError("Can't perform FFT on empty chunk generator")
-    # Compute frequency array and selection indices
-    x = fft_frequencies(fftsize, samplerate)
-    startidx, endidx = sorted_range_indices(x, start, end)
-    # Convert None to bounds
-    startidx = 0 if startidx is None else startidx
-    endidx = x.shape[0] if endidx is None else endidx
-    # Prepare accumulation buffer
-    n_bins = endidx - startidx
-    fftPower = np.zeros(n_bins)
-    # Prepare common window
-    windowfun = WindowFunctor(fftsize, window, param=window_param)
-    # Loop over chunks and compute one power value per chunk
-    nchunks = len(chunkgen)
-    powers = np.zeros(nchunks)
-    starts = []
-    ends = []
-    for i in range(nchunks):
-        _, mags = __fft_reduce_worker(chunkgen, i, windowfun, fftsize, removeDC)
-        p = np.sum(mags[startidx:endidx] ** 2)
-        if normalize:
-            p = normalize_fft_reduction(p, fftsize, nchunks=1, power=True)
-        powers[i] = p
-        try:
-            sl = chunkgen.original_indexes(i)
-            starts.append((i, float(sl.start)))
-            ends.append((i, float(sl.stop)))
-        except Exception:
-            starts.append((i, float(i)))
-            ends.append((i, float(i + fftsize)))
-    starts_arr = np.zeros(len(powers), dtype=float)
-    ends_arr = np.zeros(len(powers), dtype=float)
-    for i, v in starts:
-        starts_arr[i] = v
-    for i, v in ends:
-        ends_arr[i] = v
-    return FFTReductionOverTime(powers, starts_arr, ends_arr, fftsize, samplerate=samplerate, start_freq=start, end_freq=end)
+    executor = QueuedThreadExecutor(nthreads=1)
+    return parallel_spectral_power_fft_reduce(
+        chunkgen, samplerate, fftsize, removeDC=removeDC, window=window, normalize=normalize,
+        start=start, end=end, executor=executor, window_param=window_param,
+        mode=mode, block_size=block_size, backend=backend, bands=bands)
 
 
 def simple_fft_reduce(fn, arr, samplerate, fftsize, shiftsize=None, nthreads=4, **kwargs):
@@ -19,7 +19,6 @@ Features include:
 """
 from collections.abc import Iterable
 from UliEngineering.EngineerIO import normalize_numeric
-from scipy import signal
 import numpy as np
 import numbers
 import collections
@@ -140,6 +139,7 @@ class SignalFilter(object):
         self.rs = rs
         self.ftype = ftype
         # Compute filter coefficients
+        from scipy import signal # Lazy import, SciPy is slow to import
         self.b, self.a = signal.iirfilter(order, self.filtfreqs, btype=self.btype,
                                           ftype=ftype, rp=rp, rs=rs)
         if not self.is_stable():
@@ -166,12 +166,14 @@ class SignalFilter(object):
         Generate a filter frequency response from a set of filter taps.
         Returns plottable (x, y) with respect to an actual sampling rate
         """
+        from scipy import signal
         w, h = signal.freqz(self.b, self.a, worN=n)
         return (0.5 * self.samplerate * w / np.pi, np.abs(h))
 
     def __call__(self, d):
         if self.a is None:
             raise NotComputedException()
+        from scipy import signal
         return signal.filtfilt(self.b, self.a, d)
 
     def chain(self, repeat=2):
@@ -8,7 +8,6 @@ import functools
 import numpy as np
 import bisect
 import concurrent.futures
-import scipy.interpolate
 from UliEngineering.Utils.Concurrency import QueuedThreadExecutor
 from .Utils import LinRange
 
@@ -140,6 +139,7 @@ def __parallel_resample_worker(torig, tnew, y, out, i, chunksize, ovp_size, pref
         tsrc_chunk, ysrc_chunk = prefilter(tsrc_chunk, ysrc_chunk)
 
     # Compute interpolating spline (might also be piecewise linear)...
+    import scipy.interpolate # Lazy import, SciPy is slow to import
     fit = scipy.interpolate.interp1d(tsrc_chunk, ysrc_chunk, fitkind=fitkind)
     # ... and evaluate
     out[i:i + chunksize] = fit(t_target)
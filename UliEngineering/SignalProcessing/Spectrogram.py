@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Out-of-core spectrogram (STFT magnitude) computation
+
+The input (e.g. a np.memmap of a long recording) is processed in blocks
+of overlapping chunks and the magnitudes are written block by block
+into the output array, which may also be a np.memmap.
+Therefore, the peak memory usage only depends on the FFT & block size,
+not on the length of the recording. No per-chunk arrays (offsets, times)
+are created.
+"""
+import numpy as np
+from .Chunks import overlapping_chunks
+from .FFT import (fft_frequencies, get_fft_backend, normalize_fft_reduction,
+                  _batched_block_samples, _batched_fft_reduce_worker, _window_functor)
+
+__all__ = ["Spectrogram", "spectrogram", "spectrogram_shape"]
+
+class Spectrogram(object):
+    """Container for a time x frequency magnitude matrix.
+
+    The time axis is not stored but computed from the chunk & shift size
+    on access, so its memory usage doesn't grow with the recording length.
+
+    Attributes
+    ----------
+    amplitudes : numpy.ndarray
+        2D array (or np.memmap) with one row of FFT magnitudes per chunk
+    frequencies : numpy.ndarray
+        Frequency of every column
+    fftsize : int
+        FFT size (= chunk size) used to compute the magnitudes
+    shiftsize : int
+        Distance between the starts of subsequent chunks
+    samplerate : float or None
+        Samplerate used to compute the frequencies & times
+    db : bool
+        True if the magnitudes are given in dB (20 * log10)
+    """
+    def __init__(self, amplitudes, frequencies, fftsize, shiftsize, samplerate=None, db=False):
+        self.amplitudes = amplitudes
+        self.frequencies = frequencies
+        self.fftsize = int(fftsize)
+        self.shiftsize = int(shiftsize)
+        self.samplerate = None if samplerate is None else float(samplerate)
+        self.db = db
+
+    def __len__(self):
+        return self.amplitudes.shape[0]
+
+    def start_indices(self, start=0, stop=None):
+        """Return the start sample index of the chunks start ... stop-1 (float)."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return np.arange(start, max(start, stop), dtype=float) * self.shiftsize
+
+    def end_indices(self, start=0, stop=None):
+        """Return the end sample index of the chunks start ... stop-1 (float)."""
+        return self.start_indices(start, stop) + self.fftsize
+
+    def times(self, start=0, stop=None):
+        """
+        Return the time positions (middle of each FFT) of the chunks start ... stop-1
+        in seconds if samplerate is set, else None.
+        """
+        if self.samplerate is None:
+            return None
+        return (self.start_indices(start, stop) + self.fftsize / 2.0) / self.samplerate
+
+    def __repr__(self):
+        return f"Spectrogram(len={len(self)}, fftsize={self.fftsize}, db={self.db})"
+
+def spectrogram_shape(nsamples, fftsize, shiftsize=None):
+    """
+    Get the shape (number of chunks, number of frequencies) of the
+    output array of spectrogram() for a recording of nsamples samples,
+    e.g. to create the output np.memmap.
+    """
+    shiftsize = fftsize // 4 if shiftsize is None else shiftsize
+    nchunks = len(range(0, nsamples - (fftsize - 1), shiftsize))
+    return (nchunks, fftsize // 2)
+
+def spectrogram(data, samplerate, fftsize, shiftsize=None, out=None, dtype=np.float64, db=False,
+                window="blackman", window_param=None, removeDC=False, normalize=True,
+                start_chunk=0, block_size=None, progress=None, backend=None):
+    """
+    Compute the FFT magnitudes of all overlapping chunks of data,
+    one row per chunk. data is read block by block, so data and out
+    may be np.memmaps much larger than the available memory.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        1D input array (or np.memmap)
+    samplerate : float
+        The samplerate of data
+    fftsize : int
+        FFT size (= chunk size)
+    shiftsize : int or None
+        Distance between the starts of subsequent chunks.
+        Defaults to fftsize // 4, like simple_fft_reduce()
+    out : numpy.ndarray or None
+        Output array (or np.memmap) of shape spectrogram_shape().
+        If None, a new array of the given dtype is allocated.
+    dtype : numpy.dtype
+        Output dtype if out is None, e.g. np.float32 to save space
+    db : bool
+        If True, store 20 * log10(magnitude) instead of the magnitude
+    normalize : bool
+        If True, the magnitudes are normalized like compute_fft()
+    start_chunk : int
+        Index of the first chunk to compute. Use this to resume an
+        interrupted computation into the same out array. Rows before
+        start_chunk are not modified.
+    block_size : int or None
+        Number of chunks computed at once (by default, about 256k samples per block).
+        The peak memory usage is proportional to block_size * fftsize.
+    progress : callable or None
+        Called as progress(done, total) after every block. done is the
+        number of the first chunk which has not been computed yet, so it can
+        be passed as start_chunk to resume. If out is a np.memmap, it has been
+        flushed to disk before progress() is called.
+    backend : str, FFTBackend or None
+        The FFT implementation, see get_fft_backend()
+
+    Returns a Spectrogram with out as its amplitudes.
+    """
+    if not isinstance(data, np.ndarray):
+        data = np.asarray(data)
+    if data.ndim != 1:
+        raise ValueError(f"Spectrograms can only be computed for 1D data, not {data.ndim}D")
+    shiftsize = fftsize // 4 if shiftsize is None else shiftsize
+    chunkgen = overlapping_chunks(data, fftsize, shiftsize)
+    nchunks = len(chunkgen)
+    shape = spectrogram_shape(data.shape[0], fftsize, shiftsize)
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"Output array shape {out.shape} does not match the spectrogram shape {shape}")
+    if not 0 <= start_chunk <= nchunks:
+        raise ValueError(f"start_chunk must be in 0 ... {nchunks}, not {start_chunk}")
+    if block_size is None:
+        block_size = max(1, _batched_block_samples // fftsize)
+    if block_size < 1:
+        raise ValueError(f"Block size must be at least 1, not {block_size}")
+    windowfun = _window_functor(fftsize, window, window_param)
+    backend = get_fft_backend(backend)
+    for start in range(start_chunk, nchunks, block_size):
+        stop = min(start + block_size, nchunks)
+        _, ys = _batched_fft_reduce_worker(chunkgen, start, stop, windowfun, fftsize, removeDC, backend)
+        if normalize:
+            ys = normalize_fft_reduction(ys, fftsize)
+        if db:
+            # Avoid -inf for zero magnitudes
+            np.maximum(ys, np.finfo(ys.dtype).tiny, out=ys)
+            np.log10(ys, out=ys)
+            ys *= 20
+        out[start:stop] = ys
+        if progress is not None:
+            if isinstance(out, np.memmap):
+                out.flush()
+            progress(stop, nchunks)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return Spectrogram(out, fft_frequencies(fftsize, samplerate), fftsize, shiftsize,
+                       samplerate=samplerate, db=db)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Online FFT averaging for live data streams
+
+In contrast to the *_fft_reduce() functions, which require random
+access to the complete dataset, the StreamingFFTAverager is fed
+blocks of arbitrary size as they are acquired. Only the samples of
+the next (incomplete) FFT chunk are kept between feed() calls.
+"""
+import numpy as np
+from .Chunks import overlapping_chunks
+from .FFT import (FFT, fft_frequencies, get_fft_backend, normalize_fft_reduction,
+                  _batched_block_samples, _batched_fft_reduce_worker, _window_functor)
+
+__all__ = ["StreamingFFTAverager"]
+
+class StreamingFFTAverager(object):
+    """
+    Computes windowed FFTs of overlapping chunks of a sample stream
+    and maintains their average spectrum.
+
+    >>> averager = StreamingFFTAverager(samplerate=1e3, fftsize=1024)
+    >>> for block in acquisition:
+    ...     averager.feed(block)
+    ...     plot(averager.fft.frequencies, averager.fft.amplitudes)
+    """
+    def __init__(self, samplerate, fftsize, shiftsize=None, window="blackman", window_param=None,
+                 removeDC=False, alpha=None, power=False, block_size=None, backend=None):
+        """
+        Parameters
+        ----------
+        samplerate : float
+            The samplerate of the stream
+        fftsize : int
+            FFT size (= chunk size)
+        shiftsize : int or None
+            Distance between the starts of subsequent chunks.
+            Defaults to fftsize // 4, like simple_fft_reduce()
+        alpha : float or None
+            If None, all FFTs are weighted equally (running average).
+            Otherwise, the exponentially weighted moving average with the
+            weight alpha (0 < alpha <= 1) of the newest FFT is computed.
+        power : bool
+            If True, the squared magnitudes are averaged and normalized
+            like spectral power, else the magnitudes like parallel_fft_reduce()
+        block_size : int or None
+            Maximum number of chunks transformed at once
+        backend : str, FFTBackend or None
+            The FFT implementation, see get_fft_backend()
+        """
+        if alpha is not None and not 0. < alpha <= 1.:
+            raise ValueError(f"alpha must be in (0, 1], not {alpha}")
+        self.samplerate = samplerate
+        self.fftsize = int(fftsize)
+        self.shiftsize = self.fftsize // 4 if shiftsize is None else int(shiftsize)
+        if self.shiftsize < 1:
+            raise ValueError(f"Shift size must be at least 1, not {self.shiftsize}")
+        self.removeDC = removeDC
+        self.alpha = alpha
+        self.power = power
+        self.block_size = max(1, _batched_block_samples // self.fftsize) if block_size is None else block_size
+        self._window = _window_functor(self.fftsize, window, window_param)
+        self._backend = get_fft_backend(backend)
+        self.frequencies = fft_frequencies(self.fftsize, samplerate)
+        self.reset()
+
+    def reset(self):
+        """
+        Discard all buffered samples and the average spectrum
+        """
+        # Samples of the next, incomplete chunk (always less than fftsize)
+        self._tail = np.zeros(0)
+        # Number of samples to discard before the next chunk (if shiftsize > fftsize)
+        self._skip = 0
+        # Sum (running average) or average (exponential average) of the raw FFT values
+        self._accumulator = np.zeros(self.fftsize // 2)
+        self.count = 0
+
+    def feed(self, samples):
+        """
+        Add a block of samples of arbitrary size to the stream and
+        compute the FFTs of all chunks which are complete now.
+        Returns the number of new FFTs.
+        """
+        samples = np.asarray(samples)
+        if samples.ndim != 1:
+            raise ValueError(f"Samples must be 1D, not {samples.ndim}D")
+        if self._skip:
+            skipped = min(self._skip, samples.shape[0])
+            samples = samples[skipped:]
+            self._skip -= skipped
+        data = np.concatenate((self._tail, samples)) if self._tail.size else samples
+        chunkgen = overlapping_chunks(data, self.fftsize, self.shiftsize)
+        nchunks = len(chunkgen)
+        for start in range(0, nchunks, self.block_size):
+            stop = min(start + self.block_size, nchunks)
+            _, ys = _batched_fft_reduce_worker(chunkgen, start, stop, self._window,
+                                               self.fftsize, self.removeDC, self._backend)
+            self._accumulate(np.square(ys, out=ys) if self.power else ys)
+        # Keep only the samples of the next chunk, so the block can be freed
+        next_start = nchunks * self.shiftsize
+        self._tail = data[next_start:].copy()
+        # If the block ended before the end of the skipped gap, the rest
+        # of the gap is still pending (added, so it isn't reset by blocks without chunks)
+        self._skip += max(next_start - data.shape[0], 0)
+        return nchunks
+
+    def _accumulate(self, ys):
+        """Add a block of FFT values (one FFT per row) to the average"""
+        if self.alpha is None:
+            np.add(self._accumulator, ys.sum(axis=0), out=self._accumulator)
+        else:
+            if self.count == 0: # Start with the first FFT
+                self._accumulator[:] = ys[0]
+                self.count += 1
+                ys = ys[1:]
+            # Apply avg = (1 - alpha) * avg + alpha * y for all rows at once
+            decay = (1. - self.alpha) ** np.arange(ys.shape[0] - 1, -1, -1)
+            self._accumulator *= (1. - self.alpha) ** ys.shape[0]
+            self._accumulator += self.alpha * (decay @ ys)
+        self.count += ys.shape[0]
+
+    @property
+    def amplitudes(self):
+        """
+        The normalized average spectrum (zeros if no FFT has been computed yet)
+        """
+        if self.count == 0:
+            return np.zeros(self.fftsize // 2)
+        nchunks = self.count if self.alpha is None else 1
+        return normalize_fft_reduction(self._accumulator, self.fftsize, nchunks, power=self.power)
+
+    @property
+    def fft(self):
+        """
+        The average spectrum as FFT object
+        """
+        return FFT(self.frequencies, self.amplitudes, None)
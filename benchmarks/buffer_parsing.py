@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Parsing a newline-delimited file of engineer notation values,
+line by line vs. EngineerIO.normalize_buffer() on a memory-mapped file.
+
+Usage (from the repository root):
+    python -m benchmarks.buffer_parsing
+"""
+import mmap
+import random
+import tempfile
+import time
+
+from UliEngineering.EngineerIO import EngineerIO
+
+def make_data(nlines, ndistinct=1000, seed=0):
+    rng = random.Random(seed)
+    distinct = [f"{rng.uniform(1, 999):.3f} {rng.choice('pnµmkM')}{rng.choice(['Ω', 'V', 'A', 'F'])}"
+                for _ in range(ndistinct)]
+    return "\n".join(rng.choice(distinct) for _ in range(nlines)).encode("utf8")
+
+def main():
+    io = EngineerIO()
+    for nlines in (100000, 1000000):
+        data = make_data(nlines)
+        with tempfile.TemporaryFile() as tmp:
+            tmp.write(data)
+            tmp.flush()
+            start = time.perf_counter()
+            tmp.seek(0)
+            lines = [io.normalize(line.decode("utf8")).value for line in tmp]
+            per_line = time.perf_counter() - start
+            with mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = time.perf_counter()
+                result = io.normalize_buffer(mm)
+                buffered = time.perf_counter() - start
+                del result
+        print(f"{nlines:>8} lines: per line {per_line * 1e3:>8.1f}ms, "
+              f"normalize_buffer {buffered * 1e3:>7.1f}ms ({per_line / buffered:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Call overhead of @normalize_numeric_args
+
+Usage (from the repository root):
+    python -m benchmarks.decorators
+"""
+import timeit
+
+import numpy as np
+
+from UliEngineering.Electronics.Resistors import power_dissipated_in_resistor_by_current
+from UliEngineering.EngineerIO.Decorators import normalize_numeric_args
+
+@normalize_numeric_args(exclude=["unit"])
+def _with_defaults(value, unit="V", scale="1k"):
+    return value * scale
+
+def best_of(func, number, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+def main():
+    func = power_dissipated_in_resistor_by_current
+    plain = func.__wrapped__
+    arr = np.linspace(1., 2., 1000)
+    cases = [
+        ("undecorated (floats)", lambda: plain(1e3, 0.01)),
+        ("floats", lambda: func(1e3, 0.01)),
+        ("ints", lambda: func(1000, 1)),
+        ("keyword floats", lambda: func(resistor=1e3, current=0.01)),
+        ("float64 arrays", lambda: func(arr, arr)),
+        ("strings", lambda: func("1k", "10mA")),
+        ("normalized string default", lambda: _with_defaults(2.0)),
+    ]
+    for name, call in cases:
+        print(f"{name:>26}: {best_of(call, number=100000) * 1e6:>8.3f}µs")
+
+if __name__ == "__main__":
+    main()
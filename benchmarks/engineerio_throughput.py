@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Throughput of the EngineerIO parser & formatter
+(normalize, normalize_numeric, safe_normalize, format, auto_format)
+for different classes of engineer notation.
+
+The results (values per second) can be saved as a JSON baseline.
+In comparison mode, the exit status is 1 if any throughput is
+lower than the baseline by more than the tolerance.
+
+Usage (from the repository root):
+    python -m benchmarks.engineerio_throughput
+    python -m benchmarks.engineerio_throughput --save baseline.json
+    python -m benchmarks.engineerio_throughput --compare baseline.json --tolerance 0.2
+
+Baselines are machine specific. Record them on the machine
+the comparison will run on.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.Decorators import normalize_numeric_args, returns_unit
+
+NOTATION_CLASSES = {
+    "plain": ["1", "-2.5", "3.14159", "1e-3", "42", "0.5", "1000", "7.5e6"],
+    "si_prefix": ["4.7k", "100n", "3.3 mV", "10 µA", "2.2 MΩ", "15 pF", "1.5 GHz", "680 mW"],
+    "prefix_decimal": ["1k25", "4k7", "2M2", "4µ7", "3m3", "6n8", "1G5", "2p2"],
+    "thousands_separator": ["1,234.56", "1.234,56 mV", "12,345.6 Ω", "1,5 mA",
+                            "999,999.9", "2.500,5", "1,000.5 V", "0,5"],
+    "long_alias": ["1 parts per million", "10 parts per billion", "2.5 percent", "3 amperes",
+                   "60 seconds", "2 minutes", "5 coulombs", "100 parts per trillion"],
+    "failure": ["foobar", "k12", "1.2kkA", "1k2.4", "1x5", "", "1e", "1.2.3"],
+}
+
+@returns_unit("V")
+@normalize_numeric_args
+def _auto_format_target(value):
+    return value
+
+def _swallow(func):
+    """Call func, ignoring the exceptions raised for invalid values"""
+    def call(value):
+        try:
+            return func(value)
+        except (ValueError, ArithmeticError):
+            return None
+    return call
+
+def make_operations(io):
+    """
+    Get a dict of operation name => (function of one value, whether to
+    pass the strings (True) or their normalized values with units (False))
+    """
+    format_value = lambda value: io.format(value[0], value[1])
+    return {
+        "normalize": (_swallow(io.normalize), True),
+        "normalize_numeric": (_swallow(io.normalize_numeric), True),
+        "safe_normalize": (io.safe_normalize, True),
+        "format": (format_value, False),
+        "auto_format": (_swallow(lambda value: io.auto_format(_auto_format_target, value)), True),
+    }
+
+def run(repeat=5, min_time=0.05):
+    """
+    Measure every operation for every notation class.
+    Returns a dict "operation/class" => values per second
+
+    The suite is run repeat times and the best result of every
+    measurement is used, so a temporarily busy machine only affects
+    one round instead of all repetitions of a measurement.
+    """
+    io = EngineerIO()
+    cases = {}
+    for operation, (func, takes_strings) in make_operations(io).items():
+        for name, strings in NOTATION_CLASSES.items():
+            if takes_strings:
+                values = strings
+            else:
+                if name == "failure":
+                    continue
+                values = [(result.value, result.unit) for result in map(io.normalize, strings)]
+            timer = timeit.Timer(lambda func=func, values=values: [func(value) for value in values])
+            # Every measurement should take about min_time
+            number = max(1, int(min_time / max(timer.timeit(number=10) / 10, 1e-9)))
+            cases[f"{operation}/{name}"] = (timer, number, len(values))
+    results = dict.fromkeys(cases, 0.)
+    for _ in range(repeat):
+        for key, (timer, number, nvalues) in cases.items():
+            results[key] = max(results[key], nvalues * number / timer.timeit(number=number))
+    return results
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results to the baseline results.
+    Returns a list of (key, baseline, current, ratio, regressed) tuples.
+    Keys missing in either dict are ignored.
+    """
+    rows = []
+    for key, reference in baseline.items():
+        if key not in results:
+            continue
+        ratio = results[key] / reference
+        rows.append((key, reference, results[key], ratio, ratio < 1. - tolerance))
+    return rows
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__,
+            "machine": platform.machine(), "processor": platform.processor()}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EngineerIO throughput benchmark")
+    parser.add_argument("--save", metavar="JSON", help="Save the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="Compare the results to a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative throughput loss in comparison mode (default: 0.2)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="Minimum duration of every measurement in seconds")
+    args = parser.parse_args(argv)
+
+    results = run(repeat=args.repeat, min_time=args.min_time)
+    if args.save:
+        with open(args.save, "w") as outfile:
+            json.dump({"environment": environment(), "results": results}, outfile, indent=2)
+    if not args.compare:
+        for key, throughput in results.items():
+            print(f"{key:>40}: {throughput / 1e3:>9.1f}k values/s")
+        return 0
+    with open(args.compare) as infile:
+        baseline = json.load(infile)
+    if baseline.get("environment") != environment():
+        print("Warning: Baseline was recorded in a different environment", file=sys.stderr)
+    rows = compare(results, baseline["results"], args.tolerance)
+    for key, reference, current, ratio, regressed in rows:
+        print(f"{key:>40}: {reference / 1e3:>9.1f}k -> {current / 1e3:>9.1f}k values/s "
+              f"({ratio:>5.2f}x){' REGRESSION' if regressed else ''}")
+    regressions = sum(row[4] for row in rows)
+    if regressions:
+        print(f"{regressions} of {len(rows)} measurements regressed by more than "
+              f"{args.tolerance:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
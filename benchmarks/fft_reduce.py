@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: (serial|parallel)_fft_reduce() and the spectral power variant
+in the default per-chunk mode vs. the batched mode, for many small FFTs,
+and the power of 12 frequency bands computed by one call per band
+vs. a single multi-band call.
+
+Usage (from the repository root):
+    python -m benchmarks.fft_reduce
+"""
+import time
+
+import numpy as np
+
+from UliEngineering.SignalProcessing.Chunks import overlapping_chunks
+from UliEngineering.SignalProcessing.FFT import (
+    parallel_fft_reduce, serial_fft_reduce, parallel_spectral_power_fft_reduce)
+
+def timeit(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    n = 4000000
+    data = np.random.default_rng(0).standard_normal(n)
+    functions = {
+        "serial_fft_reduce": serial_fft_reduce,
+        "parallel_fft_reduce": parallel_fft_reduce,
+        "parallel_spectral_power_fft_reduce": parallel_spectral_power_fft_reduce,
+    }
+    for fftsize in (256, 1024):
+        chunkgen = overlapping_chunks(data, fftsize, fftsize // 4)
+        print(f"fftsize={fftsize} ({len(chunkgen)} chunks):")
+        for name, fn in functions.items():
+            reference = timeit(lambda: fn(chunkgen, 1e3, fftsize), repeat=1)
+            elapsed = timeit(lambda: fn(chunkgen, 1e3, fftsize, mode="batched"))
+            print(f"  {name:>36}: {reference * 1e3:>8.1f}ms -> {elapsed * 1e3:>8.1f}ms "
+                  f"({reference / elapsed:.1f}x)")
+        # One call per band vs. all bands at once
+        bands = [(f, f + 25.) for f in np.arange(0., 300., 25.)]
+        reference = timeit(lambda: [parallel_spectral_power_fft_reduce(
+            chunkgen, 1e3, fftsize, start=start, end=end, mode="batched") for start, end in bands])
+        elapsed = timeit(lambda: parallel_spectral_power_fft_reduce(
+            chunkgen, 1e3, fftsize, bands=bands, mode="batched"))
+        print(f"  {f'{len(bands)} bands':>36}: {reference * 1e3:>8.1f}ms -> {elapsed * 1e3:>8.1f}ms "
+              f"({reference / elapsed:.1f}x)")
+
+if __name__ == "__main__":
+    main()
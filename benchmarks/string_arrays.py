@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: EngineerIO.normalize_numeric() on object arrays vs.
+fixed-width 'U' / 'S' arrays and NumPy 2 StringDType arrays,
+for columns of plain numbers and of engineer notation values.
+
+Usage (from the repository root):
+    python -m benchmarks.string_arrays
+"""
+import random
+import time
+
+import numpy as np
+
+from UliEngineering.EngineerIO import EngineerIO
+
+def make_columns(n, seed=0):
+    rng = random.Random(seed)
+    plain = [f"{rng.uniform(-1e3, 1e3):.6g}" for _ in range(n)]
+    distinct = [f"{rng.uniform(1, 999):.3f} {rng.choice('pnµmkM')}V" for _ in range(1000)]
+    engineer = [rng.choice(distinct) for _ in range(n)]
+    return {"plain numbers": plain, "engineer notation": engineer}
+
+def timeit(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    io = EngineerIO()
+    n = 1000000
+    for name, values in make_columns(n).items():
+        arrays = {"U": np.asarray(values)}
+        # A new str object per element, like when reading from a file
+        arrays = {"object": np.asarray(arrays["U"].tolist(), dtype=object), **arrays}
+        arrays["S"] = np.char.encode(arrays["U"], "utf8")
+        if hasattr(np, "dtypes") and hasattr(np.dtypes, "StringDType"):
+            arrays["StringDType"] = arrays["U"].astype(np.dtypes.StringDType())
+        reference = timeit(lambda: io.normalize_numeric(arrays["object"]))
+        print(f"{name} ({n} values):")
+        for dtype_name, arr in arrays.items():
+            elapsed = timeit(lambda: io.normalize_numeric(arr))
+            print(f"  {dtype_name:>12}: {elapsed * 1e3:>8.1f}ms ({reference / elapsed:.1f}x)")
+
+if __name__ == "__main__":
+    main()
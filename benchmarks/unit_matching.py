@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Unit matching using suffix tries vs. regex alternations
+for different numbers of registered units.
+
+Usage (from the repository root):
+    python -m benchmarks.unit_matching
+"""
+import re
+import timeit
+
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.UnitInfo import EngineerIOConfiguration, UnitInfo
+
+def make_config(nunits):
+    units = [UnitInfo(f"u{i}x", aliases=[f"unit number {i}"]) for i in range(nunits)]
+    return EngineerIOConfiguration(
+        units=units,
+        unit_prefixes=["±"],
+        si_prefix_map={"k": 3, "m": -3})
+
+def best_of(func, number, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+def main():
+    print(f"{'units':>6} {'construct':>12} {'regex compile':>14} "
+          f"{'trie match':>11} {'regex match':>12} {'normalize':>10}")
+    for nunits in (10, 100, 5000):
+        config = make_config(nunits)
+        io = EngineerIO(config)
+        s = f"1.5 k unit number {nunits - 1}"
+        construct = best_of(lambda: EngineerIO(config), number=3)
+        def compile_regexes():
+            re.purge() # Don't measure re's internal pattern cache
+            fresh = EngineerIO(config)
+            fresh._compile_units_regex()
+            fresh._compile_unit_alias_regex()
+        regex_compile = best_of(compile_regexes, number=1) - construct
+        trie_match = best_of(lambda: io.unit_alias_trie.match(s), number=10000)
+        regex = io.unit_alias_regex
+        regex_match = best_of(lambda: regex.search(s), number=1000)
+        normalize = best_of(lambda: io.normalize(s), number=10000)
+        print(f"{nunits:>6} {construct * 1e3:>10.2f}ms {regex_compile * 1e3:>12.2f}ms "
+              f"{trie_match * 1e6:>9.2f}µs {regex_match * 1e6:>10.2f}µs {normalize * 1e6:>8.2f}µs")
+
+if __name__ == "__main__":
+    main()
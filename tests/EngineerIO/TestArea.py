@@ -13,6 +13,19 @@ class TestArea(unittest.TestCase):
     def setUp(self):
         self.area_io = EngineerAreaIO()
 
+    def test_convert_area_vectorized(self):
+        np.testing.assert_allclose(convert_area_to_square_meters(np.asarray([1., 2.]), "cm²"), [1e-4, 2e-4])
+        np.testing.assert_allclose(convert_area_to_square_meters([1., 2.], ["mm²", "ha"]), [1e-6, 2e4])
+        assert_approx_equal(convert_area_to_square_meters(3, "km²"), 3e6)
+
+    def test_convert_area_strings_in_list(self):
+        # The prefix of an engineer string is squared, like for scalars
+        assert_approx_equal(convert_area_to_square_meters("1k", "m²"), 1e6)
+        np.testing.assert_allclose(convert_area_to_square_meters(["1k"], "m²"), [1e6])
+        np.testing.assert_allclose(convert_area_to_square_meters(np.asarray(["1k", "2"]), "m²"), [1e6, 2.])
+        np.testing.assert_allclose(convert_area_to_square_meters([None, 2., "1k"], ["m²", "cm²", "m²"]),
+                                   [np.nan, 2e-4, 1e6])
+
     def test_area_normalization_basic(self):
         # Basic numeric values
         assert_approx_equal(normalize_area(1.0), 1.0)
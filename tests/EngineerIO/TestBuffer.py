@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import mmap
+import random
+import tempfile
+import tracemalloc
+from numpy.testing import assert_allclose, assert_array_equal
+from parameterized import parameterized
+from UliEngineering.EngineerIO import EngineerIO, normalize_buffer
+from UliEngineering.EngineerIO.Buffer import delimiter_table, iter_field_chunks
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.Exceptions import EngineerIOException
+import numpy as np
+import unittest
+
+class TestIterFieldChunks(unittest.TestCase):
+    @parameterized.expand([
+        (b"a,bb\nccc", [b"a", b"bb", b"ccc"]),
+        (b"a\n", [b"a"]),
+        (b"a\n\nb", [b"a", b"", b"b"]),
+        (b",a", [b"", b"a"]),
+        (b"", []),
+    ])
+    def test_split(self, data, expected):
+        for chunk_size in (1, 2, 3, 100):
+            fields = [field for chunk in iter_field_chunks(data, b",\n", chunk_size=chunk_size)
+                      for field in chunk.tolist()]
+            self.assertEqual(fields, expected)
+
+    def test_long_fields(self):
+        data = b"1\n" + b"x" * 100 + b"\n22\n333\n" + b"y" * 70
+        chunks = list(iter_field_chunks(data, max_width=64))
+        self.assertEqual([chunk.tolist() for chunk in chunks],
+                         [[b"1"], [b"x" * 100], [b"22", b"333"], [b"y" * 70]])
+        self.assertEqual([chunk.dtype.itemsize for chunk in chunks], [1, 100, 3, 70])
+
+    def test_delimiter_table(self):
+        table = delimiter_table(",\n")
+        self.assertEqual(np.flatnonzero(table).tolist(), [ord("\n"), ord(",")])
+        with self.assertRaises(ValueError):
+            delimiter_table("µ")
+        with self.assertRaises(ValueError):
+            delimiter_table(b"")
+
+class TestNormalizeBuffer(unittest.TestCase):
+    def setUp(self):
+        self.io = EngineerIO()
+
+    def test_normalize_buffer(self):
+        data = "4.7kΩ,1µF\r\n3.3V, 1k25\n\n2 mA\n".encode("utf8")
+        expected = [4700., 1e-6, 3.3, 1250., 2e-3]
+        assert_allclose(normalize_buffer(data, b",\n"), expected)
+        assert_allclose(self.io.normalize_buffer(memoryview(data), ",\n"), expected)
+        assert_allclose(self.io.normalize_buffer(bytearray(data), ",\n"), expected)
+
+    def test_chunk_boundaries(self):
+        rng = random.Random(1)
+        values = ["1k", "4.7kΩ", "100 nF", "3.3V", "1µ234"]
+        # The last field is longer than some of the chunk sizes
+        values = [rng.choice(values) for _ in range(500)] + ["12345678901234567890"]
+        data = "\n".join(values).encode("utf8")
+        expected = self.io.normalize_numeric(values)
+        for chunk_size in (1, 7, 64, 1 << 20):
+            assert_allclose(self.io.normalize_buffer(data, chunk_size=chunk_size), expected)
+
+    def test_long_field_memory(self):
+        # One long field must not make the index matrix nfields x 100k large
+        data = b"\n".join([b"1k"] * 300000 + [b"x" * 100000])
+        tracemalloc.start()
+        try:
+            result = self.io.normalize_buffer(data, strict=False)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(result.shape, (300001,))
+        assert_array_equal(result[:3], [1000., 1000., 1000.])
+        self.assertTrue(np.isnan(result[-1]))
+        self.assertLess(peak, 200e6)
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as tmp:
+            tmp.write("1 mil\n2 inch\n3 ft\n".encode("utf8"))
+            tmp.flush()
+            with mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                result = EngineerLengthIO().normalize_buffer(mm)
+        assert_allclose(result, [25.4e-6, 2 * 25.4e-3, 3 * 0.3048])
+
+    def test_out(self):
+        out = np.full(5, -1.)
+        result = self.io.normalize_buffer(b"1k\n2k\n3k", out=out)
+        assert_array_equal(result, [1000., 2000., 3000.])
+        self.assertIs(result.base, out)
+        assert_array_equal(out, [1000., 2000., 3000., -1., -1.])
+        with self.assertRaises(ValueError):
+            self.io.normalize_buffer(b"1k\n2k\n3k", out=np.zeros(2))
+
+    def test_invalid(self):
+        with self.assertRaises(EngineerIOException):
+            self.io.normalize_buffer(b"1k\nfoo\n")
+        assert_array_equal(self.io.normalize_buffer(b"1k\nfoo\n", strict=False), [1000., np.nan])
+        assert_array_equal(self.io.normalize_buffer(b"1k\n\n2k", strict=False, skip_empty=False),
+                           [1000., np.nan, 2000.])
+        with self.assertRaises(ValueError):
+            self.io.normalize_buffer(b"1k\n\n2k", skip_empty=False)
+
+    def test_empty(self):
+        self.assertEqual(self.io.normalize_buffer(b"").shape, (0,))
+        self.assertEqual(self.io.normalize_buffer(b"\n\n").shape, (0,))
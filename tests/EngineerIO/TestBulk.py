@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from numpy.testing import assert_allclose, assert_array_equal
+from UliEngineering.EngineerIO import EngineerIO
+from parameterized import parameterized
+from unittest import mock
+from UliEngineering.EngineerIO import Bulk
+from UliEngineering.EngineerIO.Bulk import as_bulk_array, bulk_apply, parse_plain_numbers, unique_inverse
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.Exceptions import EngineerIOException
+import numpy as np
+import unittest
+
+class TestBulk(unittest.TestCase):
+    def setUp(self):
+        self.io = EngineerIO()
+
+    def test_unique_inverse_strings(self):
+        arr = np.asarray(["1k", "2k", "1k", "3k", "2k"])
+        uniques, inverse = unique_inverse(arr)
+        self.assertEqual(len(uniques), 3)
+        self.assertEqual([uniques[i] for i in inverse], arr.tolist())
+        self.assertIsInstance(uniques[0], str)
+
+    def test_unique_inverse_fixed_width(self):
+        values = ["1k", "", "4.7 kΩ", "1k", "a" * 17, "", "a" * 16]
+        for arr in (np.asarray(values), np.char.encode(np.asarray(values), "utf8")):
+            uniques, inverse = unique_inverse(arr)
+            self.assertEqual(len(uniques), 5)
+            self.assertEqual([uniques[i] for i in inverse], arr.tolist())
+        self.assertEqual(unique_inverse(np.zeros(0, dtype="S3"))[0], [])
+
+    def test_unique_inverse_hash_collision(self):
+        arr = np.asarray(["1k", "2k", "1k"])
+        with mock.patch.object(Bulk, "_hash_fixed_width", return_value=np.zeros(3, dtype=np.uint64)):
+            uniques, inverse = unique_inverse(arr)
+        self.assertEqual([uniques[i] for i in inverse], arr.tolist())
+
+    def test_unique_inverse_objects(self):
+        arr = np.asarray(["1k", 2.5, "1k", b"3k"], dtype=object)
+        uniques, inverse = unique_inverse(arr)
+        self.assertEqual(uniques, ["1k", 2.5, b"3k"])
+        assert_array_equal(inverse, [0, 1, 0, 2])
+
+    def test_bulk_apply_calls_once_per_distinct_value(self):
+        calls = []
+        def func(value):
+            calls.append(value)
+            return self.io.normalize_numeric(value)
+        result = bulk_apply(["1k", "4.7kΩ", "1k", "4.7kΩ", "1k"], func)
+        assert_array_equal(result, [1000., 4700., 1000., 4700., 1000.])
+        self.assertEqual(sorted(calls), ["1k", "4.7kΩ"])
+
+    def test_normalize_numeric_array(self):
+        expected = [4700., 100e-9, 3.3, 1250., 1234.56e-3]
+        values = ["4.7kΩ", "100nF", "3.3V", "1k25", "1,234.56 mA"]
+        assert_allclose(self.io.normalize_numeric(values), expected)
+        assert_allclose(self.io.normalize_numeric(tuple(values)), expected)
+        assert_allclose(self.io.normalize_numeric(np.asarray(values)), expected)
+        assert_allclose(self.io.normalize_numeric(np.asarray(values, dtype=object)), expected)
+        assert_allclose(self.io.normalize_numeric(
+            np.asarray([v.encode("utf8") for v in values])), expected)
+
+    def test_normalize_numeric_array_shape(self):
+        result = self.io.normalize_numeric([["1k", "2k"], ["3k", "1k"]])
+        self.assertEqual(result.dtype, np.float64)
+        assert_array_equal(result, [[1000., 2000.], [3000., 1000.]])
+
+    def test_normalize_numeric_mixed(self):
+        result = self.io.normalize_numeric(np.asarray(["1k", 2.5, 3], dtype=object))
+        assert_array_equal(result, [1000., 2.5, 3.])
+        result = self.io.normalize_numeric(np.arange(3))
+        self.assertEqual(result.dtype, np.float64)
+        assert_array_equal(result, [0., 1., 2.])
+
+    @parameterized.expand([
+        ([np.nan, "1k"], [np.nan, 1000.]),
+        ([np.inf, "1k"], [np.inf, 1000.]),
+        ((-np.inf, "1k"), [-np.inf, 1000.]),
+        ([True, "1k"], [1., 1000.]),
+        ([np.float32(0.1), "1k"], [float(np.float32(0.1)), 1000.]),
+        ([[1, "2k"], ["3", 4.5]], [[1., 2000.], [3., 4.5]]),
+    ])
+    def test_normalize_numeric_mixed_list(self, values, expected):
+        # Non-string elements must not be converted to strings
+        assert_array_equal(self.io.normalize_numeric(values), expected)
+        assert_array_equal(self.io.normalize_numeric_safe(values), expected)
+        assert_array_equal(self.io.normalize_array(values).values, expected)
+        assert_array_equal(self.io.try_normalize_array(values)[0], expected)
+
+    def test_as_bulk_array(self):
+        self.assertEqual(as_bulk_array(["1k", "2"]).dtype.kind, "U")
+        self.assertEqual(as_bulk_array([b"1k", b"2"]).dtype.kind, "S")
+        self.assertEqual(as_bulk_array([1, 2.5]).dtype, np.float64)
+        self.assertEqual(as_bulk_array([np.nan, "1k"]).dtype, object)
+        self.assertEqual(as_bulk_array(["1k", b"2"]).dtype, object)
+
+    def test_normalize_numeric_array_empty(self):
+        result = self.io.normalize_numeric([])
+        self.assertEqual(result.shape, (0,))
+
+    def test_normalize_numeric_array_raises(self):
+        with self.assertRaises(EngineerIOException):
+            self.io.normalize_numeric(["1k", "foobar", "1k"])
+
+    def test_normalize_numeric_safe_array(self):
+        result = self.io.normalize_numeric_safe(["1k", "foobar", "1k"])
+        assert_array_equal(result, [1000., np.nan, 1000.])
+
+    def test_subclass(self):
+        result = EngineerLengthIO().normalize_numeric(["1 mil", "1 inch", "1 mil"])
+        assert_array_equal(result, [25.4e-6, 25.4e-3, 25.4e-6])
+
+class TestPlainNumbers(unittest.TestCase):
+    def setUp(self):
+        self.io = EngineerIO()
+
+    def string_arrays(self, values):
+        arr = np.asarray(values)
+        yield arr
+        yield np.char.encode(arr, "utf8")
+        if hasattr(np, "dtypes") and hasattr(np.dtypes, "StringDType"):
+            yield arr.astype(np.dtypes.StringDType())
+
+    @parameterized.expand([
+        (["1", "-2.5", " 3e3\r", "+.5", "1.e-3"], [1., -2.5, 3e3, .5, 1e-3]),
+        ([["1", "2"], ["3", "4"]], [[1., 2.], [3., 4.]]),
+    ])
+    def test_plain(self, values, expected):
+        for arr in self.string_arrays(values):
+            assert_array_equal(parse_plain_numbers(arr), expected)
+            assert_array_equal(self.io.normalize_numeric(arr), expected)
+            assert_array_equal(self.io.try_normalize_array(arr)[0], expected)
+            assert_array_equal(self.io.normalize_array(arr).values, expected)
+
+    @parameterized.expand([
+        # Engineer notation or semantics differing from float()
+        (["1", "1k"],),
+        (["1", "1E5"],),
+        (["1", "nan"],),
+        (["1", "inf"],),
+        (["1", "1_000"],),
+        (["1", "١"],), # Arabic-indic digit
+        # Plain number characters, but no valid number
+        (["1", "1e"],),
+        (["1", "1-2"],),
+        (["1", ""],),
+        (["1", "1 2"],),
+    ])
+    def test_not_plain(self, values):
+        for arr in self.string_arrays(values):
+            self.assertIsNone(parse_plain_numbers(arr))
+            # The general parser determines the result
+            assert_array_equal(self.io.try_normalize_array(arr)[0],
+                               self.io.try_normalize_array(np.asarray(values, dtype=object))[0])
+
+    def test_engineer_notation(self):
+        values = ["4.7kΩ", "100nF", "1E5", "4.7kΩ"]
+        expected = [4700., 100e-9, 1.5e18, 4700.]
+        for arr in self.string_arrays(values):
+            assert_allclose(self.io.normalize_numeric(arr), expected)
+
+    def test_bulk_apply_generic(self):
+        # Arbitrary functions still get every distinct value
+        result = bulk_apply(np.asarray(["1", "2", "1"]), lambda v: float(v) + 1)
+        assert_array_equal(result, [2., 3., 2.])
+
+    def test_non_string(self):
+        self.assertIsNone(parse_plain_numbers(np.asarray([1., 2.])))
+        self.assertIsNone(parse_plain_numbers(np.asarray(["1"], dtype=object)))
+        self.assertEqual(parse_plain_numbers(np.zeros((0, 2), dtype="S3")).shape, (0, 2))
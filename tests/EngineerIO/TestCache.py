@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.Cache import CacheInfo, LRUCache
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.Exceptions import EngineerIOException
+import unittest
+
+class TestLRUCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        # "b" is now least recently used
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.info(), CacheInfo(hits=3, misses=1, evictions=1, maxsize=2, currsize=2))
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info(), CacheInfo(maxsize=2))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+class TestEngineerIOCache(unittest.TestCase):
+    def test_disabled_by_default(self):
+        io = EngineerIO()
+        self.assertIsNone(io.cache_info())
+        io.cache_clear() # Must not raise
+
+    def test_normalize_cached(self):
+        io = EngineerIO(cache_size=16)
+        first = io.normalize("4.7kΩ")
+        second = io.normalize("4.7kΩ")
+        self.assertIs(first, second)
+        self.assertEqual(second.value, 4700.)
+        self.assertEqual(second.unit, "Ω")
+        info = io.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        # Different prefix exponent => separate entry
+        io.normalize("4.7kΩ", prefix_exponent=2)
+        self.assertEqual(io.cache_info().misses, 2)
+        io.cache_clear()
+        self.assertEqual(io.cache_info().currsize, 0)
+
+    def test_normalize_numeric_cached(self):
+        io = EngineerIO(cache_size=2)
+        for s in ["1k", "2k", "3k", "1k"]:
+            io.normalize_numeric(s)
+        info = io.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (0, 4, 2))
+
+    def test_errors_are_not_cached(self):
+        io = EngineerIO(cache_size=16)
+        for _ in range(2):
+            with self.assertRaises(EngineerIOException):
+                io.normalize("foobar")
+        self.assertEqual(io.cache_info().currsize, 0)
+
+    def test_enable_disable(self):
+        io = EngineerLengthIO()
+        io.enable_cache(8)
+        self.assertAlmostEqual(io.normalize_numeric("1 mil"), 25.4e-6)
+        self.assertAlmostEqual(io.normalize_numeric("1 mil"), 25.4e-6)
+        self.assertEqual(io.cache_info().hits, 1)
+        io.disable_cache()
+        self.assertIsNone(io.cache_info())
+
+    def test_subclass_constructor(self):
+        io = EngineerLengthIO(cache_size=8)
+        self.assertEqual(io.cache_info().maxsize, 8)
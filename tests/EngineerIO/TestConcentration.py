@@ -10,6 +10,11 @@ class TestMassConcentration(unittest.TestCase):
     def setUp(self):
         self.mass_io = EngineerMassConcentrationIO()
 
+    def test_convert_vectorized(self):
+        values = np.asarray([1., 2.])
+        np.testing.assert_allclose(convert_mass_concentration_to_per_liter(values, "ppm"),
+                                   [normalize_mass_concentration("1 ppm"), normalize_mass_concentration("2 ppm")])
+
     def test_basic_normalization(self):
         assert_approx_equal(normalize_mass_concentration(1.0), 1.0)
         assert_approx_equal(self.mass_io.normalize_mass_concentration(5.0), 5.0)
@@ -88,6 +93,11 @@ class TestAmountConcentration(unittest.TestCase):
     def setUp(self):
         self.amount_io = EngineerAmountConcentrationIO()
 
+    def test_convert_vectorized(self):
+        values = np.asarray([1., 2.])
+        np.testing.assert_allclose(convert_amount_concentration_to_grams_per_liter(values, ["mmol/l", "µmol/l"]),
+                                   [1e-3, 2e-6])
+
     def test_basic_normalization(self):
         assert_approx_equal(normalize_amount_concentration(1.0), 1.0)
         assert_approx_equal(self.amount_io.normalize_amount_concentration(5.0), 5.0)
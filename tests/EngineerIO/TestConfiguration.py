@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from dataclasses import FrozenInstanceError
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.EngineerIO.UnitInfo import EngineerIOConfiguration, UnitInfo
+import unittest
+
+class TestEngineerIOConfiguration(unittest.TestCase):
+    def test_equality(self):
+        self.assertEqual(EngineerIOConfiguration.default(), EngineerIOConfiguration.default())
+        self.assertEqual(hash(EngineerIOConfiguration.default()),
+                         hash(EngineerIOConfiguration.default()))
+        # Freezing doesn't change equality
+        self.assertEqual(EngineerIOConfiguration.default().freeze(),
+                         EngineerIOConfiguration.default())
+        config = EngineerIOConfiguration.default()
+        config.units.append(UnitInfo("foo"))
+        self.assertNotEqual(config, EngineerIOConfiguration.default())
+
+    def test_freeze(self):
+        config = EngineerIOConfiguration.default()
+        self.assertFalse(config.frozen)
+        self.assertIs(config.freeze(), config)
+        self.assertTrue(config.frozen)
+        with self.assertRaises(FrozenInstanceError):
+            config.units = []
+        with self.assertRaises(AttributeError):
+            config.units.append(UnitInfo("foo"))
+        with self.assertRaises(TypeError):
+            config.si_prefix_map["x"] = 1
+        self.assertIs(config.cache_key(), config.cache_key())
+
+class TestCompiledConfigurationSharing(unittest.TestCase):
+    def test_shared_tables(self):
+        io1, io2 = EngineerIO(), EngineerIO()
+        self.assertIs(io1.units_trie, io2.units_trie)
+        self.assertIs(io1._scanner, io2._scanner)
+        self.assertIs(EngineerLengthIO().units_trie, EngineerLengthIO().units_trie)
+        self.assertIsNot(EngineerLengthIO().units_trie, io1.units_trie)
+        # Equal, but not identical configuration
+        io3 = EngineerIO(config=EngineerIOConfiguration.default())
+        self.assertIs(io3.units_trie, io1.units_trie)
+
+    def test_distinct_configurations(self):
+        config = EngineerIOConfiguration.default()
+        config.units.append(UnitInfo("foo", 2.0))
+        io = EngineerIO(config=config)
+        self.assertEqual(io.normalize("3 kfoo").value, 6000.)
+        with self.assertRaises(ValueError):
+            EngineerIO().normalize("3 kfoo")
+
+    def test_per_instance_state(self):
+        io1 = EngineerIO(cache_size=16, engine="scan")
+        io2 = EngineerIO()
+        self.assertEqual(io1.engine, "scan")
+        self.assertEqual(io2.engine, "regex")
+        self.assertIsNone(io2.cache_info())
+        self.assertEqual(io1.normalize("4.7kΩ").value, 4700.)
+        self.assertEqual(io2.normalize("4.7kΩ").value, 4700.)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import inspect
+from numpy.testing import assert_array_equal
+from UliEngineering.EngineerIO.Decorators import normalize_numeric_args, returns_unit
+import numpy as np
+import unittest
+
+@normalize_numeric_args
+@returns_unit("W")
+def _power(voltage, current):
+    return voltage * current
+
+@normalize_numeric_args(exclude=["unit"])
+def _with_unit(value, unit="V", scale="1k"):
+    return value, unit, scale
+
+@normalize_numeric_args
+def _keyword_only(value, *, offset="1m"):
+    return value + offset
+
+@normalize_numeric_args
+def _positional_only(value, scale="2k", /):
+    return value * scale
+
+@normalize_numeric_args
+def _varargs(*values):
+    return values
+
+@normalize_numeric_args
+def _negate_in_place(values):
+    values *= -1
+    return values
+
+@normalize_numeric_args
+def _identity(value):
+    return value
+
+class TestNormalizeNumericArgs(unittest.TestCase):
+    def test_numeric(self):
+        self.assertEqual(_power(2.0, 3), 6.0)
+        self.assertEqual(_power(voltage=2.0, current=3.0), 6.0)
+        self.assertEqual(_power._returns_unit, "W")
+
+    def test_strings(self):
+        self.assertAlmostEqual(_power("1kV", "2mA"), 2.0)
+        self.assertAlmostEqual(_power(1000, current="2mA"), 2.0)
+        self.assertAlmostEqual(_power(voltage="1kV", current=2e-3), 2.0)
+
+    def test_exclude(self):
+        self.assertEqual(_with_unit("2k"), (2000., "V", 1000.))
+        self.assertEqual(_with_unit("2k", "A"), (2000., "A", 1000.))
+        self.assertEqual(_with_unit(2.0, unit="A", scale="3k"), (2.0, "A", 3000.))
+        self.assertEqual(_with_unit(2.0, "A", 5), (2.0, "A", 5))
+
+    def test_string_defaults(self):
+        self.assertAlmostEqual(_keyword_only(1.0), 1.001)
+        self.assertAlmostEqual(_keyword_only("1k", offset=1), 1001.)
+        self.assertEqual(_positional_only(2.0), 4000.)
+        self.assertEqual(_positional_only(2.0, "3"), 6.0)
+        # Defaults are visible in the signature
+        self.assertEqual(inspect.signature(_with_unit).parameters["scale"].default, 1000.)
+        self.assertEqual(inspect.signature(_with_unit).parameters["unit"].default, "V")
+
+    def test_varargs(self):
+        self.assertEqual(_varargs(1, "2k", 3.0), (1, 2000., 3.0))
+
+    def test_arrays(self):
+        arr = np.asarray([1., 2.])
+        assert_array_equal(_identity(arr), arr)
+        # The decorated function gets a copy it may modify in-place
+        self.assertIsNot(_identity(arr), arr)
+        self.assertIsNot(_identity(value=arr), arr)
+        _negate_in_place(arr)
+        assert_array_equal(arr, [1., 2.])
+        result = _identity(np.arange(3))
+        self.assertEqual(result.dtype, np.float64)
+        assert_array_equal(_identity(["1k", "2k"]), [1000., 2000.])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            _identity(None)
+        with self.assertRaises(TypeError):
+            _power(1.0)
+        with self.assertRaises(TypeError):
+            _power(1.0, 2.0, 3.0)
@@ -173,6 +173,48 @@ class TestEngineerIO(unittest.TestCase):
         self.assertEqual(self.io.format(1.999999, ""), '2.00')
         self.assertEqual(self.io.format(1.999999, None), '2.00')
 
+    def test_format_array(self):
+        values = [1.0e-3, 2.2e3, -4.7e-12, 0., 1000., 999.9, 1e6, np.nan, 123.456e6]
+        for unit in ["", "V"]:
+            for significant_digits in [2, 3, 4]:
+                expected = [self.io.format(v, unit, significant_digits) for v in values]
+                self.assertEqual(format_array(values, unit, significant_digits).tolist(), expected)
+        # Shape is retained
+        result = self.io.format_array([[1e3, 2e3], [3e-3, 4e-3]], "A")
+        self.assertEqual(result.shape, (2, 2))
+        self.assertEqual(result[1, 1], "4.00 mA")
+
+    def test_format_array_common_prefix(self):
+        result = self.io.format_array([1e3, 2.2e3, 15., np.nan], "Ω", common_prefix=True)
+        self.assertEqual(result.tolist(), ["1.00 kΩ", "2.20 kΩ", "0.015 kΩ", "- Ω"])
+        result = self.io.format_array([np.nan], "Ω", common_prefix=True)
+        self.assertEqual(result.tolist(), ["- Ω"])
+
+    def test_format_array_invalid(self):
+        with self.assertRaises(ValueError):
+            self.io.format_array([1.0, 1e100])
+        with self.assertRaises(ValueError):
+            self.io.format_array([1.0, np.inf])
+        # Also if all values share the prefix
+        for value in (np.inf, -np.inf):
+            with self.assertRaises(ValueError):
+                self.io.format_array([1.0, value], "V", common_prefix=True)
+
+    def test_format_array_significant_digits(self):
+        values = [0.5, 5., 500., 5e3, 0.005, np.nan]
+        for significant_digits in [1, 2]:
+            expected = [self.io.format(v, "V", significant_digits) for v in values]
+            self.assertEqual(self.io.format_array(values, "V", significant_digits).tolist(), expected)
+        # Values 10 ... 100 need at least 2 significant digits, like format()
+        with self.assertRaises(ValueError):
+            self.io.format(50., "V", 1)
+        with self.assertRaises(ValueError):
+            self.io.format_array([50.], "V", 1)
+        # Rounded integer part of huge common prefix values
+        multiplier, unit_prefix = self.io.auto_suffix_1d(np.asarray([1e40]))
+        self.assertEqual(self.io.format_array([1e40], "V", common_prefix=True)[0],
+                         f"{int(round(1e40 * multiplier))} {unit_prefix}V")
+
     def testRounding(self):
         self.assertEqual(self.io.format(1.999999, ""), '2.00')
         self.assertEqual(self.io.format(19.99999, ""), '20.0')
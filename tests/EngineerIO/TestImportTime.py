@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import re
+import subprocess
+import sys
+import unittest
+
+# Cumulative import time budget for the EngineerIO modules in µs,
+# excluding NumPy. They take about 0.1 s, importing SciPy (even only
+# scipy.constants) would add about 0.15 s.
+IMPORT_TIME_BUDGET = 200_000
+
+_modules = ["UliEngineering.EngineerIO",
+            "UliEngineering.EngineerIO.Length",
+            "UliEngineering.EngineerIO.Area",
+            "UliEngineering.EngineerIO.Volume"]
+
+def _run_python(code):
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+
+def _cumulative_import_time(stderr, module):
+    match = re.search(rf"^import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*{re.escape(module)}$",
+                      stderr, re.MULTILINE)
+    return int(match.group(1)) if match else None
+
+class TestImportTime(unittest.TestCase):
+    def test_engineerio_import_time(self):
+        for module in _modules:
+            with self.subTest(module=module):
+                # Import NumPy first so it isn't part of the module's time
+                result = _run_python(f"import numpy, {module}")
+                module_time = _cumulative_import_time(result.stderr, module)
+                self.assertIsNotNone(module_time, result.stderr)
+                self.assertLess(module_time, IMPORT_TIME_BUDGET)
+
+    def test_no_scipy_on_import(self):
+        modules = ["UliEngineering.EngineerIO.Concentration",
+                   "UliEngineering.SignalProcessing.FFT",
+                   "UliEngineering.SignalProcessing.Filter",
+                   "UliEngineering.SignalProcessing.Normalize",
+                   "UliEngineering.SignalProcessing.Resampling",
+                   "UliEngineering.SignalProcessing.Selection"]
+        for module in _modules + modules:
+            with self.subTest(module=module):
+                result = _run_python(f"import sys, {module}; print('scipy' in sys.modules)")
+                self.assertEqual(result.stdout.strip(), "False")
+
+    def test_no_multiprocessing_on_import(self):
+        # Only parallel_normalize_numeric() needs the process pool & shared memory
+        result = _run_python("import sys, UliEngineering.EngineerIO; "
+                             "print('concurrent.futures' in sys.modules or 'multiprocessing' in sys.modules)")
+        self.assertEqual(result.stdout.strip(), "False")
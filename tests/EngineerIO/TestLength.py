@@ -1,14 +1,32 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from numpy.testing import assert_approx_equal
+from numpy.testing import assert_allclose, assert_approx_equal
 from parameterized import parameterized
 from UliEngineering.EngineerIO.Length import *
+import numpy as np
 import unittest
 
 class TestLength(unittest.TestCase):
     def setUp(self):
         self.length_io = EngineerLengthIO()
 
+    def test_convert_length_vectorized(self):
+        values = np.asarray([1., 2., 3.])
+        assert_allclose(convert_length_to_meters(values, "mil"), values * 25.4e-6)
+        assert_allclose(convert_length_to_meters(values, ["mm", "in", "km"]), [1e-3, 2 * 0.0254, 3e3])
+        assert_allclose(convert_length_to_meters([1, 2], "cm"), [0.01, 0.02])
+        assert_allclose(convert_length_to_unit(values, "mil", "in"), values * 1e-3)
+        assert_allclose(convert_length_to_unit(values, "in", np.asarray(["mm", "mil", "in"])),
+                        [25.4, 2000., 3.])
+        # Scalars still return scalars
+        assert_approx_equal(convert_length_to_unit(1.0, "in", "mm"), 25.4)
+        self.assertEqual(self.length_io.conversion_table("kpc"), normalize_length("1 kpc"))
+
+    def test_convert_length_mixed_list(self):
+        assert_allclose(convert_length_to_meters([1, "2", None, np.nan], "mm"), [1e-3, 2e-3, np.nan, np.nan])
+        assert_allclose(convert_length_to_meters(("1", "2"), ["mm", "in"]), [1e-3, 2 * 0.0254])
+        assert_allclose(convert_length_to_unit([1, "2"], "in", "mm"), [25.4, 50.8])
+
     def test_length_normalization(self):
         # Test with functions
         assert_approx_equal(normalize_length(1.0), 1.0)
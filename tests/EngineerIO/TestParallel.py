@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import concurrent.futures
+import pickle
+from numpy.testing import assert_allclose, assert_array_equal
+from parameterized import parameterized
+from UliEngineering.EngineerIO import EngineerIO, parallel_normalize_numeric
+from UliEngineering.EngineerIO.Area import EngineerAreaIO
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.EngineerIO.Timespan import EngineerTimespanIO
+from UliEngineering.EngineerIO.UnitInfo import EngineerIOConfiguration, UnitInfo
+from UliEngineering.EngineerIO.Volume import EngineerVolumeIO
+from UliEngineering.Exceptions import EngineerIOException
+import numpy as np
+import unittest
+
+class TestParallelNormalize(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = concurrent.futures.ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def normalize(self, io, values, **kwargs):
+        return io.parallel_normalize_numeric(values, chunk_size=3, executor=self.executor, **kwargs)
+
+    def test_default(self):
+        values = ["1k", "4.7kΩ", "100nF", "3.3V", "1k25", "1,234.56 mA", "1k", 5]
+        io = EngineerIO()
+        assert_allclose(self.normalize(io, values), io.normalize_numeric(values))
+        assert_allclose(self.normalize(io, np.asarray(values[:-1]).reshape(7, 1)),
+                        io.normalize_numeric(values[:-1]).reshape(7, 1))
+
+    @parameterized.expand([
+        (EngineerLengthIO, ["1 mil", "2 inch", "3 ft", "4 km", "5 AU"],
+         [25.4e-6, 0.0508, 0.9144, 4e3, 5 * 149597870700.]),
+        (EngineerAreaIO, ["1 m²", "2 cm²", "3 in²", "4 ha", "5 km²"],
+         [1., 2e-4, 3 * 0.0254 ** 2, 4e4, 5e6]),
+        (EngineerVolumeIO, ["1 L", "2 mL", "3 m³", "4 cm³", "5 mm³"],
+         [1e-3, 2e-6, 3., 4e-6, 5e-9]),
+        (EngineerTimespanIO, ["1 min", "2 h", "3 ms", "4 days"],
+         [60., 7200., 3e-3, 4 * 86400.]),
+    ])
+    def test_subclasses(self, cls, values, expected):
+        io = cls()
+        # Parallel & serial
+        assert_allclose(self.normalize(io, values * 3), expected * 3)
+        assert_allclose(io.parallel_normalize_numeric(values, executor=self.executor), expected)
+
+    def test_subclass_invalid(self):
+        io = EngineerAreaIO()
+        values = ["1 m²", "2 cm²", "3 in²", "foobar", None]
+        with self.assertRaises(EngineerIOException):
+            self.normalize(io, values)
+        assert_array_equal(self.normalize(io, values, strict=False),
+                           [1., 2e-4, 3 * 0.0254 ** 2, np.nan, np.nan])
+        with self.assertRaises(ValueError):
+            io.parallel_normalize_numeric(["1 m²", None])
+
+    @parameterized.expand([
+        ([float("nan"), "1k", "2k", "3k", "4k"], [np.nan, 1e3, 2e3, 3e3, 4e3]),
+        ([True, "1k", "2k", "3k", "4k"], [1., 1e3, 2e3, 3e3, 4e3]),
+        ([np.float32(0.5), "1k", 2, "3k", "4k"], [0.5, 1e3, 2., 3e3, 4e3]),
+    ])
+    def test_mixed_list(self, values, expected):
+        io = EngineerIO()
+        assert_array_equal(io.normalize_numeric(values), expected)
+        for strict in (True, False):
+            # Parallel & serial
+            assert_array_equal(self.normalize(io, values, strict=strict), expected)
+            assert_array_equal(io.parallel_normalize_numeric(values, strict=strict), expected)
+
+    def test_custom_configuration(self):
+        config = EngineerIOConfiguration.default()
+        config.units.append(UnitInfo("foo", 2.0))
+        io = EngineerIO(config=config)
+        assert_allclose(self.normalize(io, ["1 foo", "2 kfoo", "3 mfoo", "4 Mfoo"]),
+                        [2., 4000., 6e-3, 8e6])
+
+    def test_invalid(self):
+        io = EngineerIO()
+        values = ["1k", "2k", "3k", "4k", "foobar", "5k"]
+        with self.assertRaises(EngineerIOException):
+            self.normalize(io, values)
+        assert_array_equal(self.normalize(io, values, strict=False),
+                           [1000., 2000., 3000., 4000., np.nan, 5000.])
+
+    def test_own_pool(self):
+        result = EngineerIO().parallel_normalize_numeric(
+            ["1k", "2k", "3k", "4k"], workers=2, chunk_size=2)
+        assert_array_equal(result, [1000., 2000., 3000., 4000.])
+
+    def test_serial(self):
+        # Few distinct values or numeric data: No process pool
+        assert_array_equal(parallel_normalize_numeric(["1k", "2k"] * 100), [1000., 2000.] * 100)
+        assert_array_equal(parallel_normalize_numeric(np.arange(3)), [0., 1., 2.])
+
+    def test_pickle_configuration(self):
+        config = EngineerIOConfiguration.default().freeze()
+        unpickled = pickle.loads(pickle.dumps(config))
+        self.assertEqual(unpickled, config)
+        self.assertTrue(unpickled.frozen)
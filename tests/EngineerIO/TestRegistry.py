@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from dataclasses import FrozenInstanceError
+import os
+import threading
+import time
+from UliEngineering.EngineerIO import EngineerIO, prewarm
+from UliEngineering.EngineerIO import Registry
+from UliEngineering.EngineerIO.Cache import LRUCache
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.EngineerIO.Timespan import EngineerTimespanIO
+from UliEngineering.EngineerIO.UnitInfo import UnitAlias, UnitInfo
+import unittest
+
+class TestRegistry(unittest.TestCase):
+    def test_instance_per_class(self):
+        self.assertIs(EngineerIO.instance(), EngineerIO.instance())
+        self.assertIs(EngineerLengthIO.instance(), EngineerLengthIO.instance())
+        self.assertIsInstance(EngineerLengthIO.instance(), EngineerLengthIO)
+        self.assertIsNot(EngineerLengthIO.instance(), EngineerIO.instance())
+        self.assertIsInstance(EngineerIO.instance(), EngineerIO)
+
+    def test_concurrent_creation(self):
+        constructed = []
+        class SlowIO(EngineerIO):
+            def __init__(self, **kwargs):
+                constructed.append(self)
+                time.sleep(0.05)
+                super().__init__(**kwargs)
+        barrier = threading.Barrier(8)
+        results = []
+        def worker():
+            barrier.wait()
+            results.append(SlowIO.instance())
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(constructed), 1)
+        self.assertTrue(all(result is constructed[0] for result in results))
+        # Subclasses of SlowIO have their own instance
+        class SlowerIO(SlowIO):
+            pass
+        self.assertIsInstance(SlowerIO.instance(), SlowerIO)
+
+    def test_prewarm(self):
+        instances = prewarm(EngineerIO, EngineerTimespanIO)
+        self.assertEqual(instances, [EngineerIO.instance(), EngineerTimespanIO.instance()])
+        self.assertIn(EngineerLengthIO.instance(), prewarm())
+
+    def test_shared_instances_read_only(self):
+        for io in (EngineerIO.instance(), EngineerLengthIO.instance()):
+            with self.subTest(cls=type(io).__name__):
+                units, aliases = set(io.units), dict(io.unit_aliases)
+                with self.assertRaises(FrozenInstanceError):
+                    io.add_unit(UnitInfo("foo", 2.0))
+                with self.assertRaises(FrozenInstanceError):
+                    io.add_alias(UnitAlias("m", ["meterz"]))
+                with self.assertRaises(FrozenInstanceError):
+                    io.add_units([UnitInfo("foo", 2.0)])
+                with self.assertRaises(FrozenInstanceError):
+                    io.remove_unit(next(iter(units)))
+                with self.assertRaises(FrozenInstanceError):
+                    with io.batch_update():
+                        pass
+                with self.assertRaises(FrozenInstanceError):
+                    io.set_engine("scan")
+                # Nothing has been changed
+                self.assertEqual(io.engine, "regex")
+                self.assertIsNone(io.safe_normalize("3 kfoo"))
+                self.assertEqual((set(io.units), dict(io.unit_aliases)), (units, aliases))
+        # Private instances can be configured
+        io = EngineerIO(engine="scan")
+        io.add_unit(UnitInfo("foo", 2.0))
+        self.assertEqual(io.normalize_numeric("3 kfoo"), 6000.)
+        self.assertIsNone(EngineerIO.instance().safe_normalize("3 kfoo"))
+
+    def test_shared_cache_opt_in(self):
+        io = EngineerIO.instance()
+        self.addCleanup(io.disable_cache)
+        errors = []
+        def worker():
+            try:
+                for _ in range(200):
+                    if io.normalize("4.7k").value != 4700.:
+                        errors.append("wrong value")
+            except Exception as ex:
+                errors.append(ex)
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        # Toggle the cache while the other threads are parsing
+        for _ in range(50):
+            io.enable_cache(16)
+            io.cache_clear()
+            io.disable_cache()
+        io.enable_cache(16)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        io.normalize("4.7k")
+        self.assertEqual(io.cache_info().currsize, 1)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires os.fork()")
+    def test_fork(self):
+        cache = LRUCache(16)
+        # Locks held by this thread when forking
+        with Registry._lock, cache._lock:
+            pid = os.fork()
+            if pid == 0: # Child
+                ok = Registry._lock.acquire(blocking=False) and cache._lock.acquire(blocking=False)
+                ok = ok and EngineerIO.instance().normalize("1k").value == 1000.
+                os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.WEXITSTATUS(status), 0)
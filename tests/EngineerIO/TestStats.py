@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from parameterized import parameterized
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.EngineerIO.Stats import HISTOGRAM_BOUNDS, ParseStats
+import unittest
+
+class TestParseStats(unittest.TestCase):
+    def test_record(self):
+        stats = ParseStats()
+        stats.record(["unit", "alias", "unit"], 1.5e-6)
+        stats.record([], 1.)
+        stats.record(["unit"], 0.25e-6, ValueError())
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["calls"].count, 3)
+        self.assertEqual(snapshot["branches"]["unit"].count, 2)
+        self.assertEqual(snapshot["branches"]["alias"].count, 1)
+        self.assertEqual(snapshot["exceptions"]["ValueError"].count, 1)
+        self.assertAlmostEqual(snapshot["branches"]["unit"].total_time, 1.75e-6)
+        self.assertEqual(snapshot["calls"].histogram[0], 1)
+        self.assertEqual(snapshot["calls"].histogram[2], 1)
+        self.assertEqual(snapshot["calls"].histogram[len(HISTOGRAM_BOUNDS)], 1)
+        # Snapshots are independent copies
+        stats.reset()
+        self.assertEqual(snapshot["calls"].count, 3)
+        self.assertEqual(stats.snapshot()["calls"].count, 0)
+        self.assertEqual(stats.snapshot()["branches"], {})
+
+class TestEngineerIOStats(unittest.TestCase):
+    def test_disabled(self):
+        io = EngineerIO()
+        self.assertIsNone(io.stats())
+        io.reset_stats()
+        io.enable_stats()
+        io.normalize("1k")
+        io.disable_stats()
+        self.assertIsNone(io.stats())
+
+    @parameterized.expand([
+        ("1.5", set()),
+        ("2.5k", {"suffix_si_prefix"}),
+        ("3.3 V", {"unit"}),
+        ("4.7 mA", {"unit", "suffix_si_prefix"}),
+        ("1k25", {"mid_string_si_prefix", "prefix_as_decimal"}),
+        ("1,234.56 mV", {"interpunctation", "unit", "suffix_si_prefix"}),
+        ("5 parts per million", {"alias", "unit"}),
+        ("±5 V", {"leading_prefix", "unit"}),
+        ("10 °C", {"unit", "unit_prefix"}),
+    ])
+    def test_branches(self, value, expected):
+        for engine in ("regex", "scan"):
+            io = EngineerIO(engine=engine)
+            io.enable_stats()
+            io.normalize(value)
+            stats = io.stats()
+            self.assertEqual(stats["calls"].count, 1)
+            self.assertEqual(set(stats["branches"]), expected, engine)
+            self.assertEqual(stats["exceptions"], {})
+
+    def test_cm_rule(self):
+        for engine in ("regex", "scan"):
+            # The only remaining SI prefix "m" is not a suffix
+            io = EngineerLengthIO(engine=engine)
+            io.enable_stats()
+            self.assertIsNone(io.safe_normalize("1c1m1"))
+            self.assertEqual(set(io.stats()["branches"]), {"mid_string_si_prefix", "cm_rule", "prefix_as_decimal"})
+
+    def test_exceptions(self):
+        for engine in ("regex", "scan"):
+            io = EngineerIO(engine=engine)
+            io.enable_stats()
+            self.assertIsNone(io.safe_normalize("k12"))
+            self.assertIsNone(io.safe_normalize("1x5"))
+            with self.assertRaises(ValueError):
+                io.normalize_numeric("1k2.4")
+            stats = io.stats()
+            self.assertEqual(stats["calls"].count, 3)
+            self.assertEqual(stats["exceptions"]["FirstCharacterInStringIsUnitPrefixException"].count, 1)
+            self.assertEqual(stats["exceptions"]["RemainderOfStringContainsNonNumericCharacters"].count, 1)
+            self.assertEqual(stats["exceptions"]["ValueError"].count, 1)
+            io.reset_stats()
+            self.assertEqual(io.stats()["calls"].count, 0)
+
+    def test_cache_hit(self):
+        io = EngineerIO(cache_size=16)
+        io.enable_stats()
+        io.normalize("1k")
+        io.normalize("1k")
+        stats = io.stats()
+        self.assertEqual(stats["calls"].count, 2)
+        self.assertEqual(stats["branches"]["cache_hit"].count, 1)
+        self.assertEqual(stats["branches"]["suffix_si_prefix"].count, 1)
+        self.assertGreater(stats["calls"].mean_time, 0.)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import io
+import itertools
+from numpy.testing import assert_allclose, assert_array_equal
+from parameterized import parameterized
+from UliEngineering.EngineerIO import EngineerIO, ParseErrorCode, normalize_stream
+from UliEngineering.EngineerIO.Stream import column_extractor, iter_blocks
+from UliEngineering.Exceptions import EngineerIOException
+import numpy as np
+import unittest
+
+class TestIterBlocks(unittest.TestCase):
+    @parameterized.expand([
+        (range(5), 2, [[0, 1], [2, 3], [4]]),
+        (range(4), 2, [[0, 1], [2, 3]]),
+        ([], 3, []),
+    ])
+    def test_blocks(self, iterable, block_size, expected):
+        self.assertEqual(list(iter_blocks(iterable, block_size)), expected)
+
+    def test_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            list(iter_blocks(range(3), 0))
+
+    def test_column_extractor(self):
+        self.assertEqual(column_extractor(1)("a,1k,c"), "1k")
+        self.assertEqual(column_extractor(1, ";")(b"a;1k"), b"1k")
+        self.assertIsNone(column_extractor(2)("a,b"))
+
+class TestNormalizeStream(unittest.TestCase):
+    def setUp(self):
+        self.io = EngineerIO()
+
+    def test_blocks(self):
+        blocks = list(self.io.normalize_stream(["1k", "2.5 mV", 3, b"4 A", "1k"], chunk_size=2))
+        self.assertEqual([len(block) for block in blocks], [2, 2, 1])
+        assert_allclose(np.concatenate(blocks), [1e3, 2.5e-3, 3., 4., 1e3])
+        self.assertEqual(list(normalize_stream([])), [])
+
+    def test_endless(self):
+        # Only the consumed blocks are ever read from the stream
+        stream = normalize_stream(itertools.cycle(["1k", "2M"]), chunk_size=3)
+        assert_array_equal(next(stream), [1e3, 2e6, 1e3])
+        assert_array_equal(next(stream), [2e6, 1e3, 2e6])
+
+    def test_errors(self):
+        values, errors = next(self.io.normalize_stream(
+            ["1k", "foobar", None, ""], strict=False, return_errors=True))
+        assert_array_equal(values, [1e3, np.nan, np.nan, np.nan])
+        self.assertEqual(errors.tolist(), [ParseErrorCode.OK, ParseErrorCode.FIRST_CHARACTER_IS_UNIT_PREFIX,
+                                           ParseErrorCode.NONE, ParseErrorCode.EMPTY])
+        with self.assertRaises(EngineerIOException):
+            list(self.io.normalize_stream(["1k", "foobar"]))
+
+    def test_skip_empty(self):
+        blocks = list(self.io.normalize_stream(["1k", " ", "2k"], skip_empty=True))
+        assert_array_equal(np.concatenate(blocks), [1e3, 2e3])
+
+    def test_column_stream(self):
+        lines = io.StringIO("time,value\n0,1 kV\n\n1,2.5 mV\n2,1 kV\n")
+        blocks = self.io.normalize_column_stream(itertools.islice(lines, 1, None),
+                                                 column=1, chunk_size=2)
+        assert_allclose(np.concatenate(list(blocks)), [1e3, 2.5e-3, 1e3])
+        # Custom extractor on bytes lines
+        blocks = self.io.normalize_column_stream(
+            [b"a 1k", b"# comment", b"b 2M"], extractcol=lambda line: line.split()[1],
+            isline=lambda line: not line.startswith(b"#"))
+        assert_array_equal(np.concatenate(list(blocks)), [1e3, 2e6])
+
+    def test_column_stream_missing_column(self):
+        values, errors = next(self.io.normalize_column_stream(
+            ["1,2k", "3"], column=1, strict=False, return_errors=True))
+        assert_array_equal(values, [2e3, np.nan])
+        self.assertEqual(errors[1], ParseErrorCode.NONE)
+        with self.assertRaises(ValueError):
+            list(self.io.normalize_column_stream(["1,2k", "3"], column=1))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import random
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.Area import EngineerAreaIO
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.EngineerIO.Timespan import EngineerTimespanIO
+from UliEngineering.EngineerIO.Tokenizer import ScanTokenizer
+from UliEngineering.EngineerIO.Types import ParseErrorCode, SplitResult
+from UliEngineering.EngineerIO.UnitInfo import EngineerIOConfiguration, UnitInfo
+from parameterized import parameterized
+import unittest
+
+def _split_or_exception(io, s):
+    try:
+        return io.split_input(s)
+    except ValueError as ex:
+        return type(ex)
+
+def _fuzz_strings(io, count, seed=0):
+    """
+    Generate random strings that are likely to hit all the
+    different branches of the parser
+    """
+    rng = random.Random(seed)
+    fragments = ["1", "23", "4.5", "0", "1,234", "5.678,9", "-", "+", "e", "e-3",
+                 " ", "  ", "\t", "\n", ".", ",", "x", "²", "Ω"]
+    fragments += sorted(io.all_unit_prefixes) + list(io.unit_prefixes)
+    fragments += rng.sample(sorted(io.units), min(10, len(io.units)))
+    fragments += rng.sample(sorted(io.unit_aliases), min(10, len(io.unit_aliases)))
+    for _ in range(count):
+        yield "".join(rng.choice(fragments) for _ in range(rng.randint(1, 5)))
+
+class TestScanTokenizer(unittest.TestCase):
+    def test_scan_returns_error_codes(self):
+        tokenizer = ScanTokenizer(EngineerIO())
+        self.assertEqual(tokenizer.scan("1k25 Ω"), SplitResult('', '1.25', 'k', '', 'Ω'))
+        self.assertEqual(tokenizer.scan("±"), ParseErrorCode.EMPTY)
+        self.assertEqual(tokenizer.scan("k2"), ParseErrorCode.FIRST_CHARACTER_IS_UNIT_PREFIX)
+        self.assertEqual(tokenizer.scan("1k2k3"), ParseErrorCode.MULTIPLE_UNIT_PREFIXES)
+        self.assertEqual(tokenizer.scan("1k2.4"), ParseErrorCode.AMBIGUOUS_DECIMAL_SEPARATOR)
+        self.assertEqual(tokenizer.scan("1x5"), ParseErrorCode.NON_NUMERIC_REMAINDER)
+
+    def test_set_engine(self):
+        io = EngineerIO(engine="scan")
+        self.assertEqual(io.engine, "scan")
+        self.assertEqual(io.normalize_numeric("1,234.56kΩ"), 1234560.0)
+        io.set_engine("regex")
+        self.assertEqual(io.engine, "regex")
+        with self.assertRaises(ValueError):
+            io.set_engine("foo")
+
+    def test_subclass_engine(self):
+        io = EngineerLengthIO(engine="scan")
+        self.assertAlmostEqual(io.normalize_numeric("1 mil"), 25.4e-6)
+
+    @parameterized.expand([
+        (EngineerIO,),
+        (EngineerLengthIO,),
+        (EngineerAreaIO,),
+        (EngineerTimespanIO,),
+    ])
+    def test_identical_to_regex_engine(self, cls):
+        regex_io = cls()
+        scan_io = cls(engine="scan")
+        for s in _fuzz_strings(regex_io, 5000):
+            self.assertEqual(_split_or_exception(scan_io, s),
+                             _split_or_exception(regex_io, s), msg=repr(s))
+
+    def test_identical_with_multichar_prefixes(self):
+        config = EngineerIOConfiguration(
+            units=[UnitInfo("V"), UnitInfo("", aliases=["none"])],
+            unit_prefixes=["±", "+-", "+"],
+            si_prefix_map={"k": 3, "da": 1, "": 0})
+        regex_io = EngineerIO(config)
+        scan_io = EngineerIO(config, engine="scan")
+        for s in _fuzz_strings(regex_io, 5000, seed=1):
+            self.assertEqual(_split_or_exception(scan_io, s),
+                             _split_or_exception(regex_io, s), msg=repr(s))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import random
+import re
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.Trie import SuffixTrie
+from UliEngineering.EngineerIO.UnitInfo import EngineerIOConfiguration, UnitInfo
+import unittest
+
+class TestSuffixTrie(unittest.TestCase):
+    def test_match(self):
+        trie = SuffixTrie({"V": "V", "mV": "millivolt", "volt": "V"})
+        self.assertEqual(trie.match("5 volt"), (2, 6, "V"))
+        self.assertEqual(trie.match("3mV"), (1, 3, "millivolt"))
+        self.assertEqual(trie.match("3V"), (1, 2, "V"))
+        self.assertIsNone(trie.match("3A"))
+        self.assertIsNone(trie.match(""))
+
+    def test_match_trailing_newline(self):
+        # Same behaviour as regex "$"
+        trie = SuffixTrie(["V"])
+        self.assertEqual(trie.match("3V\n"), (1, 2, "V"))
+        self.assertIsNone(trie.match("3V\n\n"))
+
+    def test_keys_as_values(self):
+        trie = SuffixTrie(["k", "M"])
+        self.assertEqual(trie.match("1k"), (1, 2, "k"))
+        self.assertEqual(sorted(trie.keys()), ["M", "k"])
+
+    def test_add_remove(self):
+        trie = SuffixTrie()
+        self.assertFalse(trie)
+        trie.add("mV")
+        trie.add("V")
+        trie.add("V", "volt") # Replace
+        self.assertEqual(len(trie), 2)
+        self.assertIn("V", trie)
+        self.assertEqual(trie.get("V"), "volt")
+        trie.remove("mV")
+        self.assertNotIn("mV", trie)
+        self.assertEqual(len(trie), 1)
+        self.assertEqual(trie.match("3mV"), (2, 3, "volt"))
+        trie.remove("V")
+        self.assertEqual(trie.root, {})
+        with self.assertRaises(KeyError):
+            trie.remove("V")
+        with self.assertRaises(KeyError):
+            trie.remove("xyz")
+
+    def test_equivalent_to_regex(self):
+        rng = random.Random(0)
+        alphabet = "abcAB ²"
+        keys = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(50)}
+        trie = SuffixTrie(keys)
+        regex = re.compile("(" + "|".join(re.escape(key) for key in sorted(keys, key=len, reverse=True)) + ")$")
+        for _ in range(2000):
+            s = "".join(rng.choice(alphabet + "\n") for _ in range(rng.randint(0, 8)))
+            regex_match = regex.search(s)
+            expected = (regex_match.start(), regex_match.end(), regex_match.group(1)) if regex_match else None
+            self.assertEqual(trie.match(s), expected, msg=repr(s))
+
+class TestEngineerIOTries(unittest.TestCase):
+    def test_many_units(self):
+        units = [UnitInfo(f"unit{i}", factor=i) for i in range(1, 2001)]
+        io = EngineerIO(EngineerIOConfiguration(units, [], {"k": 3}))
+        self.assertEqual(io.normalize("2 kunit123").value, 2000 * 123)
+        self.assertEqual(io.normalize("2 unit2000").unit, "unit2000")
+
+    def test_regex_compiled_lazily(self):
+        io = EngineerIO()
+        io.normalize("1 kV")
+        self.assertIsNotNone(io.units_regex)
+        self.assertIsNotNone(io.units_regex.search("1 kV"))
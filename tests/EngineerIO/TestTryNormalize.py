@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from numpy.testing import assert_array_equal
+from UliEngineering.EngineerIO import EngineerIO, ParseErrorCode, try_normalize_array
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+import numpy as np
+import unittest
+
+from .TestTokenizer import _fuzz_strings
+
+class TestTryNormalizeArray(unittest.TestCase):
+    def setUp(self):
+        self.io = EngineerIO()
+
+    def test_error_codes(self):
+        values, errors, units = self.io.try_normalize_array(
+            ["1k", "k2", None, "1e", "3 V", "1k", b"\xff", 5, "1x5", "±", "1k2.4", "1k2k3", ["1"]],
+            return_units=True)
+        assert_array_equal(values[[0, 4, 5, 7]], [1000., 3., 1000., 5.])
+        assert_array_equal(errors, [
+            ParseErrorCode.OK,
+            ParseErrorCode.FIRST_CHARACTER_IS_UNIT_PREFIX,
+            ParseErrorCode.NONE,
+            ParseErrorCode.INVALID_NUMBER,
+            ParseErrorCode.OK,
+            ParseErrorCode.OK,
+            ParseErrorCode.INVALID_TYPE,
+            ParseErrorCode.OK,
+            ParseErrorCode.NON_NUMERIC_REMAINDER,
+            ParseErrorCode.EMPTY,
+            ParseErrorCode.AMBIGUOUS_DECIMAL_SEPARATOR,
+            ParseErrorCode.MULTIPLE_UNIT_PREFIXES,
+            ParseErrorCode.INVALID_TYPE,
+        ])
+        self.assertEqual(errors.dtype, np.uint8)
+        self.assertTrue(np.all(np.isnan(values[errors != ParseErrorCode.OK])))
+        self.assertEqual(units[4], "V")
+
+    def test_shape_and_dtypes(self):
+        values, errors = try_normalize_array(np.asarray([["1k", "x"], ["2 mA", "1k"]]))
+        self.assertEqual(values.shape, (2, 2))
+        self.assertEqual(values.dtype, np.float64)
+        assert_array_equal(errors, [[0, ParseErrorCode.NON_NUMERIC_REMAINDER], [0, 0]])
+        values, errors, units = self.io.try_normalize_array(np.arange(3.), return_units=True)
+        assert_array_equal(values, [0., 1., 2.])
+        assert_array_equal(errors, [0, 0, 0])
+        self.assertEqual(units.shape, (3,))
+
+    def test_subclass(self):
+        values, errors, units = EngineerLengthIO().try_normalize_array(["1 mil", "1 foo"], return_units=True)
+        self.assertAlmostEqual(values[0], 25.4e-6)
+        self.assertEqual(errors[1], ParseErrorCode.NON_NUMERIC_REMAINDER)
+        self.assertEqual(units[0], "mil")
+
+    def test_consistent_with_normalize(self):
+        strings = list(_fuzz_strings(self.io, 3000, seed=2)) + ["1e", "1.2.3", "--1", "1e+", ".", "+.5e-3"]
+        values, errors, units = self.io.try_normalize_array(strings, return_units=True)
+        for s, value, error, unit in zip(strings, values, errors, units):
+            try:
+                result = self.io.normalize(s)
+            except ValueError:
+                self.assertNotEqual(error, ParseErrorCode.OK, msg=repr(s))
+                continue
+            self.assertEqual(error, ParseErrorCode.OK, msg=repr(s))
+            self.assertEqual(value, result.value, msg=repr(s))
+            self.assertEqual(unit, result.unit, msg=repr(s))
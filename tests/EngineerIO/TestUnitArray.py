@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from numpy.testing import assert_allclose, assert_array_equal
+from UliEngineering.EngineerIO import EngineerIO, UnitArray, normalize_array
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.Exceptions import EngineerIOException
+from UliEngineering.Units import InvalidUnitInContextException, Unit
+import numpy as np
+import unittest
+
+class TestUnitArray(unittest.TestCase):
+    def test_uniform(self):
+        arr = normalize_array(["10 kΩ", "4.7 kΩ", "10 kΩ"])
+        self.assertIsInstance(arr, UnitArray)
+        self.assertFalse(arr.mixed)
+        self.assertEqual(arr.unit, "Ω")
+        self.assertIsNone(arr.unit_codes)
+        assert_array_equal(arr.values, [10e3, 4.7e3, 10e3])
+        assert_array_equal(arr.element_units(), ["Ω", "Ω", "Ω"])
+        assert_array_equal(np.asarray(arr) * 2, [20e3, 9.4e3, 20e3])
+
+    def test_mixed(self):
+        arr = normalize_array(np.asarray([["10 kΩ", "3 V"], ["1k", "2 V"]]))
+        self.assertTrue(arr.mixed)
+        self.assertIsNone(arr.unit)
+        self.assertEqual(arr.shape, (2, 2))
+        self.assertEqual(arr.unit_codes.dtype, np.uint8)
+        assert_array_equal(arr.element_units(), [["Ω", "V"], ["", "V"]])
+        assert_array_equal(arr.unit_mask("V"), [[False, True], [False, True]])
+        assert_array_equal(arr.unit_mask("A"), [[False, False], [False, False]])
+        # Slicing keeps the units
+        assert_array_equal(arr[:, 1].element_units(), ["V", "V"])
+        self.assertEqual(arr[0, 0], 10e3)
+
+    def test_numeric(self):
+        arr = normalize_array([1, 2.5])
+        self.assertEqual(arr.unit, "")
+        assert_array_equal(arr.values, [1., 2.5])
+        self.assertEqual(normalize_array(np.asarray(["1k", 2], dtype=object)).unit, "")
+
+    def test_invalid(self):
+        with self.assertRaises(EngineerIOException):
+            normalize_array(["1k", "foobar"])
+        arr = EngineerIO().normalize_array(["1 V", "foobar"], strict=False)
+        assert_array_equal(arr.values, [1., np.nan])
+        assert_array_equal(arr.element_units(), ["V", ""])
+
+    def test_verify_unit(self):
+        assert_array_equal(normalize_array(["1 V", "2", 3]).verify_unit(Unit("V")), [1., 2., 3.])
+        assert_array_equal(normalize_array(["1 V", "2 V"]).verify_unit("V"), [1., 2.])
+        with self.assertRaises(InvalidUnitInContextException):
+            normalize_array(["1 V", "2 A"]).verify_unit("V")
+        with self.assertRaises(InvalidUnitInContextException):
+            normalize_array(["1 A", "2 A"]).verify_unit("V")
+        # Only the selected elements matter
+        assert_array_equal(normalize_array(["1 V", "2 A"])[:1].verify_unit("V"), [1.])
+        with self.assertRaises(InvalidUnitInContextException):
+            EngineerIO().normalize_numeric_verify_unit(["1 V", "2 A"], Unit("V"))
+
+    def test_convert_to(self):
+        io = EngineerLengthIO()
+        arr = io.normalize_array(["1 inch", "25.4 mm", "1 mil"])
+        self.assertTrue(arr.mixed)
+        converted = arr.convert_to("mil", io.unit_factors)
+        self.assertEqual(converted.unit, "mil")
+        assert_allclose(converted.values, [1000., 1000., 1.])
+        with self.assertRaises(InvalidUnitInContextException):
+            arr.convert_to("V", io.unit_factors)
+
+    def test_from_units(self):
+        arr = UnitArray.from_units([1., 2.], ["V", "A"])
+        assert_array_equal(arr.element_units(), ["V", "A"])
+        self.assertEqual(UnitArray.from_units([1., 2.], ["V", "V"]).unit, "V")
+        with self.assertRaises(ValueError):
+            UnitArray([1., 2.], units=["V", "A"])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from parameterized import parameterized
+from UliEngineering.EngineerIO import EngineerIO
+from UliEngineering.EngineerIO.Length import EngineerLengthIO
+from UliEngineering.EngineerIO.UnitInfo import UnitAlias, UnitInfo
+from UliEngineering.Exceptions import EngineerIOException
+import unittest
+
+class TestUnitRegistration(unittest.TestCase):
+    @parameterized.expand([("regex",), ("scan",)])
+    def test_add_unit(self, engine):
+        io = EngineerIO(engine=engine)
+        with self.assertRaises(EngineerIOException):
+            io.normalize("5 bar")
+        io.add_unit(UnitInfo("bar", 1e5, ["bars"]))
+        self.assertEqual(io.normalize("5 bar").value, 5e5)
+        self.assertEqual(io.normalize("5 bar").unit, "bar")
+        self.assertAlmostEqual(io.normalize("2 mbar").value, 200.)
+        self.assertEqual(io.normalize("3 kbars").value, 3e8)
+        # Other instances with the same configuration are not affected
+        self.assertIsNone(EngineerIO(engine=engine).safe_normalize("5 bar"))
+        self.assertIsNone(EngineerIO.instance().safe_normalize("5 bar"))
+        self.assertEqual(EngineerIO().normalize("5 V").value, 5.)
+
+    @parameterized.expand([("regex",), ("scan",)])
+    def test_add_alias(self, engine):
+        io = EngineerIO(engine=engine)
+        io.add_alias(UnitAlias("V", ["voltios", "Voltio"]))
+        result = io.normalize("3.3 kvoltios")
+        self.assertEqual((result.value, result.unit), (3300., "V"))
+        self.assertEqual(io.normalize("1 Voltio").unit, "V")
+        self.assertIsNone(EngineerIO().safe_normalize("1 voltios"))
+        with self.assertRaises(TypeError):
+            io.add_alias(UnitInfo("foo"))
+        with self.assertRaises(TypeError):
+            io.add_unit(UnitAlias("V", ["volts"]))
+
+    @parameterized.expand([("regex",), ("scan",)])
+    def test_remove_unit(self, engine):
+        io = EngineerIO(engine=engine)
+        self.assertEqual(io.normalize("1 ohm").unit, "Ω")
+        io.remove_unit("Ω")
+        self.assertNotIn("Ω", io.units)
+        self.assertNotIn("Ω", io.unit_aliases.values())
+        for value in ("1 Ω", "1 ohm", "1 kΩ"):
+            self.assertIsNone(io.safe_normalize(value))
+        self.assertFalse(any(unit.canonical == "Ω" for unit in io.config.units))
+        with self.assertRaises(KeyError):
+            io.remove_unit("Ω")
+        self.assertEqual(EngineerIO().normalize("1 kΩ").value, 1e3)
+
+    def test_config(self):
+        io = EngineerIO()
+        original = io.config
+        io.add_units([UnitInfo("bar", 1e5), UnitAlias("bar", ["bars"])])
+        self.assertIsNot(io.config, original)
+        self.assertTrue(io.config.frozen)
+        self.assertNotEqual(io.config, original)
+        self.assertEqual(len(io.config.units), len(original.units) + 2)
+        # An equivalent instance can be created from the configuration
+        other = EngineerIO(config=io.config)
+        self.assertEqual(other.normalize("2 kbars").value, 2e8)
+        cls, kwargs = io._construction_args()
+        self.assertEqual(cls(**kwargs).normalize("2 bar").value, 2e5)
+
+    def test_batch_update(self):
+        io = EngineerIO()
+        original = io.config
+        with io.batch_update():
+            for idx in range(100):
+                io.add_unit(UnitInfo(f"u{idx}x", 2., [f"unit{idx}"]))
+                # Tables are updated immediately, the configuration at the end
+                self.assertEqual(io.normalize(f"1 u{idx}x").value, 2.)
+            with io.batch_update():
+                io.remove_unit("u0x")
+            self.assertIs(io.config, original)
+        self.assertEqual(len(io.config.units), len(original.units) + 99)
+        self.assertIsNone(io.safe_normalize("1 unit0"))
+        self.assertEqual(io.normalize("3 unit99").value, 6.)
+
+    def test_cache_cleared(self):
+        io = EngineerIO(cache_size=16)
+        self.assertEqual(io.normalize("5 kV").unit, "V")
+        io.add_unit(UnitInfo("kV", 1e3))
+        self.assertEqual(io.normalize("5 kV").unit, "kV")
+
+    def test_subclass(self):
+        io = EngineerLengthIO()
+        self.assertAlmostEqual(io.convert_length_to_meters(1, "mil"), 25.4e-6)
+        io.add_unit(UnitInfo("furlong", 201.168, ["furlongs"]))
+        self.assertAlmostEqual(io.convert_length_to_meters(2, "furlongs"), 402.336)
+        self.assertAlmostEqual(io.normalize_length("1 furlong"), 201.168)
+        cls, kwargs = io._construction_args()
+        self.assertIs(cls, EngineerLengthIO)
+        self.assertAlmostEqual(cls(**kwargs).normalize_length("1 furlong"), 201.168)
+        self.assertIsNone(EngineerLengthIO().safe_normalize("1 furlong"))
@@ -13,6 +13,17 @@ class TestVolume(unittest.TestCase):
     def setUp(self):
         self.volume_io = EngineerVolumeIO()
 
+    def test_convert_volume_vectorized(self):
+        np.testing.assert_allclose(convert_volume_to_cubic_meters(np.asarray([1., 2.]), "cm³"), [1e-6, 2e-6])
+        np.testing.assert_allclose(convert_volume_to_cubic_meters([1., 2.], ["mL", "m³"]), [1e-6, 2.])
+        assert_approx_equal(convert_volume_to_cubic_meters(3, "L"), 3e-3)
+
+    def test_convert_volume_strings_in_list(self):
+        # The prefix of an engineer string is cubed, like for scalars
+        np.testing.assert_allclose(convert_volume_to_cubic_meters(["1m", 2., None], "m³"),
+                                   [convert_volume_to_cubic_meters("1m", "m³"), 2., np.nan])
+        assert_approx_equal(convert_volume_to_cubic_meters("1m", "m³"), 1e-9)
+
     def test_volume_normalization_basic(self):
         # Basic numeric values
         assert_approx_equal(normalize_volume(1.0), 1.0)
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from numpy.testing import assert_approx_equal
+from numpy.testing import assert_allclose, assert_approx_equal
 from UliEngineering.Physics.Temperature import *
 from UliEngineering.Exceptions import *
 from UliEngineering.EngineerIO import auto_format
+import numpy as np
 import unittest
 
 class TestTemperature(unittest.TestCase):
@@ -23,6 +24,20 @@ class TestTemperature(unittest.TestCase):
         assert_approx_equal(normalize_temperature("-1°C"), 272.15)
         assert_approx_equal(normalize_temperature("-200°C"), 73.15)
 
+    def testNormalizeTemperatureArray(self):
+        values = ["25 °C", "300 K", "77 °F", "0", 5, "1 C", "-40 F"]
+        expected = [normalize_temperature(v) for v in values]
+        assert_allclose(normalize_temperature(values), expected)
+        assert_allclose(normalize_temperature(np.asarray(values, dtype=object)), expected)
+        assert_allclose(normalize_temperature(np.asarray(["1 K", "2 K"])), [1., 2.])
+        assert_allclose(normalize_temperature([1, 2], default_unit="K"), [1., 2.])
+        # Numbers in mixed lists are not converted to strings
+        assert_allclose(normalize_temperature([np.nan, "25 °C", 300.5], default_unit="K"),
+                        [np.nan, 298.15, 300.5])
+        assert_allclose(normalize_temperature_celsius(["25 °C", "0 K", "-40 °F"]), [25., -273.15, -40.])
+        with self.assertRaises(InvalidUnitException):
+            normalize_temperature(["1 °C", "150V"])
+
     def testNormalizeTemperatureCelsius(self):
         assert_approx_equal(normalize_temperature_celsius("-200°C"), -200.0)
         assert_approx_equal(normalize_temperature_celsius("273.15 K"), 0.0)
@@ -30,6 +30,17 @@ class TestChunkGeneration(unittest.TestCase):
         vals = overlapping_chunks(self.data2, 25, 3)
         assert_array_equal(vals.as_array(), [])
 
+    def test_strided_view(self):
+        vals = overlapping_chunks(self.data2, 4, 3)
+        view = vals.strided_view()
+        assert_array_equal(view, vals.as_array())
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(np.shares_memory(view, self.data2))
+        assert_array_equal(vals.strided_view(1, 3), [[4, 5, 6, 7], [7, 8, 9, 10]])
+        self.assertEqual(vals.strided_view(2, 2).shape, (0, 4))
+        with self.assertRaises(ValueError):
+            overlapping_chunks(self.data2.reshape(6, 2), 3, 3).strided_view()
+
     def test_apply(self):
         "General apply() usage"
         cg = overlapping_chunks(self.data1, 3, 3)
@@ -5,6 +5,8 @@ from UliEngineering.SignalProcessing.FFT import *
 from UliEngineering.SignalProcessing.Simulation import *
 from UliEngineering.SignalProcessing.Chunks import *
 from parameterized import parameterized
+from unittest import mock
+from UliEngineering.SignalProcessing.FFT import _load_fft_backend, _window_functor
 import concurrent.futures
 import numpy as np
 import numpy.random
@@ -155,6 +157,46 @@ class TestFFT(unittest.TestCase):
         self.assertTrue(np.all(band.mid_indices >= band.start_indices))
         self.assertTrue(np.all(band.mid_indices <= band.end_indices))
 
+    @parameterized.expand([("per_chunk",), ("batched",)])
+    def testMultiBandSpectralPower(self, mode):
+        sine = sine_wave(10.0, 100.0, 2.0, 10.0) + np.random.random_sample(1000)
+        chunkgen = overlapping_chunks(sine, 100, 25)
+        bands = [(0.0, 5.0), (9.0, 11.0), (20.0, None), (None, None), (30.0, 30.0)]
+        for fn in (serial_spectral_power_fft_reduce, parallel_spectral_power_fft_reduce):
+            res = fn(chunkgen, 100.0, 100, bands=bands, mode=mode, block_size=7)
+            self.assertEqual(res.powers.shape, (len(chunkgen), len(bands)))
+            self.assertEqual(res.bands, bands)
+            for i, (start, end) in enumerate(bands):
+                single = fn(chunkgen, 100.0, 100, start=start, end=end, mode=mode)
+                assert_allclose(res.powers[:, i], single.powers, atol=1e-12)
+            assert_allclose(res.mean(), res.powers.mean(axis=0))
+            assert_allclose(res.start_indices, np.arange(len(chunkgen)) * 25)
+            assert_allclose(res.end_indices, np.arange(len(chunkgen)) * 25 + 100)
+        # Dominant band
+        self.assertEqual(np.argmax(res.mean()[:3]), 1)
+        # 9 Hz and 10 Hz bins of the first chunk
+        power = serial_fft_reduce([chunkgen[0]], 100.0, 100, reducer=spectral_power_reducer, normalize=False)
+        assert_allclose(res.powers[0, 1], np.sum(power.amplitudes[9:11]) * 4 / 100 ** 2)
+        assert_allclose(res.powers[:, 4], 0.)
+
+    @parameterized.expand([("per_chunk",), ("batched",)])
+    def testSpectralPowerLargeDC(self, mode):
+        # Tiny noise next to a huge DC bin
+        data = 1e4 + 1e-4 * np.random.standard_normal(4 * 4096)
+        chunkgen = overlapping_chunks(data, 4096, 4096)
+        bands = [(2000.0, 3000.0), (0.0, 3000.0), (2500.0, None)]
+        single = serial_spectral_power_fft_reduce(chunkgen, 8192.0, 4096, start=2000.0, end=3000.0, mode=mode)
+        multi = serial_spectral_power_fft_reduce(chunkgen, 8192.0, 4096, bands=bands, mode=mode)
+        frequencies = fft_frequencies(4096, 8192.0)
+        for i, chunk in enumerate(chunkgen):
+            squares = np.abs(np.fft.rfft(chunk * np.blackman(4096))[:2048]) ** 2 * 4 / 4096 ** 2
+            for j, (start, end) in enumerate(bands):
+                selected = (frequencies >= start) & ((frequencies < end) if end is not None else True)
+                expected = np.sum(squares[selected])
+                self.assertGreater(expected, 0.)
+                assert_allclose(multi.powers[i, j], expected, rtol=1e-9)
+            assert_allclose(single.powers[i], multi.powers[i, 0], rtol=1e-12)
+
     def test_too_small_fft(self):
         with self.assertRaises(ValueError):
             d = np.random.random_sample(10)
@@ -162,6 +204,147 @@ class TestFFT(unittest.TestCase):
             x, y = simple_parallel_fft_reduce(d, 1000.0, 100)
 
 
+class TestBatchedFFTReduce(unittest.TestCase):
+    def setUp(self):
+        self.data = np.random.random_sample(5000)
+
+    @parameterized.expand([
+        ("Single block", False, None),
+        ("Uneven blocks", False, 7),
+        ("Single chunk blocks", False, 1),
+        ("Without DC", True, 7),
+    ])
+    def testEqualToPerChunk(self, name, removeDC, block_size):
+        chunkgen = overlapping_chunks(self.data, 128, 40)
+        expected = serial_fft_reduce(chunkgen, 100.0, 128, removeDC=removeDC)
+        for fn in (serial_fft_reduce, parallel_fft_reduce):
+            fft = fn(chunkgen, 100.0, 128, removeDC=removeDC, mode="batched", block_size=block_size)
+            assert_allclose(fft.frequencies, expected.frequencies)
+            assert_allclose(fft.amplitudes, expected.amplitudes)
+
+    def testReducers(self):
+        chunkgen = overlapping_chunks(self.data, 128, 40)
+        for reducer in (spectral_power_reducer, lambda fx, gen: max(y[3] for _, y in gen)):
+            expected = serial_fft_reduce(chunkgen, 100.0, 128, reducer=reducer, normalize=False)
+            fft = serial_fft_reduce(chunkgen, 100.0, 128, reducer=reducer, normalize=False,
+                                    mode="batched", block_size=10)
+            assert_allclose(fft.amplitudes, expected.amplitudes)
+
+    def testGenericChunkGenerators(self):
+        # FFT size smaller than chunk size, chunk postprocessor and non-overlapping chunks
+        for chunkgen in (overlapping_chunks(self.data, 150, 40),
+                         overlapping_chunks(self.data, 128, 40).apply(np.sqrt),
+                         array_to_chunkgen(reshaped_chunks(self.data, 128))):
+            expected = serial_fft_reduce(chunkgen, 100.0, 128)
+            fft = serial_fft_reduce(chunkgen, 100.0, 128, mode="batched", block_size=8)
+            assert_allclose(fft.amplitudes, expected.amplitudes)
+
+    def testSpectralPower(self):
+        sine = sine_wave(10.0, 100.0, 2.0, 50.0) + self.data
+        chunkgen = overlapping_chunks(sine, 100, 25)
+        for fn in (serial_spectral_power_fft_reduce, parallel_spectral_power_fft_reduce):
+            expected = fn(chunkgen, 100.0, 100, start=9.0, end=11.0)
+            res = fn(chunkgen, 100.0, 100, start=9.0, end=11.0, mode="batched", block_size=16)
+            assert_allclose(res.powers, expected.powers)
+            assert_allclose(res.start_indices, expected.start_indices)
+            assert_allclose(res.end_indices, expected.end_indices)
+
+    def testSimple(self):
+        expected = simple_serial_fft_reduce(self.data, 100.0, 128)
+        assert_allclose(simple_parallel_fft_reduce(self.data, 100.0, 128, mode="batched").amplitudes,
+                        expected.amplitudes)
+
+    def testInvalid(self):
+        chunkgen = overlapping_chunks(self.data, 100, 25)
+        with self.assertRaises(ValueError):
+            serial_fft_reduce(chunkgen, 100.0, 128, mode="batched")
+        with self.assertRaises(ValueError):
+            serial_fft_reduce(chunkgen, 100.0, 100, mode="batched", block_size=0)
+        with self.assertRaises(ValueError):
+            serial_fft_reduce(chunkgen, 100.0, 100, mode="blocks")
+
+
+class TestFFTBackend(unittest.TestCase):
+    def setUp(self):
+        # Remove the backends registered by the tests afterwards
+        registry = mock.patch.dict("UliEngineering.SignalProcessing.FFT._fft_backend_factories")
+        registry.start()
+        self.addCleanup(_load_fft_backend.cache_clear)
+        self.addCleanup(registry.stop)
+
+    def tearDown(self):
+        set_fft_backend()
+
+    @parameterized.expand([(100,), (101,)])
+    def testRealFFT(self, n):
+        y = np.random.random_sample(n)
+        fft = compute_fft(y, 100.0)
+        expected = np.fft.fft(y * np.blackman(n))[:n // 2]
+        assert_allclose(fft.amplitudes, np.abs(expected) * 2 / n)
+        assert_allclose(fft.angles, np.rad2deg(np.angle(expected)), atol=1e-8)
+
+    def testComplexInput(self):
+        y = np.random.random_sample(64) + 1j * np.random.random_sample(64)
+        expected = np.fft.fft(y * np.blackman(64))[:32]
+        assert_allclose(compute_fft(y, 100.0).amplitudes, np.abs(expected) * 2 / 64)
+
+    @parameterized.expand([("scipy",), ("numpy",)])
+    def testBuiltinBackends(self, name):
+        d = np.random.random_sample(1000)
+        expected = simple_serial_fft_reduce(d, 100.0, 100)
+        assert_allclose(simple_serial_fft_reduce(d, 100.0, 100, backend=name).amplitudes, expected.amplitudes)
+        assert_allclose(simple_serial_fft_reduce(d, 100.0, 100, backend=get_fft_backend(name, workers=2),
+                                                 mode="batched").amplitudes, expected.amplitudes)
+        assert_allclose(compute_fft(d, 100.0, backend=name).amplitudes, compute_fft(d, 100.0).amplitudes)
+
+    def testUserBackend(self):
+        calls = []
+        def rfft(x, axis=-1):
+            calls.append(np.shape(x))
+            return np.fft.rfft(x, axis=axis)
+        register_fft_backend("counting", FFTBackend(rfft, np.fft.fft))
+        d = np.random.random_sample(1000)
+        simple_serial_fft_reduce(d, 100.0, 100, backend="counting", mode="batched")
+        self.assertEqual(calls, [(37, 100)])
+        # Global selection
+        set_fft_backend("counting")
+        compute_fft(d, 100.0)
+        self.assertEqual(calls[-1], (1000,))
+        set_fft_backend()
+        compute_fft(d, 100.0)
+        self.assertEqual(len(calls), 2)
+
+    def testUserBackendFactory(self):
+        workers = []
+        def factory(nworkers):
+            workers.append(nworkers)
+            return FFTBackend(np.fft.rfft, np.fft.fft)
+        register_fft_backend("factory", factory)
+        self.assertIsInstance(get_fft_backend("factory", workers=3), FFTBackend)
+        # Backends are created once per number of workers
+        get_fft_backend("factory", workers=3)
+        set_fft_backend("factory", workers=2)
+        compute_fft(np.ones(10), 1.0)
+        self.assertEqual(workers, [3, 2])
+
+    def testUnknownBackend(self):
+        with self.assertRaises(ValueError):
+            set_fft_backend("nonexistent")
+        with self.assertRaises(ValueError):
+            compute_fft(np.ones(10), 1.0, backend="nonexistent")
+
+    def testWindowReuse(self):
+        d = np.random.random_sample(1000)
+        simple_serial_fft_reduce(d, 100.0, 100, window="hamming")
+        simple_serial_fft_reduce(d, 100.0, 100, window="kaiser", window_param=3.0)
+        window = _window_functor(100, "hamming")
+        self.assertIs(window, _window_functor(100, "hamming"))
+        self.assertFalse(window.window.flags.writeable)
+        self.assertIsNot(_window_functor(100, "kaiser", 3.0), _window_functor(100, "kaiser", 4.0))
+        # Unhashable window parameters are not cached
+        self.assertEqual(len(_window_functor(100, lambda size, param: np.ones(size), [1])), 100)
+
+
 class TestClosestFrequency(unittest.TestCase):
     def setUp(self):
         pass
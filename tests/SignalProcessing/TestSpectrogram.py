@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from numpy.testing import assert_allclose, assert_array_equal
+from UliEngineering.SignalProcessing.Chunks import overlapping_chunks
+from UliEngineering.SignalProcessing.FFT import compute_fft
+from UliEngineering.SignalProcessing.Simulation import sine_wave
+from UliEngineering.SignalProcessing.Spectrogram import *
+from UliEngineering.Utils.Temporary import AutoDeleteTempfileGenerator
+from parameterized import parameterized
+import numpy as np
+import os
+import tracemalloc
+import unittest
+
+class TestSpectrogram(unittest.TestCase):
+    def setUp(self):
+        self.data = sine_wave(10.0, 100.0, 2.0, 50.0) + np.random.random_sample(5000)
+        self.tmp = AutoDeleteTempfileGenerator()
+
+    def tearDown(self):
+        self.tmp.delete_all()
+
+    @parameterized.expand([(None,), (1,), (7,)])
+    def testEqualToComputeFFT(self, block_size):
+        spec = spectrogram(self.data, 100.0, 128, 40, block_size=block_size)
+        chunkgen = overlapping_chunks(self.data, 128, 40)
+        self.assertEqual(spec.amplitudes.shape, (len(chunkgen), 64))
+        self.assertEqual(len(spec), len(chunkgen))
+        for i in (0, 13, len(chunkgen) - 1):
+            fft = compute_fft(chunkgen[i], 100.0)
+            assert_allclose(spec.amplitudes[i], fft.amplitudes)
+            assert_allclose(spec.frequencies, fft.frequencies)
+        assert_array_equal(spec.start_indices(), np.arange(len(chunkgen)) * 40.)
+        assert_array_equal(spec.end_indices(), np.arange(len(chunkgen)) * 40. + 128)
+        assert_allclose(spec.times(), (spec.start_indices() + 64) / 100.0)
+        # Partial time axis
+        assert_allclose(spec.times(13, 20), spec.times()[13:20])
+        assert_array_equal(spec.start_indices(-3), spec.start_indices()[-3:])
+        self.assertEqual(spec.times(20, 13).size, 0)
+        # Dominant frequency of the sine wave
+        self.assertAlmostEqual(spec.frequencies[np.argmax(spec.amplitudes.mean(axis=0))], 10.0, delta=1.0)
+
+    def testDBAndFloat32(self):
+        reference = spectrogram(self.data, 100.0, 128)
+        spec = spectrogram(self.data, 100.0, 128, dtype=np.float32, db=True)
+        self.assertEqual(spec.amplitudes.dtype, np.float32)
+        self.assertTrue(spec.db)
+        assert_allclose(spec.amplitudes, 20 * np.log10(reference.amplitudes), rtol=1e-5)
+        # No -inf for zero magnitudes
+        self.assertTrue(np.all(np.isfinite(spectrogram(np.zeros(512), 1.0, 128, db=True).amplitudes)))
+
+    def testMemmapResume(self):
+        reference = spectrogram(self.data, 100.0, 128, block_size=10)
+        shape = spectrogram_shape(self.data.size, 128)
+        self.assertEqual(shape, reference.amplitudes.shape)
+        handle, infile = self.tmp.mkstemp()
+        os.close(handle)
+        handle, outfile = self.tmp.mkstemp()
+        os.close(handle)
+        self.data.tofile(infile)
+        data = np.memmap(infile, dtype=np.float64, mode="r")
+        out = np.memmap(outfile, dtype=np.float64, mode="w+", shape=shape)
+        # Interrupt after the second block
+        calls = []
+        def progress(done, total):
+            calls.append((done, total))
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            spectrogram(data, 100.0, 128, out=out, block_size=10, progress=progress)
+        self.assertEqual(calls, [(10, shape[0]), (20, shape[0])])
+        del out
+        # Resume from a re-opened output file
+        out = np.memmap(outfile, dtype=np.float64, mode="r+", shape=shape)
+        spec = spectrogram(data, 100.0, 128, out=out, block_size=10, start_chunk=calls[-1][0],
+                           progress=lambda done, total: calls.append((done, total)))
+        self.assertIs(spec.amplitudes, out)
+        self.assertEqual(calls[-1], (shape[0], shape[0]))
+        assert_allclose(np.asarray(out), reference.amplitudes)
+
+    def testStartChunk(self):
+        out = np.full(spectrogram_shape(self.data.size, 128), -1.0)
+        spectrogram(self.data, 100.0, 128, out=out, start_chunk=5)
+        assert_array_equal(out[:5], -1.0)
+        self.assertTrue(np.all(out[5:] >= 0))
+
+    def testNoPerChunkArrays(self):
+        # 12.5M chunks of a (virtual) 100M sample recording
+        data = np.broadcast_to(np.float64(1.0), (100_000_000,))
+        shape = spectrogram_shape(data.size, 8, 8)
+        handle, outfile = self.tmp.mkstemp()
+        os.close(handle)
+        out = np.memmap(outfile, dtype=np.float32, mode="w+", shape=shape)
+        tracemalloc.start()
+        try:
+            spec = spectrogram(data, 1.0, 8, 8, out=out, start_chunk=shape[0] - 3)
+            assert_array_equal(spec.start_indices(-1), [(shape[0] - 1) * 8])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del spec, out
+        # An offset table alone would take 100 MB
+        self.assertLess(peak, 10e6)
+
+    def testInvalid(self):
+        with self.assertRaises(ValueError):
+            spectrogram(self.data, 100.0, 128, out=np.zeros((3, 64)))
+        with self.assertRaises(ValueError):
+            spectrogram(self.data.reshape(50, 100), 100.0, 128)
+        with self.assertRaises(ValueError):
+            spectrogram(self.data, 100.0, 128, start_chunk=1000)
+        with self.assertRaises(ValueError):
+            spectrogram(self.data, 100.0, 128, block_size=0)
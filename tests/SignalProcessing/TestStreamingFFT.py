@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from numpy.testing import assert_allclose, assert_array_equal
+from UliEngineering.SignalProcessing.Chunks import overlapping_chunks
+from UliEngineering.SignalProcessing.FFT import FFT, serial_fft_reduce, spectral_power_reducer
+from UliEngineering.SignalProcessing.StreamingFFT import *
+from parameterized import parameterized
+import numpy as np
+import unittest
+
+def feed_randomly(averager, data, seed=0):
+    rng = np.random.default_rng(seed)
+    pos = 0
+    while pos < data.size:
+        size = int(rng.integers(0, 300))
+        averager.feed(data[pos:pos + size])
+        pos += size
+
+class TestStreamingFFTAverager(unittest.TestCase):
+    def setUp(self):
+        self.data = np.random.random_sample(5000)
+
+    @parameterized.expand([
+        ("Overlapping", 100, 25, False),
+        ("Non-overlapping", 100, 100, False),
+        ("Gaps", 100, 130, False),
+        ("Without DC", 128, 40, True),
+    ])
+    def testRunningAverage(self, name, fftsize, shiftsize, removeDC):
+        averager = StreamingFFTAverager(100.0, fftsize, shiftsize, removeDC=removeDC, block_size=3)
+        feed_randomly(averager, self.data)
+        chunkgen = overlapping_chunks(self.data, fftsize, shiftsize)
+        expected = serial_fft_reduce(chunkgen, 100.0, fftsize, removeDC=removeDC)
+        self.assertEqual(averager.count, len(chunkgen))
+        fft = averager.fft
+        self.assertIsInstance(fft, FFT)
+        assert_allclose(fft.frequencies, expected.frequencies)
+        assert_allclose(fft.amplitudes, expected.amplitudes)
+        # Only the samples of the next chunk are kept
+        self.assertLess(averager._tail.size, fftsize)
+
+    @parameterized.expand([
+        ("Empty block", [300, 300]),
+        ("Small blocks", list(range(100, 2000, 100))),
+    ])
+    def testGapOverSeveralBlocks(self, name, splits):
+        # The 444 sample gaps between the chunks span several feed() calls
+        data = self.data[:2000]
+        averager = StreamingFFTAverager(100.0, 256, 700)
+        for block in np.split(data, splits):
+            averager.feed(block)
+        chunkgen = overlapping_chunks(data, 256, 700)
+        expected = serial_fft_reduce(chunkgen, 100.0, 256)
+        self.assertEqual(averager.count, len(chunkgen))
+        assert_allclose(averager.amplitudes, expected.amplitudes)
+
+    def testPower(self):
+        averager = StreamingFFTAverager(100.0, 100, power=True)
+        self.assertEqual(averager.feed(self.data), len(overlapping_chunks(self.data, 100, 25)))
+        expected = serial_fft_reduce(overlapping_chunks(self.data, 100, 25), 100.0, 100,
+                                     reducer=spectral_power_reducer, normalize=False)
+        assert_allclose(averager.amplitudes * averager.count * 100 ** 2 / 4, expected.amplitudes)
+
+    def testExponentialAverage(self):
+        averager = StreamingFFTAverager(100.0, 100, alpha=0.1, block_size=4)
+        feed_randomly(averager, self.data, seed=1)
+        # Reference: Apply the recursion FFT by FFT
+        chunkgen = overlapping_chunks(self.data, 100, 25)
+        expected = None
+        for chunk in chunkgen:
+            fft = serial_fft_reduce([chunk], 100.0, 100).amplitudes
+            expected = fft if expected is None else 0.9 * expected + 0.1 * fft
+        assert_allclose(averager.amplitudes, expected)
+
+    def testEmptyAndReset(self):
+        averager = StreamingFFTAverager(100.0, 100)
+        assert_array_equal(averager.fft.amplitudes, np.zeros(50))
+        self.assertEqual(averager.feed([]), 0)
+        self.assertEqual(averager.feed(self.data[:99]), 0)
+        self.assertEqual(averager.feed(self.data[99:100]), 1)
+        averager.reset()
+        self.assertEqual(averager.count, 0)
+        self.assertEqual(averager.feed(self.data[:99]), 0)
+
+    def testInvalid(self):
+        with self.assertRaises(ValueError):
+            StreamingFFTAverager(100.0, 100, alpha=0)
+        with self.assertRaises(ValueError):
+            StreamingFFTAverager(100.0, 100, shiftsize=0)
+        with self.assertRaises(ValueError):
+            StreamingFFTAverager(100.0, 100).feed(np.zeros((10, 10)))